@@ -0,0 +1,94 @@
+# api/export.py
+"""
+NDJSON export: a queryset is walked in keyset chunks (WHERE pk > last ORDER BY pk LIMIT n), each chunk gets
+its prefetches and URLs in a fixed number of queries and is serialized and sent as one block of lines,
+so the full catalog streams with memory bounded by the chunk size and no long-running server-side cursor.
+Under ASGI, Django would buffer a synchronous body completely; ndjson_response streams an async iterator there
+instead, with each chunk fetched through sync_to_async.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import translation
+
+from core.urlbuilder import attach_urls
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson; charset=utf-8"
+
+
+def export_chunk_size() -> int:
+    return max(getattr(settings, "API_EXPORT_CHUNK_SIZE", 500), 1)
+
+
+def _chunk(queryset, serializer_class, language: str, kind: str | None, size: int, last) -> tuple[str, object]:
+    """
+    The lines of the rows after pk `last` and the pk to continue after (None when this was the last chunk).
+    """
+    # the body is produced after the view returned, outside the request's language activation
+    with translation.override(language):
+        page = queryset if last is None else queryset.filter(pk__gt=last)
+        chunk = list(page.order_by("pk")[:size])
+        if not chunk:
+            return "", None
+        attach_urls(chunk, [language])
+        rows = serializer_class(chunk, many=True, context={"language": language}).data
+    lines = "".join(
+        json.dumps({"type": kind, **row} if kind else row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+        for row in rows
+    )
+    return lines, chunk[-1].pk if len(chunk) == size else None
+
+
+def ndjson_lines(queryset, serializer_class, language: str, *, kind: str | None = None,
+                 size: int | None = None) -> Iterator[str]:
+    """
+    Serialized rows of queryset in `language`, one JSON document per line and one yield per chunk;
+    `kind` adds a "type" key (used by the catalog export that mixes resources).
+    """
+    size = size or export_chunk_size()
+    last = None
+    while True:
+        lines, last = _chunk(queryset, serializer_class, language, kind, size, last)
+        if lines:
+            yield lines
+        if last is None:
+            return
+
+
+async def andjson_lines(queryset, serializer_class, language: str, *, kind: str | None = None,
+                        size: int | None = None) -> AsyncIterator[str]:
+    """
+    ndjson_lines as an async iterator; each chunk is queried and serialized in one sync_to_async call.
+    """
+    size = size or export_chunk_size()
+    last = None
+    while True:
+        lines, last = await sync_to_async(_chunk)(queryset, serializer_class, language, kind, size, last)
+        if lines:
+            yield lines
+        if last is None:
+            return
+
+
+def ndjson_response(request, language: str, sources) -> StreamingHttpResponse:
+    """
+    NDJSON of every (queryset, serializer_class, kind) in sources, in order; an async body under ASGI.
+    """
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        async def body():
+            for queryset, serializer_class, kind in sources:
+                async for lines in andjson_lines(queryset, serializer_class, language, kind=kind):
+                    yield lines
+    else:
+        def body():
+            for queryset, serializer_class, kind in sources:
+                yield from ndjson_lines(queryset, serializer_class, language, kind=kind)
+
+    return StreamingHttpResponse(body(), content_type=NDJSON_CONTENT_TYPE)
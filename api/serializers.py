@@ -0,0 +1,175 @@
+from rest_framework import serializers
+
+from catalog.models import Category, PricingTier, Tool
+from compare.models import Comparison
+from content.rendering import rendered
+from core.seo.utils import absolute_url
+from core.urlbuilder import cached_url
+from glossary.models import GlossaryTerm
+from guides.models import Guide
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+
+def export_language(context) -> str:
+    return context["language"]
+
+
+class TranslatedField(serializers.Field):
+    """
+    A translated value in the export language; editorial models give their live (published) value.
+    """
+
+    def __init__(self, field: str, **kwargs):
+        self.translated_field = field
+        super().__init__(source="*", read_only=True, **kwargs)
+
+    def to_representation(self, obj):
+        language = export_language(self.context)
+        if hasattr(obj, "get_display_value"):
+            return obj.get_display_value(self.translated_field, language)
+        obj.set_current_language(language)
+        return obj.safe_translation_getter(self.translated_field, any_language=True)
+
+
+class RichtextField(TranslatedField):
+    """Sanitized HTML of a richtext field, from the stored rendering where there is one."""
+
+    def to_representation(self, obj):
+        language = export_language(self.context)
+        if hasattr(obj, "set_current_language") and not hasattr(obj, "get_display_value"):
+            obj.set_current_language(language)
+        return rendered(obj, self.translated_field, language)["html"]
+
+
+class AbsoluteUrlField(serializers.Field):
+    def __init__(self, **kwargs):
+        super().__init__(source="*", read_only=True, **kwargs)
+
+    def to_representation(self, obj):
+        return absolute_url(cached_url(obj, export_language(self.context)) or obj.get_absolute_url())
+
+
+class CategorySerializer(serializers.ModelSerializer):
+    name = TranslatedField("name")
+    slug = TranslatedField("slug")
+
+    class Meta:
+        model = Category
+        fields = ["id", "name", "slug"]
+
+
+class PricingTierSerializer(serializers.ModelSerializer):
+    name = TranslatedField("name")
+    price_month = TranslatedField("price_month")
+    price_year = TranslatedField("price_year")
+    features = TranslatedField("features")
+
+    class Meta:
+        model = PricingTier
+        fields = ["id", "name", "price_month", "price_year", "features"]
+
+
+class ToolSerializer(serializers.ModelSerializer):
+    name = TranslatedField("name")
+    slug = TranslatedField("slug")
+    short_description = RichtextField("short_description")
+    long_description = RichtextField("long_description")
+    url = AbsoluteUrlField()
+    categories = CategorySerializer(many=True, read_only=True)
+    pricing = PricingTierSerializer(many=True, read_only=True)
+    tags = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
+
+    class Meta:
+        model = Tool
+        fields = [
+            "id", "name", "slug", "url", "vendor", "website", "short_description", "long_description",
+            "pricing_model", "free_tier", "rating", "is_featured", "language_support",
+            "categories", "tags", "pricing", "published_at", "updated_at",
+        ]
+
+
+class GuideSerializer(serializers.ModelSerializer):
+    title = TranslatedField("title")
+    slug = TranslatedField("public_slug")
+    intro = RichtextField("intro")
+    body = RichtextField("body")
+    url = AbsoluteUrlField()
+    categories = CategorySerializer(many=True, read_only=True)
+    tools = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    sections = serializers.SerializerMethodField()
+    reading_time = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Guide
+        fields = [
+            "id", "title", "slug", "url", "intro", "body", "sections", "reading_time",
+            "categories", "tools", "published_at", "updated_at",
+        ]
+
+    def _document(self, obj) -> dict:
+        # prefetched per export language, see api.views.GuideViewSet
+        documents = getattr(obj, "export_documents", [])
+        return documents[0].data if documents else {}
+
+    def get_sections(self, obj) -> list:
+        return self._document(obj).get("sections", [])
+
+    def get_reading_time(self, obj):
+        return self._document(obj).get("reading_time")
+
+
+class PromptSerializer(serializers.ModelSerializer):
+    title = TranslatedField("title")
+    slug = TranslatedField("public_slug")
+    intro = RichtextField("intro")
+    body = RichtextField("body")
+    outro = RichtextField("outro")
+    url = AbsoluteUrlField()
+    tools = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    tags = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
+
+    class Meta:
+        model = Prompt
+        fields = ["id", "title", "slug", "url", "intro", "body", "outro", "tools", "tags", "published_at", "updated_at"]
+
+
+class UseCaseSerializer(serializers.ModelSerializer):
+    title = TranslatedField("title")
+    slug = TranslatedField("public_slug")
+    persona = TranslatedField("persona")
+    intro = RichtextField("intro")
+    body = RichtextField("body")
+    outro = RichtextField("outro")
+    url = AbsoluteUrlField()
+    tools = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta:
+        model = UseCase
+        fields = [
+            "id", "title", "slug", "url", "persona", "intro", "body", "outro", "tools", "published_at", "updated_at",
+        ]
+
+
+class ComparisonSerializer(serializers.ModelSerializer):
+    title = TranslatedField("title")
+    slug = TranslatedField("slug")
+    intro = RichtextField("intro")
+    url = AbsoluteUrlField()
+    tools = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta:
+        model = Comparison
+        fields = ["id", "title", "slug", "url", "intro", "tools", "winner", "score_breakdown", "published_at", "updated_at"]
+
+
+class GlossaryTermSerializer(serializers.ModelSerializer):
+    long_definition = RichtextField("long_definition")
+    url = AbsoluteUrlField()
+
+    class Meta:
+        model = GlossaryTerm
+        fields = [
+            "id", "term", "slug", "url", "language", "translation_group", "category",
+            "short_definition", "long_definition", "updated_at",
+        ]
@@ -0,0 +1,117 @@
+import json
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from catalog.models import AffiliateProgram, Category, PricingTier, Tool
+from core.models.editorial import EditorialWorkflowMixin
+from core.tests.factories import make_guide
+from glossary.models import GlossaryTerm
+from guides.models import Guide
+
+
+def make_tool(i, published_at=None):
+    tool = Tool.objects.create(vendor=f"Vendor {i}", free_tier=True, published_at=published_at or timezone.now())
+    tool.create_translation("en", name=f"Tool {i}", slug=f"tool-{i}", short_description="<p>Short <script>x</script></p>")
+    tool.create_translation("de", name=f"Werkzeug {i}", slug=f"werkzeug-{i}")
+    category = Category.objects.create()
+    category.create_translation("en", name=f"Category {i}", slug=f"category-{i}")
+    tool.categories.add(category)
+    tier = PricingTier.objects.create(tool=tool)
+    tier.create_translation("en", name="Pro", price_month="9.99", features=["API"])
+    AffiliateProgram.objects.create(tool=tool, network="Impact", commission_value="30%")
+    tool.tags.add("writing")
+    return tool
+
+
+def ndjson(response):
+    return [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+
+
+class ExportApiTests(TestCase):
+    def test_tool_list_is_paginated_json_with_relations(self):
+        make_tool(1)
+        response = self.client.get("/api/tools/?lang=en")
+        self.assertEqual(response.status_code, 200)
+        row = response.json()["results"][0]
+        self.assertEqual(row["name"], "Tool 1")
+        self.assertEqual(row["short_description"], "<p>Short x</p>")
+        self.assertEqual(row["url"], "https://www.mentoro-ai.com/en/catalog/tool-1/")
+        self.assertEqual(row["categories"][0]["name"], "Category 1")
+        self.assertEqual(row["pricing"][0]["features"], ["API"])
+        self.assertNotIn("affiliates", row)
+        self.assertEqual(row["tags"], ["writing"])
+
+        row = self.client.get("/api/tools/?lang=de").json()["results"][0]
+        self.assertEqual(row["name"], "Werkzeug 1")
+
+    def test_unpublished_tools_are_not_exported(self):
+        make_tool("live")
+        scheduled = make_tool("scheduled", published_at=timezone.now() + timedelta(days=1))
+        names = [row["name"] for row in ndjson(self.client.get("/api/tools/export/?lang=en"))]
+        self.assertEqual(names, ["Tool live"])
+        self.assertEqual([row["name"] for row in self.client.get("/api/tools/?lang=en").json()["results"]], names)
+        self.assertEqual(self.client.get(f"/api/tools/{scheduled.pk}/?lang=en").status_code, 404)
+
+    def test_unknown_language_is_rejected(self):
+        self.assertEqual(self.client.get("/api/tools/?lang=xx").status_code, 400)
+
+    @override_settings(API_EXPORT_CHUNK_SIZE=50)
+    def test_ndjson_export_queries_per_chunk_not_per_row(self):
+        def export_queries(count):
+            Tool.objects.all().delete()
+            for i in range(count):
+                make_tool(f"{count}-{i}")
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get("/api/tools/export/?lang=en")
+                rows = ndjson(response)
+            self.assertEqual(response["Content-Type"], "application/x-ndjson; charset=utf-8")
+            self.assertEqual(len(rows), count)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(export_queries(2), export_queries(8))
+
+    @override_settings(API_EXPORT_CHUNK_SIZE=2)
+    def test_export_walks_every_chunk(self):
+        for i in range(5):
+            make_tool(i)
+        rows = ndjson(self.client.get("/api/tools/export/?lang=en"))
+        self.assertEqual([row["name"] for row in rows], [f"Tool {i}" for i in range(5)])
+
+    def test_catalog_export_mixes_resources(self):
+        make_tool(1)
+        make_guide("exported")
+        make_guide("hidden", status="draft")
+        rows = ndjson(self.client.get("/api/export/?lang=de"))
+        self.assertEqual([(row["type"], row.get("title") or row.get("name")) for row in rows],
+                         [("tools", "Werkzeug 1"), ("guides", "exported DE")])
+
+    def test_guides_in_review_export_their_live_values(self):
+        guide = make_guide("reviewed")
+        Guide.objects.filter(pk=guide.pk).update(
+            status=EditorialWorkflowMixin.STATUS_REVIEW,
+            last_published_revision_id=1,
+            live_i18n={"de": {"title": "reviewed live DE"}},
+        )
+        make_guide("never-published", status=EditorialWorkflowMixin.STATUS_REVIEW)
+        rows = ndjson(self.client.get("/api/guides/export/?lang=de"))
+        self.assertEqual([row["title"] for row in rows], ["reviewed live DE"])
+
+    def test_glossary_long_definition_is_sanitized(self):
+        GlossaryTerm.objects.create(
+            term="Agent", slug="agent", short_definition="Acts", long_definition="<p>Acts<script>x</script></p>"
+        )
+        row = self.client.get("/api/glossary/?lang=en").json()["results"][0]
+        self.assertEqual(row["long_definition"], "<p>Actsx</p>")
+
+    async def test_exports_stream_asynchronously_under_asgi(self):
+        await sync_to_async(make_tool)("async")
+        for url in ("/api/tools/export/?lang=en", "/api/export/?lang=en"):
+            response = await self.async_client.get(url)
+            self.assertTrue(response.is_async, url)
+            lines = b"".join([part async for part in response.streaming_content]).decode().splitlines()
+            self.assertEqual(len(lines), 1, url)
@@ -1,10 +1,15 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from .views import ToolViewSet
+from .views import EXPORT_RESOURCES, catalog_export
 
 router = DefaultRouter()
-router.register(r"tools", ToolViewSet, basename="tools")
+for prefix, viewset in EXPORT_RESOURCES.items():
+    router.register(prefix, viewset, basename=prefix)
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("export/", catalog_export, name="catalog-export"),
+    *router.urls,
+]
 
 app_name = "api"
@@ -1,14 +1,181 @@
-from rest_framework import viewsets, serializers
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.utils.translation import get_language
+from rest_framework import viewsets
+from rest_framework.decorators import action, api_view
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
 
 from catalog.models import Tool
+from compare.models import Comparison
+from core.conditional import (
+    not_modified,
+    object_validators,
+    queryset_validators,
+    set_validators,
+)
+from core.urlbuilder import attach_urls, site_languages
+from glossary.models import GlossaryTerm
+from guides.models import Guide, GuideReadingDocument
+from prompts.models import Prompt
+from usecases.models import UseCase
 
+from .export import ndjson_response
+from .serializers import (
+    ComparisonSerializer,
+    GlossaryTermSerializer,
+    GuideSerializer,
+    PromptSerializer,
+    ToolSerializer,
+    UseCaseSerializer,
+)
 
-class ToolSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Tool
-        fields = ["id", "name", "slug", "short_desc", "free_tier", "rating"]
 
+def request_language(request) -> str:
+    language = request.query_params.get("lang") or get_language()
+    if language not in site_languages():
+        raise ValidationError({"lang": f"Unknown language: {language}"})
+    return language
 
-class ToolViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Tool.objects.all()
+
+class ExportPagination(CursorPagination):
+    ordering = "pk"
+    page_size = 100
+    max_page_size = 500
+    page_size_query_param = "page_size"
+
+
+class ExportViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only export of one content type in one language (?lang=, default: the active language).
+    List and detail are JSON with cursor pagination; `<resource>/export/` streams every row as NDJSON.
+    Subclasses define export_queryset(language): the public rows of their content type in that language.
+    Editorial content is what the site shows: visible_on_site() rows (published, or back in review with a live
+    revision), serialized from their live snapshot (TranslatedField/RichtextField), never from the draft.
+    """
+    serializer_class = None
+    pagination_class = ExportPagination
+    query_budget = 15
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not callable(getattr(cls, "export_queryset", None)):
+            raise TypeError(f"{cls.__name__} must define export_queryset(language)")
+
+    @property
+    def language(self) -> str:
+        if not hasattr(self, "_language"):
+            self._language = request_language(self.request)
+        return self._language
+
+    def get_queryset(self):
+        return self.export_queryset(self.language)
+
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "language": self.language}
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        attach_urls(page if page is not None else [], [self.language])
+        return page
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = queryset_validators(request, self.get_queryset(), self.language)
+        response = not_modified(request, etag, last_modified) or super().list(request, *args, **kwargs)
+        return set_validators(response, etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag, last_modified = object_validators(request, instance, self.language)
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            attach_urls([instance], [self.language])
+            response = Response(self.get_serializer(instance).data)
+        return set_validators(response, etag, last_modified)
+
+    @action(detail=False, url_path="export")
+    def export(self, request, *args, **kwargs):
+        return ndjson_response(request, self.language, [(self.get_queryset(), self.get_serializer_class(), None)])
+
+
+class ToolViewSet(ExportViewSet):
     serializer_class = ToolSerializer
+
+    @staticmethod
+    def export_queryset(language):
+        return (
+            Tool.objects.translated(language)
+            .filter(published_at__isnull=False, published_at__lte=timezone.now())
+            .prefetch_related("translations", "categories__translations", "pricing__translations", "tags")
+        )
+
+
+class GuideViewSet(ExportViewSet):
+    serializer_class = GuideSerializer
+
+    @staticmethod
+    def export_queryset(language):
+        documents = GuideReadingDocument.objects.filter(language=language)
+        return Guide.objects.visible_on_site().translated(language).prefetch_related(
+            "translations",
+            "categories__translations",
+            "tools",
+            Prefetch("reading_documents", queryset=documents, to_attr="export_documents"),
+        )
+
+
+class PromptViewSet(ExportViewSet):
+    serializer_class = PromptSerializer
+
+    @staticmethod
+    def export_queryset(language):
+        return Prompt.objects.visible_on_site().translated(language).prefetch_related("translations", "tools", "tags")
+
+
+class UseCaseViewSet(ExportViewSet):
+    serializer_class = UseCaseSerializer
+
+    @staticmethod
+    def export_queryset(language):
+        return UseCase.objects.visible_on_site().translated(language).prefetch_related("translations", "tools")
+
+
+class ComparisonViewSet(ExportViewSet):
+    serializer_class = ComparisonSerializer
+
+    @staticmethod
+    def export_queryset(language):
+        return Comparison.objects.visible_on_site().translated(language).prefetch_related("translations", "tools")
+
+
+class GlossaryTermViewSet(ExportViewSet):
+    serializer_class = GlossaryTermSerializer
+
+    @staticmethod
+    def export_queryset(language):
+        return GlossaryTerm.objects.filter(language=language)
+
+
+# resource name -> viewset; also the order of the catalog export
+EXPORT_RESOURCES = {
+    "tools": ToolViewSet,
+    "guides": GuideViewSet,
+    "prompts": PromptViewSet,
+    "usecases": UseCaseViewSet,
+    "comparisons": ComparisonViewSet,
+    "glossary": GlossaryTermViewSet,
+}
+
+
+@api_view(["GET"])
+def catalog_export(request):
+    """
+    The whole catalog in one language as NDJSON; every line carries its resource name in "type".
+    """
+    language = request_language(request)
+    sources = [
+        (viewset.export_queryset(language), viewset.serializer_class, kind)
+        for kind, viewset in EXPORT_RESOURCES.items()
+    ]
+    return ndjson_response(request, language, sources)
@@ -9,6 +9,9 @@ from parler.models import TranslatableModel, TranslatedFields
 from parler.utils.context import switch_language
 from taggit.managers import TaggableManager
 
+from content.rendering import rendered
+from core.urlbuilder import cached_url
+
 
 class Category(TranslatableModel):
     translations = TranslatedFields(
@@ -61,6 +64,7 @@ class Tool(TranslatableModel):
         slug=models.SlugField(_("Slug"), max_length=220, unique=True),
         short_description=models.TextField(blank=True),
         long_description=models.TextField(blank=True),
+        rendered=models.JSONField(_("Rendered richtext"), default=dict, blank=True, editable=False),
     )
     objects = TranslatableManager()
     ordering = ["id"]
@@ -75,10 +79,21 @@ class Tool(TranslatableModel):
 
     def get_absolute_url(self, language: str | None = None):
         lang = language or get_language()
+        cached = cached_url(self, lang)
+        if cached:
+            return cached
         with switch_language(self, lang):
             slug = self.safe_translation_getter("slug")
         return reverse("catalog:detail", kwargs={"slug": slug})
 
+    @property
+    def rendered_short_description(self) -> dict:
+        return rendered(self, "short_description")
+
+    @property
+    def rendered_long_description(self) -> dict:
+        return rendered(self, "long_description")
+
 
 class PricingTier(TranslatableModel):
     tool = models.ForeignKey(Tool, on_delete=models.CASCADE, related_name="pricing", )
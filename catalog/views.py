@@ -1,17 +1,25 @@
 from django.core.paginator import Paginator
 from django.db.models import Q
+from django.http import Http404
 from django.shortcuts import render, get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _, get_language
 from django.views.generic import ListView, DetailView
 
-from core.seo.utils import absolute_url, localized_alternates
+from core.cache import cache_public_page
+from core.conditional import AsyncConditionalDetailMixin, AsyncConditionalListMixin
+from core.pagination import KeysetPaginationMixin
+from core.search import matching_ids
+from core.seo.utils import absolute_url, localized_alternates, object_alternates
 from core.views import SeoMixin
 from .models import Tool
 
 
-class ToolListView(ListView, SeoMixin):
+@method_decorator(cache_public_page(tags=[Tool]), name="get")
+class ToolListView(AsyncConditionalListMixin, KeysetPaginationMixin, ListView, SeoMixin):
+    keyset_ordering = ("-updated_at", "-pk")
     model = Tool
     template_name = "catalog/tool_list.html"
     context_object_name = "object_list"
@@ -30,11 +38,7 @@ class ToolListView(ListView, SeoMixin):
         )
 
         if q:
-            qs = qs.filter(
-                Q(translations__name__icontains=q)
-                | Q(translations__short_description__icontains=q)
-                | Q(translations__long_description__icontains=q)
-            )
+            qs = qs.filter(pk__in=matching_ids("tool", q, lang))
 
         if free == "1" and hasattr(Tool, "free_tier"):
             qs = qs.filter(free_tier=True)
@@ -90,7 +94,8 @@ class ToolListView(ListView, SeoMixin):
         return ctx
 
 
-class ToolDetailView(DetailView, SeoMixin):
+@method_decorator(cache_public_page(), name="get")
+class ToolDetailView(AsyncConditionalDetailMixin, DetailView, SeoMixin):
     model = Tool
     template_name = "catalog/tool_detail.html"
     context_object_name = "object"
@@ -107,18 +112,19 @@ class ToolDetailView(DetailView, SeoMixin):
         )
         return qs.distinct()[:3]
 
-    def get_object(self, queryset=None):
+    async def aget_object(self):
         slug = self.kwargs["slug"]
         lang = get_language()
-        obj = (
+        obj = await (
             Tool.objects
             .language(lang)
             .filter(Q(translations__slug=slug))
             .distinct()
-            .first()
+            .afirst()
         )
-        if obj:
-            return obj
+        if obj is None:
+            raise Http404(_("No tool found matching the query"))
+        return obj
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
@@ -128,7 +134,7 @@ class ToolDetailView(DetailView, SeoMixin):
         desc = (obj.short_description or obj.long_description or obj.name)[:155]
         canonical = absolute_url(self.request.path)
         og_img = getattr(obj, "hero_image_url", None)
-        alts = localized_alternates(self.request, "catalog:detail", {"slug": obj.slug})
+        alts = object_alternates(self.request, obj)
         json_ld = {
             "@context": "https://schema.org",
             "@type": "Article",
@@ -11,6 +11,7 @@ from core.models.editorial import (
     EditorialManager,
     PublishedOnlyManager, EditorialWorkflowMixin,
 )
+from core.urlbuilder import cached_url
 
 
 class Comparison(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
@@ -36,6 +37,9 @@ class Comparison(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
 
     def get_absolute_url(self, language: str | None = None):
         lang = language or get_language()
+        cached = cached_url(self, lang)
+        if cached:
+            return cached
         with switch_language(self, lang):
             return reverse("compare:detail", kwargs={"slug": self.slug})
 
@@ -2,16 +2,22 @@ from django.core.paginator import Paginator
 from django.db.models import Q
 from django.shortcuts import render, get_object_or_404
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _, get_language
 from django.views.generic import ListView, DetailView
 
-from catalog.models import Category
-from core.seo.utils import absolute_url, localized_alternates
+from catalog.models import Category, Tool
+from core.cache import cache_public_page
+from core.conditional import ConditionalDetailMixin, ConditionalListMixin
+from core.pagination import KeysetPaginationMixin
+from core.search import matching_ids
+from core.seo.utils import absolute_url, localized_alternates, object_alternates
 from core.views import SeoMixin
 from .models import Comparison
 
 
-class ComparisonListView(ListView, SeoMixin):
+@method_decorator(cache_public_page(tags=[Comparison]), name="dispatch")
+class ComparisonListView(ConditionalListMixin, KeysetPaginationMixin, ListView, SeoMixin):
     model = Comparison
     template_name = "compare/index.html"
     context_object_name = "objects"
@@ -28,12 +34,7 @@ class ComparisonListView(ListView, SeoMixin):
 
         q = self.request.GET.get("q")
         if q:
-            qs = qs.filter(
-                Q(translations__title__icontains=q)
-                | Q(translations__slug__icontains=q)
-                | Q(translations__public_slug__icontains=q)
-                | Q(tools__translations__name__icontains=q)
-            ).distinct()
+            qs = qs.filter(pk__in=matching_ids("comparison", q, get_language()))
         if not qs.ordered:
             qs = qs.order_by("-published_at", "-updated_at")
         return qs
@@ -79,10 +80,12 @@ class ComparisonListView(ListView, SeoMixin):
         return ctx
 
 
-class ComparisonDetailView(DetailView, SeoMixin):
+@method_decorator(cache_public_page(), name="dispatch")
+class ComparisonDetailView(ConditionalDetailMixin, DetailView, SeoMixin):
     model = Comparison
     template_name = "compare/detail.html"
     context_object_name = "object"
+    related_models = (Tool,)
 
     def get_queryset(self):
         return Comparison.objects.language().prefetch_related("tools", "tools__categories")
@@ -155,7 +158,7 @@ class ComparisonDetailView(DetailView, SeoMixin):
         desc = (obj.intro or obj.title)[:155]
         canonical = absolute_url(self.request.path)
         og_img = getattr(obj, "hero_image_url", None)
-        alts = localized_alternates(self.request, "compare:detail", {"slug": obj.slug})
+        alts = object_alternates(self.request, obj)
         json_ld = {
             "@context": "https://schema.org",
             "@type": "Article",
@@ -1,63 +1,18 @@
-import bleach
 from django import template
 from django.utils.safestring import mark_safe
 
-register = template.Library()
+from content.sanitizer import (  # noqa: F401
+    ALLOWED_ATTRS,
+    ALLOWED_PROTOCOLS,
+    ALLOWED_TAGS,
+    sanitize_html,
+)
 
-ALLOWED_TAGS = [
-    "p",
-    "br",
-    "hr",
-    "blockquote",
-    "pre",
-    "code",
-    "span",
-    "h2",
-    "h3",
-    "h4",
-    "h5",
-    "ul",
-    "ol",
-    "li",
-    "strong",
-    "em",
-    "u",
-    "s",
-    "sub",
-    "sup",
-    "b",
-    "i",
-    "a",
-    "img",
-    "figure",
-    "figcaption",
-    "table",
-    "thead",
-    "tbody",
-    "tr",
-    "th",
-    "td",
-]
-ALLOWED_ATTRS = {
-    "*": ["class", "id"],
-    "a": ["href", "title", "rel", "target"],
-    "img": ["src", "alt", "title", "width", "height", "loading"],
-    "table": ["border", "cellpadding", "cellspacing"],
-    "th": ["colspan", "rowspan"],
-    "td": ["colspan", "rowspan"],
-}
-ALLOWED_PROTOCOLS = ["http", "https", "mailto", "data"]
+register = template.Library()
 
 
 @register.filter(name="richtext")
 def richtext(html: str) -> str:
     if not html:
         return ""
-    cleaned = bleach.clean(
-        html,
-        tags=ALLOWED_TAGS,
-        attributes=ALLOWED_ATTRS,
-        protocols=ALLOWED_PROTOCOLS,
-        strip=True,
-    )
-    return mark_safe(cleaned)
+    return mark_safe(sanitize_html(html))
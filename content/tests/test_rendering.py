@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import translation
+
+from content import rendering
+from content.rendering import EXCERPT_WORDS, source_hash
+from core.models.editorial import EditorialWorkflowMixin, publish_content
+from core.tests.factories import make_guide
+from guides.models import Guide
+
+GuideTranslation = Guide._parler_meta.root_model
+
+LONG_BODY = "<p>" + " ".join(f"word{i}" for i in range(450)) + "</p>"
+
+
+# an English draft whose intro the sanitizer has to clean, with a body long enough for an excerpt
+DRAFT = {
+    "status": EditorialWorkflowMixin.STATUS_DRAFT,
+    "languages": ("en",),
+    "intro": '<p onclick="x()">Intro <b>bold</b></p>',
+    "body": LONG_BODY,
+}
+
+
+class RenderingPipelineTests(TestCase):
+    def test_translation_save_stores_html_text_words_and_excerpt(self):
+        g = make_guide("pipeline", **DRAFT)
+        stored = GuideTranslation.objects.get(master=g, language_code="en").rendered
+
+        self.assertEqual(stored["intro"]["html"], "<p>Intro <b>bold</b></p>")
+        self.assertEqual(stored["intro"]["text"], "Intro bold")
+        self.assertEqual(stored["intro"]["words"], 2)
+        self.assertEqual(stored["body"]["words"], 450)
+        self.assertTrue(stored["body"]["excerpt"].startswith("<p>word0 word1"))
+        self.assertTrue(stored["body"]["excerpt"].endswith(" …</p>"))
+        self.assertEqual(len(stored["body"]["excerpt"].split()), EXCERPT_WORDS + 1)
+
+    def test_display_reads_stored_rendering_without_sanitizing(self):
+        g = make_guide("stored", **DRAFT)
+        with translation.override("en"), mock.patch.object(rendering, "sanitize_html") as sanitize:
+            self.assertEqual(g.rendered_intro["html"], "<p>Intro <b>bold</b></p>")
+            self.assertEqual(g.reading_time, 2)
+            sanitize.assert_not_called()
+
+    def test_stale_rendering_is_not_served(self):
+        g = make_guide("stale", **DRAFT)
+        GuideTranslation.objects.filter(master=g).update(intro="<p>Changed</p>")  # bypasses the pipeline
+        g = Guide.objects.get(pk=g.pk)
+        with translation.override("en"):
+            self.assertEqual(g.rendered_intro["html"], "<p>Changed</p>")
+
+    def test_publish_snapshot_carries_the_rendering(self):
+        g = make_guide("live", **DRAFT)
+        g.submit_for_review(by=None)
+        publish_content(g, by=None)
+        GuideTranslation.objects.filter(master=g).update(intro="<p>Draft</p>", rendered={})
+        g = Guide.objects.get(pk=g.pk)
+        self.assertEqual(g.live_i18n["en"]["rendered"]["intro"]["src"], source_hash(g.live_i18n["en"]["intro"]))
+        with translation.override("en"):
+            self.assertEqual(g.rendered_intro["text"], "Intro bold")
+
+    def test_backfill_command_fills_missing_renderings(self):
+        g = make_guide("backfill", **DRAFT)
+        GuideTranslation.objects.filter(master=g).update(rendered={})
+        call_command("render_richtext", stdout=mock.MagicMock())
+        stored = GuideTranslation.objects.get(master=g, language_code="en").rendered
+        self.assertEqual(stored["intro"]["text"], "Intro bold")
@@ -0,0 +1,39 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from content import sanitizer
+from content.sanitizer import cache_key, sanitize_html
+from glossary.models import GlossaryTerm
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "richtext"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SanitizerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        sanitizer._memo.clear()
+
+    def test_strips_disallowed_markup(self):
+        out = sanitize_html('<p onclick="x()">Hi <script>alert(1)</script><a href="javascript:x">l</a></p>')
+        self.assertEqual(out, "<p>Hi alert(1)<a>l</a></p>")
+
+    def test_same_input_is_cleaned_once_per_process_and_once_across_workers(self):
+        with mock.patch.object(sanitizer, "_cleaner", wraps=sanitizer._cleaner) as cleaner:
+            sanitize_html("<p>memo</p>")
+            sanitize_html("<p>memo</p>")
+            self.assertEqual(cleaner.call_count, 1)
+
+            sanitizer._memo.clear()  # another worker: only the shared cache is warm
+            self.assertEqual(sanitize_html("<p>memo</p>"), "<p>memo</p>")
+            self.assertEqual(cleaner.call_count, 1)
+
+    @override_settings(RICHTEXT_SANITIZE_ON_SAVE=True)
+    def test_sanitize_on_save_warms_the_shared_cache(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            GlossaryTerm.objects.create(
+                term="RAG", slug="rag", short_definition="-", long_definition="<p>Retrieval</p>", language="en"
+            )
+        self.assertEqual(cache.get(cache_key("<p>Retrieval</p>")), "<p>Retrieval</p>")
@@ -1,10 +1,11 @@
 from django.urls import path, include
 
-from .views import home
+from .views import home, search
 
 app_name = "content"
 
 urlpatterns = [
     path("", home.HomePageView.as_view(), name="home"),
+    path("search/", search.SearchView.as_view(), name="search"),
     path("editorial/", include("content.urls_editorial", namespace="editorial")),
 ]
@@ -1,11 +1,12 @@
 # content/views/home.py
+from asgiref.sync import sync_to_async
 from django.utils.translation import gettext as _, get_language
 from django.views.generic import TemplateView
 
 from catalog.models import Tool
 from core.seo.utils import absolute_url, localized_alternates
 from core.services import (
-    get_latest_items,
+    aget_latest_items,
     related_guides,
     to_teaser_item,
 )
@@ -34,15 +35,42 @@ def resolve_starter_guide_url(lang: str) -> str | None:
     return g.get_absolute_url(language=lang)
 
 
+def _recommended_items() -> list:
+    anchor = Guide.published.order_by("-published_at").first()
+    return [to_teaser_item(g, "guide") for g in related_guides(anchor, limit=3)] if anchor else []
+
+
+async def _featured_tools() -> list:
+    qs = Tool.objects.filter(is_featured=True).prefetch_related("translations").order_by("-published_at")[:6]
+    return [t async for t in qs]
+
+
 class HomePageView(TemplateView, SeoMixin):
+    """
+    Async view: the loads are awaited one after the other. The async ORM and sync_to_async both run
+    on the single thread-sensitive executor, so gathering them would not make them concurrent.
+    """
     template_name = "content/home.html"
 
-    def get_context_data(self, **kwargs):
+    async def get(self, request, *args, **kwargs):
         lang = (get_language() or "en")[:2]
-        ctx = super().get_context_data(**kwargs)
+        latest_items = await aget_latest_items(limit=6)
+        featured_tools = await _featured_tools()
+        recommended_items = await sync_to_async(_recommended_items)()
+        start_guide_url = await sync_to_async(resolve_starter_guide_url)(lang)
+        context = self.get_context_data(**kwargs)
+        context.update(
+            latest_items=latest_items,
+            featured_tools=featured_tools,
+            recommended_items=recommended_items,
+            start_guide_url=start_guide_url,
+        )
+        return self.render_to_response(context)
+
+    def get_context_data(self, **kwargs):
         canonical = absolute_url(self.request.path)
         alts = localized_alternates(self.request, "guides:list")
-        ctx["seo"] = self.build_seo(
+        kwargs["seo"] = self.build_seo(
             self.request,
             title=_("AI tools, guides & usecases for beginners and professionals · MentoroAI"),
             description=_("Understand AI tools and use them effectively"),
@@ -56,15 +84,4 @@ class HomePageView(TemplateView, SeoMixin):
                 "inLanguage": get_language(),
             },
         )
-        ctx["start_guide_url"] = resolve_starter_guide_url(lang)
-        ctx["latest_items"] = get_latest_items(limit=6)
-        ctx["featured_tools"] = Tool.objects.filter(is_featured=True).order_by(
-            "-published_at"
-        )[:6]
-        anchor = Guide.published.order_by("-published_at").first()
-        ctx["recommended_items"] = (
-            [to_teaser_item(g, "guide") for g in related_guides(anchor, limit=3)]
-            if anchor
-            else []
-        )
-        return ctx
+        return super().get_context_data(**kwargs)
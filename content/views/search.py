@@ -0,0 +1,58 @@
+# content/views/search.py
+from django.utils.decorators import method_decorator
+from django.utils.translation import get_language
+from django.utils.translation import gettext as _
+from django.views.generic import ListView
+
+from catalog.models import Tool
+from compare.models import Comparison
+from core.cache import cache_public_page
+from core.models import SearchDocument
+from core.search import search
+from core.seo.utils import absolute_url, localized_alternates
+from core.views import SeoMixin
+from glossary.models import GlossaryTerm
+from guides.models import Guide
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+KIND_LABELS = dict(SearchDocument.KIND_CHOICES)
+
+
+@method_decorator(cache_public_page(tags=[Guide, Prompt, UseCase, Comparison, Tool, GlossaryTerm]), name="dispatch")
+class SearchView(ListView, SeoMixin):
+    """
+    Site-wide search over all public content types (ranked, current language);
+    ?type=<kind> narrows the results to one content type.
+    """
+    template_name = "content/search.html"
+    context_object_name = "results"
+    paginate_by = 20
+
+    def get_kind(self):
+        kind = (self.request.GET.get("type") or "").strip()
+        return kind if kind in KIND_LABELS else ""
+
+    def get_queryset(self):
+        q = (self.request.GET.get("q") or "").strip()
+        kind = self.get_kind()
+        return search(q, language=get_language(), kinds=[kind] if kind else None).only(
+            "kind", "title", "body", "url"
+        )
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        canonical = absolute_url(self.request.path)
+        alts = localized_alternates(self.request, "content:search")
+        ctx["seo"] = self.build_seo(
+            self.request,
+            title=_("Search · MentoroAI"),
+            description=_("Search guides, prompts, use cases, tools, comparisons and the glossary."),
+            canonical=canonical,
+            alternates=alts,
+        )
+        ctx["seo"].robots = "noindex,follow"
+        ctx["q"] = (self.request.GET.get("q") or "").strip()
+        ctx["kind"] = self.get_kind()
+        ctx["kinds"] = SearchDocument.KIND_CHOICES
+        return ctx
@@ -1,5 +1,6 @@
 # core/apps.py
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
@@ -7,4 +8,8 @@ class CoreConfig(AppConfig):
     name = "core"
 
     def ready(self):
-        import core.authz  # noqa: F401
+        import core.authz
+        import core.signals  # noqa: F401
+        from core.instrumentation import install_query_recorder
+
+        connection_created.connect(install_query_recorder, dispatch_uid="core.instrumentation")
@@ -0,0 +1,66 @@
+# core/batching.py
+"""
+Per-transaction batching of post-commit work: signal handlers add the ids/keys a save affects and the
+flush function runs once at commit with everything the transaction collected (one rebuild, one purge,
+one queued task instead of one per saved row). Batches belong to the thread's connection and to the
+on_commit callback registered for them, so a concurrent transaction never flushes (or drops) another
+one's items and a rolled-back transaction takes its batch with it.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable
+
+from django.db import transaction
+
+_state = threading.local()
+
+
+class _Batch:
+    def __init__(self):
+        self.items: set = set()
+        self.flushed = False
+        self.callback = None
+
+
+def _batches() -> dict:
+    if not hasattr(_state, "batches"):
+        _state.batches = {}
+    return _state.batches
+
+
+def _registered(connection, callback) -> bool:
+    # the latest callback is near the end of the list unless a savepoint rollback discarded it
+    return any(entry[1] is callback for entry in reversed(connection.run_on_commit))
+
+
+def collect_on_commit(flush: Callable[[set], None], items: Iterable, using: str | None = None) -> None:
+    """
+    Adds items to the current transaction's batch for flush; outside a transaction flush runs right away.
+    Every add registers a callback, the first one to run flushes the batch and the others find it flushed.
+    """
+    items = set(items)
+    if not items:
+        return
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        flush(items)
+        return
+
+    key = (connection.alias, flush)
+    batches = _batches()
+    batch = batches.get(key)
+    if batch is None or batch.flushed or not _registered(connection, batch.callback):
+        batch = batches[key] = _Batch()
+    batch.items.update(items)
+
+    def _run():
+        if batch.flushed:
+            return
+        batch.flushed = True
+        if batches.get(key) is batch:
+            del batches[key]
+        flush(batch.items)
+
+    batch.callback = _run
+    transaction.on_commit(_run, using=using)
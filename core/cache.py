@@ -0,0 +1,550 @@
+# core/cache.py
+"""
+Cache tier for hot keys, template fragments and public pages; a small per-process LRU sits in front of
+the shared (Redis) cache, and entries carry cache tags (per model and per object) whose versions are bumped
+to purge them precisely.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import caches
+from django.db import models
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import parse_http_date_safe
+from django.utils.translation import get_language, get_language_from_path
+
+from core.cdn import apurge_batch, purge_all_pages, purge_batch, purge_surrogate_keys
+from core.instrumentation import record_cache_lookup
+
+_MISSING = object()
+
+PAGE_GENERATION_KEY = "page:generation"
+TAG_VERSION_PREFIX = "tag:"
+PAGE_CACHE_HEADER = "X-Page-Cache"
+CSRF_PLACEHOLDER = b"__csrf_token_placeholder__"
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+CSRF_VALUE_RE = re.compile(rb'(name="csrfmiddlewaretoken" value=")[^"]*"')
+
+
+class LocalLRU:
+    """
+    Thread-safe, size-bounded LRU with per-entry expiry; lives in a single worker process.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TwoLevelCache:
+    """
+    Read-through pair of LocalLRU (L1) and a Django cache alias (L2);
+    L1 entries live only CACHE_LOCAL_TTL seconds, which bounds staleness across workers.
+    """
+
+    def __init__(self, alias: str = "default", maxsize: int | None = None, local_ttl: float | None = None):
+        self.alias = alias
+        self.local = LocalLRU(maxsize or getattr(settings, "CACHE_LOCAL_MAXSIZE", 512))
+        self.local_ttl = local_ttl if local_ttl is not None else getattr(settings, "CACHE_LOCAL_TTL", 5)
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def get(self, key: str, default=None):
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            record_cache_lookup(hit=True)
+            return value
+        value = self.shared.get(key, _MISSING)
+        record_cache_lookup(hit=value is not _MISSING)
+        if value is _MISSING:
+            return default
+        self.local.set(key, value, self.local_ttl)
+        return value
+
+    async def aget(self, key: str, default=None):
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            record_cache_lookup(hit=True)
+            return value
+        value = await self.shared.aget(key, _MISSING)
+        record_cache_lookup(hit=value is not _MISSING)
+        if value is _MISSING:
+            return default
+        self.local.set(key, value, self.local_ttl)
+        return value
+
+    def set(self, key: str, value, timeout: float | None = None) -> None:
+        self.shared.set(key, value, timeout)
+        local_ttl = self.local_ttl if not timeout else min(self.local_ttl, timeout)
+        self.local.set(key, value, local_ttl)
+
+    def get_or_set(self, key: str, default, timeout: float | None = None):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = default() if callable(default) else default
+            self.set(key, value, timeout)
+        return value
+
+    def delete(self, key: str) -> None:
+        self.shared.delete(key)
+        self.local.delete(key)
+
+
+hot_cache = TwoLevelCache()
+
+
+# ---------- Cache tags ----------
+
+
+def tag_for(item, pk=None) -> str:
+    """
+    "guides.guide" for a model (list pages), "guides.guide:12" for an instance; strings pass through.
+    """
+    if isinstance(item, str):
+        return item
+    if pk is None and isinstance(item, models.Model):
+        pk = item.pk
+    label = item._meta.label_lower
+    return f"{label}:{pk}" if pk is not None else label
+
+
+def tags_for(*items) -> set[str]:
+    return {tag_for(item) for item in items if item is not None}
+
+
+def tag_versions(tags) -> dict[str, int]:
+    keys = {f"{TAG_VERSION_PREFIX}{tag}": tag for tag in tags}
+    if not keys:
+        return {}
+    found = hot_cache.shared.get_many(list(keys))
+    return {tag: found.get(key, 0) for key, tag in keys.items()}
+
+
+async def atag_versions(tags) -> dict[str, int]:
+    keys = {f"{TAG_VERSION_PREFIX}{tag}": tag for tag in tags}
+    if not keys:
+        return {}
+    found = await hot_cache.shared.aget_many(list(keys))
+    return {tag: found.get(key, 0) for key, tag in keys.items()}
+
+
+def invalidate_tags(*items) -> None:
+    """
+    Purges every entry that declared one of the tags; entries are not deleted, their stored versions go stale.
+    """
+    tags = tags_for(*items)
+    if tags:
+        hot_cache.shared.set_many({f"{TAG_VERSION_PREFIX}{tag}": time.time_ns() for tag in tags}, None)
+        purge_surrogate_keys(tags)
+
+
+def add_cache_tags(request, *items) -> None:
+    """
+    Lets a view declare further objects its response depends on (e.g. related items it renders).
+    """
+    request._cache_tags = getattr(request, "_cache_tags", set()) | tags_for(*items)
+
+
+def get_tagged(key: str, default=None):
+    entry = hot_cache.get(key)
+    if entry is None:
+        return default
+    if entry["tags"] and tag_versions(entry["tags"]) != entry["tags"]:
+        return default
+    return entry["value"]
+
+
+async def aget_tagged(key: str, default=None):
+    entry = await hot_cache.aget(key)
+    if entry is None:
+        return default
+    if entry["tags"] and await atag_versions(entry["tags"]) != entry["tags"]:
+        return default
+    return entry["value"]
+
+
+def set_tagged(key: str, value, tags, timeout: float | None = None, started_at: int | None = None) -> bool:
+    """
+    Stores value with the current versions of its tags; if a tag was purged after started_at
+    (while the value was being built) the value is already stale and is not stored.
+    """
+    versions = tag_versions(tags)
+    if started_at is not None and any(v > started_at for v in versions.values()):
+        return False
+    hot_cache.set(key, {"value": value, "tags": versions}, timeout)
+    return True
+
+
+# ---------- Fragment cache ----------
+
+FRAGMENT_PREFIX = "fragment"
+
+
+def _version_part(value) -> str:
+    """
+    Model instances stand for their current content version (pk, updated_at, published revision),
+    anything else (teaser dicts, SEO context) for itself.
+    """
+    if isinstance(value, models.Model):
+        parts = [value._meta.label_lower, str(value.pk)]
+        for attr in ("updated_at", "last_published_revision_id"):
+            version = value.__dict__.get(attr)
+            if version is not None:
+                parts.append(str(version))
+        return ":".join(parts)
+    try:
+        return json.dumps(value, sort_keys=True, default=str)
+    except TypeError:
+        return repr(value)
+
+
+def fragment_key(name: str, vary_on=(), language: str | None = None) -> str:
+    raw = "|".join(_version_part(value) for value in vary_on)
+    return f"{FRAGMENT_PREFIX}:{name}:{language or get_language() or ''}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def fragment_tags(name: str, vary_on=(), extra=()) -> set[str]:
+    """
+    Every fragment carries "fragment:<name>" (see invalidate_fragments) plus the tags of the objects it shows.
+    """
+    tags = {f"{FRAGMENT_PREFIX}:{name}"} | tags_for(*extra)
+    tags |= {tag_for(value) for value in vary_on if isinstance(value, models.Model) and value.pk is not None}
+    return tags
+
+
+def invalidate_fragments(*names: str) -> None:
+    """
+    Purges every cached copy of the named fragments (e.g. after a template change to the partial).
+    """
+    invalidate_tags(*(f"{FRAGMENT_PREFIX}:{name}" for name in names))
+
+
+# ---------- Public page cache ----------
+
+
+def page_generation() -> int:
+    return hot_cache.get(PAGE_GENERATION_KEY) or 0
+
+
+async def apage_generation() -> int:
+    return await hot_cache.aget(PAGE_GENERATION_KEY) or 0
+
+
+def bump_page_generation() -> None:
+    """
+    Invalidates every cached public page at once; old entries are simply never read again and expire.
+    """
+    try:
+        hot_cache.shared.set(PAGE_GENERATION_KEY, time.time_ns(), None)
+    finally:
+        hot_cache.local.delete(PAGE_GENERATION_KEY)
+    purge_all_pages()
+
+
+def page_cache_key(request, generation: int | None = None, language: str | None = None) -> str:
+    """
+    Key on language, host, path and the normalized query string (parameter order does not matter).
+    """
+    if generation is None:
+        generation = page_generation()
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    raw = "|".join([language or get_language() or "", request.get_host(), request.path, query])
+    return f"page:{generation}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def bypass_page_cache(request):
+    """
+    Marks request to be rendered fresh: it is neither answered from nor stored in the page caches (SEO crawls,
+    which measure render time and must see the current markup).
+    """
+    request._bypass_page_cache = True
+    return request
+
+
+def _is_cacheable_request(request) -> bool:
+    """
+    Only plain anonymous reads: no session (logged-in users, chosen language, editors' previews)
+    and no pending flash messages.
+    """
+    if request.method not in ("GET", "HEAD") or getattr(request, "_bypass_page_cache", False):
+        return False
+    cookies = request.COOKIES
+    return settings.SESSION_COOKIE_NAME not in cookies and CookieStorage.cookie_name not in cookies
+
+
+def _is_cacheable_response(response) -> bool:
+    return response.status_code == 200 and not response.streaming and not response.cookies
+
+
+def _response_tags(request, response) -> set[str]:
+    """
+    Declared tags plus the detail object found in the template context.
+    """
+    tags = set(getattr(request, "_cache_tags", ()))
+    obj = (getattr(response, "context_data", None) or {}).get("object")
+    if isinstance(obj, models.Model):
+        tags.add(tag_for(obj))
+    return tags
+
+
+def anonymous_page_cache() -> bool:
+    return getattr(settings, "PAGE_CACHE_ANONYMOUS", False)
+
+
+def _shared_cache_headers(response, tags) -> None:
+    """
+    Anonymous mode: the page may be kept by shared caches (CDN) and lists its cache tags as surrogate keys,
+    which invalidate_tags() purges there as well (core.cdn).
+    """
+    if not anonymous_page_cache():
+        return
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=getattr(settings, "PAGE_CACHE_BROWSER_MAX_AGE", 0),
+        s_maxage=getattr(settings, "PAGE_CACHE_CDN_MAX_AGE", 600),
+    )
+    response[SURROGATE_KEY_HEADER] = " ".join(sorted(tags))
+
+
+def _pack(response, tags) -> dict:
+    content = CSRF_VALUE_RE.sub(rb"\g<1>" + CSRF_PLACEHOLDER + b'"', response.content)
+    validators = {header: response[header] for header in VALIDATOR_HEADERS if response.has_header(header)}
+    return {
+        "content": content,
+        "content_type": response.get("Content-Type"),
+        "validators": validators,
+        "tags": sorted(tags),
+        "language": get_language(),
+        "xframe_options_exempt": getattr(response, "xframe_options_exempt", False),
+    }
+
+
+def _stack_headers(request, response, entry: dict) -> None:
+    """
+    What LocaleMiddleware and XFrameOptionsMiddleware add to a full response; a page served by
+    AnonymousPageCacheMiddleware never passes through them.
+    """
+    if not entry.get("xframe_options_exempt") and not response.has_header("X-Frame-Options"):
+        response["X-Frame-Options"] = getattr(settings, "X_FRAME_OPTIONS", "DENY").upper()
+    if not get_language_from_path(request.path_info):
+        patch_vary_headers(response, ("Accept-Language",))
+    response.setdefault("Content-Language", entry.get("language") or get_language())
+
+
+def _unpack(request, entry: dict, shared: bool = False) -> HttpResponse:
+    """
+    The response for a cache hit; `shared` for hits served in front of the session/CSRF/locale middleware
+    (AnonymousPageCacheMiddleware): no CSRF token, and the headers of the skipped middleware are added here.
+    """
+    validators = entry.get("validators") or {}
+    if validators:
+        # the stored validators (core.conditional) answer revalidations of cached pages as well
+        response = get_conditional_response(
+            request,
+            etag=validators.get("ETag"),
+            last_modified=parse_http_date_safe(validators.get("Last-Modified", "")),
+        )
+        if response is not None:
+            for header, value in validators.items():
+                response[header] = value
+            response[PAGE_CACHE_HEADER] = "hit"
+            _shared_cache_headers(response, entry.get("tags", ()))
+            if shared:
+                _stack_headers(request, response, entry)
+            return response
+    content = entry["content"]
+    if CSRF_PLACEHOLDER in content:
+        # per-visitor token (not available in front of the CSRF middleware, see AnonymousPageCacheMiddleware)
+        content = content.replace(CSRF_PLACEHOLDER, b"" if shared else get_token(request).encode())
+    response = HttpResponse(content, content_type=entry["content_type"])
+    for header, value in validators.items():
+        response[header] = value
+    response[PAGE_CACHE_HEADER] = "hit"
+    _shared_cache_headers(response, entry.get("tags", ()))
+    if shared:
+        _stack_headers(request, response, entry)
+    return response
+
+
+def cache_public_page(timeout: int | None = None, tags=()):
+    """
+    View decorator for public list/detail pages; serves anonymous GET/HEAD requests from hot_cache.
+    Pages are tagged with `tags` (e.g. the listed model), the rendered detail object and whatever
+    the view declared via add_cache_tags. Works with TemplateResponse as well as plain responses,
+    and with async views (decorate their async `get`; lookups then use the async cache API).
+    """
+    static_tags = tags_for(*tags)
+
+    def decorator(view_func):
+        def _lookup(request):
+            key = page_cache_key(request)
+            return key, get_tagged(key)
+
+        async def _alookup(request):
+            key = page_cache_key(request, generation=await apage_generation())
+            return key, await aget_tagged(key)
+
+        def _finish(request, key, started_at, response):
+            ttl = timeout if timeout is not None else getattr(settings, "PAGE_CACHE_TIMEOUT", 300)
+
+            def _store(rendered):
+                if not _is_cacheable_response(rendered):
+                    return
+                page_tags = static_tags | _response_tags(request, rendered)
+                if set_tagged(key, _pack(rendered, page_tags), page_tags, ttl, started_at=started_at):
+                    rendered[PAGE_CACHE_HEADER] = "miss"
+                _shared_cache_headers(rendered, page_tags)
+
+            if getattr(response, "is_rendered", True):
+                _store(response)
+            else:
+                response.add_post_render_callback(_store)
+            return response
+
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def _async_wrapped(request, *args, **kwargs):
+                if not _is_cacheable_request(request):
+                    return await view_func(request, *args, **kwargs)
+                key, entry = await _alookup(request)
+                if entry is not None:
+                    return _unpack(request, entry)
+                started_at = time.time_ns()
+                response = await view_func(request, *args, **kwargs)
+                if getattr(response, "is_rendered", True):
+                    return await sync_to_async(_finish)(request, key, started_at, response)
+                return _finish(request, key, started_at, response)
+
+            return _async_wrapped
+
+        @wraps(view_func)
+        def _wrapped(request, *args, **kwargs):
+            if not _is_cacheable_request(request):
+                return view_func(request, *args, **kwargs)
+
+            key, entry = _lookup(request)
+            if entry is not None:
+                return _unpack(request, entry)
+
+            started_at = time.time_ns()
+            return _finish(request, key, started_at, view_func(request, *args, **kwargs))
+
+        return _wrapped
+
+    return decorator
+
+
+class AnonymousPageCacheMiddleware:
+    """
+    Anonymous full-page cache mode (PAGE_CACHE_ANONYMOUS). Sits in front of the session, CSRF and auth
+    middleware and answers anonymous GET/HEAD requests for language-prefixed pages stored by cache_public_page
+    straight from hot_cache (key: language from the path, host, path, query). On the way out it strips
+    Vary: Cookie from shareable pages, so a CDN keeps one copy per URL; the CDN itself must bypass its cache
+    for requests that carry the session or messages cookie. The CDN purges of a request (core.cdn) leave
+    as one task when it ends.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with purge_batch():
+            return self._respond(request)
+
+    async def __acall__(self, request):
+        async with apurge_batch():
+            if not anonymous_page_cache() or not _is_cacheable_request(request):
+                return await self.get_response(request)
+            language = get_language_from_path(request.path_info)
+            if language:
+                generation = await apage_generation()
+                entry = await aget_tagged(page_cache_key(request, generation=generation, language=language))
+                if entry is not None:
+                    return _unpack(request, entry, shared=True)
+            return self._share(await self.get_response(request))
+
+    def _respond(self, request):
+        if not anonymous_page_cache() or not _is_cacheable_request(request):
+            return self.get_response(request)
+        language = get_language_from_path(request.path_info)
+        if language:
+            entry = get_tagged(page_cache_key(request, language=language))
+            if entry is not None:
+                return _unpack(request, entry, shared=True)
+        return self._share(self.get_response(request))
+
+    def _share(self, response):
+        if response.has_header(SURROGATE_KEY_HEADER):
+            if response.cookies:
+                # set further down the stack (e.g. a CSRF cookie); never share such a response
+                del response[SURROGATE_KEY_HEADER]
+                patch_cache_control(response, private=True)
+            else:
+                vary = [v.strip() for v in response.get("Vary", "").split(",") if v.strip()]
+                remaining = [v for v in vary if v.lower() != "cookie"]
+                if remaining:
+                    response["Vary"] = ", ".join(remaining)
+                elif vary:
+                    del response["Vary"]
+        return response
@@ -0,0 +1,159 @@
+# core/cdn.py
+"""
+Purge targets for the CDN in front of the anonymous page cache (PAGE_CACHE_ANONYMOUS). Public pages carry
+their cache tags as Surrogate-Key header (core.cache), and invalidate_tags() sends the same tags here, so the
+CDN copy of a page is purged together with the in-process one. SURROGATE_PURGE_BACKEND selects the target.
+Purges leave the request: keys are collected per transaction and per request (purge_batch, opened by
+core.cache.AnonymousPageCacheMiddleware) and sent by one Celery task at its end (core.tasks).
+"""
+from __future__ import annotations
+
+import functools
+import urllib.request
+from collections.abc import Iterable
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from core.batching import collect_on_commit
+
+
+class NullPurgeBackend:
+    """No CDN in front of the site."""
+
+    def purge(self, keys: list[str]) -> None:
+        pass
+
+    def purge_all(self) -> None:
+        pass
+
+
+class LocalPurgeBackend:
+    """
+    In-process stand-in for development and tests: records what would have been purged.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def purge(self, keys: list[str]) -> None:
+        self.purged.append(keys)
+
+    def purge_all(self) -> None:
+        self.purged_all += 1
+
+    def reset(self) -> None:
+        self.purged: list[list[str]] = []
+        self.purged_all = 0
+
+
+class FastlyPurgeBackend:
+    """
+    Fastly's purge API: keys are purged in batches through the Surrogate-Key header
+    (SURROGATE_PURGE_SERVICE_ID, SURROGATE_PURGE_TOKEN).
+    """
+    api_url = "https://api.fastly.com"
+    batch_size = 256
+    timeout = 5
+
+    def _post(self, path: str, headers: dict | None = None) -> None:
+        request = urllib.request.Request(
+            f"{self.api_url}/service/{settings.SURROGATE_PURGE_SERVICE_ID}/{path}",
+            method="POST",
+            headers={"Fastly-Key": settings.SURROGATE_PURGE_TOKEN, "Accept": "application/json", **(headers or {})},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def purge(self, keys: list[str]) -> None:
+        for start in range(0, len(keys), self.batch_size):
+            self._post("purge", {"Surrogate-Key": " ".join(keys[start:start + self.batch_size])})
+
+    def purge_all(self) -> None:
+        self._post("purge_all")
+
+
+@functools.cache
+def _load_backend(path: str):
+    return import_string(path)()
+
+
+@receiver(setting_changed)
+def _reset_backend(*, setting, **kwargs):
+    if setting == "SURROGATE_PURGE_BACKEND":
+        _load_backend.cache_clear()
+
+
+def purge_backend():
+    """The configured backend; one instance per process."""
+    return _load_backend(getattr(settings, "SURROGATE_PURGE_BACKEND", "core.cdn.NullPurgeBackend"))
+
+
+PURGE_ALL = "*"
+
+_batch: ContextVar[set | None] = ContextVar("cdn_purge_batch", default=None)
+
+
+def _enqueue(keys: set) -> None:
+    from core.tasks import purge_all_pages_task, purge_surrogate_keys_task
+
+    if PURGE_ALL in keys:
+        purge_all_pages_task.delay()
+    else:
+        purge_surrogate_keys_task.delay(sorted(keys))
+
+
+def _collect(keys: set) -> None:
+    batch = _batch.get()
+    if batch is None:
+        _enqueue(keys)
+    else:
+        batch.update(keys)
+
+
+@contextmanager
+def purge_batch():
+    """
+    Collects the purges made inside (e.g. a request, including its commit hooks) and queues them as one task.
+    """
+    token = _batch.set(set())
+    try:
+        yield
+    finally:
+        keys = _batch.get()
+        _batch.reset(token)
+        if keys:
+            _enqueue(keys)
+
+
+@asynccontextmanager
+async def apurge_batch():
+    """
+    purge_batch for async code; sync_to_async threads see the same batch, and the task is queued off the loop.
+    """
+    token = _batch.set(set())
+    try:
+        yield
+    finally:
+        keys = _batch.get()
+        _batch.reset(token)
+        if keys:
+            await sync_to_async(_enqueue)(keys)
+
+
+def purge_surrogate_keys(keys: Iterable[str]) -> None:
+    """
+    Queues the CDN purge of keys once the transaction commits; rolled-back transactions purge nothing.
+    """
+    if not isinstance(purge_backend(), NullPurgeBackend):
+        collect_on_commit(_collect, keys)
+
+
+def purge_all_pages() -> None:
+    if not isinstance(purge_backend(), NullPurgeBackend):
+        collect_on_commit(_collect, [PURGE_ALL])
@@ -0,0 +1,221 @@
+# core/conditional.py
+"""
+Conditional GET for public pages and APIs: views compute cheap validators (ETag, Last-Modified) from
+updated_at, last_published_revision_id and the cache-tag versions of what they show (bumped by every purge,
+see core.cache.invalidate_tags), answer If-None-Match / If-Modified-Since with 304 before any context is
+built, and send the validators with full responses. Lists use max(updated_at) and the row count of
+their queryset (one aggregate query). The a-prefixed functions and the Async* mixins do the same for async
+views with the async ORM and cache API.
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.db import models
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.utils.translation import get_language
+
+from core.cache import (
+    apage_generation,
+    atag_versions,
+    page_generation,
+    tag_for,
+    tag_versions,
+    tags_for,
+)
+from core.pagination import apaginate_queryset
+
+Validators = tuple[str | None, datetime.datetime | None]
+
+
+def _from_ns(value: int) -> datetime.datetime | None:
+    return datetime.datetime.fromtimestamp(value / 1e9, tz=datetime.UTC) if value else None
+
+
+def _viewer(request) -> str:
+    # logged-in pages carry per-user parts (account menu, editor links)
+    user = getattr(request, "user", None)
+    return str(user.pk) if user is not None and user.is_authenticated else ""
+
+
+async def _aviewer(request) -> str:
+    if not hasattr(request, "auser"):
+        return ""
+    user = await request.auser()
+    return str(user.pk) if user.is_authenticated else ""
+
+
+def _combine(viewer: str, parts, versions: dict[str, int], generation: int, last_modified) -> Validators:
+    raw = "|".join(
+        [get_language() or "", viewer, str(generation)]
+        + [f"{tag}={versions[tag]}" for tag in sorted(versions)]
+        + [str(part) for part in parts]
+    )
+    etag = f'W/"{hashlib.md5(raw.encode()).hexdigest()}"'
+    moments = [m for m in (last_modified, _from_ns(max(versions.values(), default=0)), _from_ns(generation)) if m]
+    return etag, max(moments) if moments else None
+
+
+def build_validators(request, parts, tags, last_modified=None) -> Validators:
+    """
+    Weak ETag over parts, the language, the viewer, the page generation and the versions of tags;
+    Last-Modified is the latest of last_modified and those purges.
+    """
+    return _combine(_viewer(request), parts, tag_versions(tags), page_generation(), last_modified)
+
+
+async def abuild_validators(request, parts, tags, last_modified=None) -> Validators:
+    return _combine(await _aviewer(request), parts, await atag_versions(tags), await apage_generation(), last_modified)
+
+
+def _object_parts(obj, extra_parts, related) -> tuple[list, list[str], datetime.datetime | None]:
+    updated_at = getattr(obj, "updated_at", None)
+    parts = [
+        tag_for(obj), updated_at and updated_at.isoformat(), getattr(obj, "last_published_revision_id", None),
+        *extra_parts,
+    ]
+    return parts, [tag_for(obj), tag_for(type(obj)), *tags_for(*related)], updated_at
+
+
+def object_validators(request, obj, *extra_parts, related=()) -> Validators:
+    """
+    Validators of a detail page. Other items of the object's model (related teasers) are covered by its
+    model tag; `related` names further models or objects the page renders (e.g. the tools of a use case),
+    whose tags are folded in as well.
+    """
+    if not isinstance(obj, models.Model) or obj.pk is None:
+        return None, None
+    return build_validators(request, *_object_parts(obj, extra_parts, related))
+
+
+async def aobject_validators(request, obj, *extra_parts, related=()) -> Validators:
+    if not isinstance(obj, models.Model) or obj.pk is None:
+        return None, None
+    return await abuild_validators(request, *_object_parts(obj, extra_parts, related))
+
+
+def _queryset_parts(queryset, stats: dict, extra_parts) -> tuple[list, list[str], datetime.datetime | None]:
+    last = stats["last"]
+    parts = [tag_for(queryset.model), last and last.isoformat(), stats["count"], *extra_parts]
+    return parts, [tag_for(queryset.model)], last
+
+
+def queryset_validators(request, queryset, *extra_parts) -> Validators:
+    stats = queryset.order_by().aggregate(last=Max("updated_at"), count=Count("pk"))
+    return build_validators(request, *_queryset_parts(queryset, stats, extra_parts))
+
+
+async def aqueryset_validators(request, queryset, *extra_parts) -> Validators:
+    stats = await queryset.order_by().aaggregate(last=Max("updated_at"), count=Count("pk"))
+    return await abuild_validators(request, *_queryset_parts(queryset, stats, extra_parts))
+
+
+def not_modified(request, etag: str | None, last_modified: datetime.datetime | None):
+    """
+    The 304 (or 412) response for a request whose validators still match, else None.
+    """
+    if etag is None and last_modified is None:
+        return None
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+
+def set_validators(response, etag: str | None, last_modified: datetime.datetime | None):
+    if response.status_code in (200, 304):
+        if etag and not response.has_header("ETag"):
+            response["ETag"] = etag
+        if last_modified and not response.has_header("Last-Modified"):
+            response["Last-Modified"] = http_date(int(last_modified.timestamp()))
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    For class-based views (before the generic view in the bases): get_validators() runs first and a
+    matching conditional request ends there with a 304.
+    """
+
+    def get_validators(self) -> Validators:
+        return None, None
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        return set_validators(response, etag, last_modified)
+
+
+class ConditionalDetailMixin:
+    """
+    DetailView.get with validators from the detail object: get_object() runs once, and
+    get_context_data()/rendering only when the client's copy is outdated. related_models lists the
+    other models whose content the page renders.
+    """
+    related_models: tuple = ()
+
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        etag, last_modified = object_validators(request, self.object, related=self.related_models)
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            response = self.render_to_response(self.get_context_data(object=self.object))
+        return set_validators(response, etag, last_modified)
+
+
+class ConditionalListMixin(ConditionalGetMixin):
+    """
+    Validators from max(updated_at) and the size of the view's queryset.
+    """
+
+    def get_validators(self) -> Validators:
+        return queryset_validators(self.request, self.get_queryset())
+
+
+
+class AsyncConditionalDetailMixin:
+    """
+    ConditionalDetailMixin for async views: the object comes from aget_object() and the validators from the
+    async cache API; get_context_data(), which follows relations, runs through sync_to_async, and the
+    handler renders the TemplateResponse in a thread as usual.
+    """
+    related_models: tuple = ()
+
+    async def aget_object(self):
+        return await sync_to_async(self.get_object)()
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        etag, last_modified = await aobject_validators(request, self.object, related=self.related_models)
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            context = await sync_to_async(self.get_context_data)(object=self.object)
+            response = self.render_to_response(context)
+        return set_validators(response, etag, last_modified)
+
+
+class AsyncConditionalListMixin:
+    """
+    ConditionalListMixin for async ListViews: the validators (one aaggregate), the count and the rows of the
+    page come from the async ORM before get_context_data() runs; it gets that page from paginate_queryset().
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = self.get_queryset()
+        etag, last_modified = await aqueryset_validators(request, self.object_list)
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            page_size = self.get_paginate_by(self.object_list)
+            if page_size:
+                self._fetched_page = await apaginate_queryset(self, self.object_list, page_size)
+            context = await sync_to_async(self.get_context_data)()
+            response = self.render_to_response(context)
+        return set_validators(response, etag, last_modified)
+
+    def paginate_queryset(self, queryset, page_size):
+        fetched = getattr(self, "_fetched_page", None)
+        return fetched if fetched is not None else super().paginate_queryset(queryset, page_size)
@@ -0,0 +1,89 @@
+# core/events.py
+"""
+Editorial event bus; content_changed fires after a workflow transition has been saved and committed, and
+("update") after a published item without a live snapshot was edited (core.signals).
+Receivers get sender (model class), instance, action, languages, old_slugs and new_slugs ({language: slug}).
+"""
+from django.db import transaction
+from django.dispatch import Signal
+from parler.utils.context import switch_language
+
+content_changed = Signal()
+
+EVENT_TRANSITIONS = ("publish", "archive", "restore", "move_to_review")
+LIVE_EDIT_EVENT = "update"
+
+
+def snapshot_slugs(live_i18n) -> dict[str, str]:
+    """
+    Public slug per language as recorded in a live_i18n snapshot.
+    """
+    slugs = {}
+    for lang, data in (live_i18n or {}).items():
+        slug = (data or {}).get("public_slug") or (data or {}).get("slug")
+        if slug:
+            slugs[lang] = slug
+    return slugs
+
+
+def public_slugs(instance) -> dict[str, str]:
+    """
+    Public slug per language right now; empty unless the instance is published.
+    """
+    if getattr(instance, "status", None) != getattr(instance, "STATUS_PUBLISHED", "published"):
+        return {}
+    # comparisons have no public_slug; their slug is public
+    fields = [name for name in ("public_slug", "slug") if name in instance._parler_meta.get_all_fields()]
+    slugs = {}
+    for lang in instance.get_available_languages():
+        with switch_language(instance, lang):
+            slug = next(filter(None, (instance.safe_translation_getter(name) for name in fields)), None)
+        if slug:
+            slugs[lang] = slug
+    return slugs
+
+
+def begin_event(instance) -> None:
+    """
+    Called before a transition runs; publish rewrites live_i18n, so the old slugs are taken here.
+    """
+    if not hasattr(instance, "_content_events"):
+        instance._content_events = []
+        instance._content_old_slugs = snapshot_slugs(getattr(instance, "live_i18n", None))
+
+
+def queue_event(instance, action: str) -> None:
+    begin_event(instance)
+    instance._content_events.append(action)
+
+
+def take_events(instance) -> tuple[list[str], dict[str, str]]:
+    """
+    Removes and returns the queued actions and the old slugs, for callers that send the events themselves.
+    """
+    actions = instance.__dict__.pop("_content_events", None) or []
+    old_slugs = instance.__dict__.pop("_content_old_slugs", None) or {}
+    return actions, old_slugs
+
+
+def flush_events(instance) -> None:
+    """
+    Sends the queued events once the surrounding transaction commits, so receivers see saved state.
+    """
+    if not getattr(instance, "_content_events", None):
+        return
+    actions, old_slugs = take_events(instance)
+
+    payload = {
+        "instance": instance,
+        "languages": list(instance.get_available_languages()),
+        "old_slugs": old_slugs,
+        "new_slugs": public_slugs(instance),
+    }
+    sender = type(instance)
+
+    def _send():
+        for action in actions:
+            content_changed.send(sender=sender, action=action, **payload)
+
+    transaction.on_commit(_send)
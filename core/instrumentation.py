@@ -0,0 +1,231 @@
+# core/instrumentation.py
+"""
+Per-request metrics: SQL query count and time, cache hits/misses, fragment cache hits/misses, template render
+time and total latency.
+RequestMetricsMiddleware logs them as structured fields (logger "mentoroai.requests", rendered by
+mentoroai.logging.JsonFormatter in production) and exposes them as a Server-Timing header.
+Views can declare a query budget for the queries issued by the view and its template (middleware work such as
+loading the session is not counted); exceeding it logs a warning, or raises QueryBudgetExceeded when
+QUERY_BUDGET_STRICT is on (test runs), so N+1 regressions fail the suite.
+Fragment lookups are also counted per fragment name for the life of the process (fragment_stats), which shows
+which cached partials actually pay off.
+Queries are counted by an execute wrapper installed on every connection when it is opened; it reports to the
+RequestMetrics of the current context, which sync_to_async carries into its threads, so the queries of async
+views are counted as well.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger("mentoroai.requests")
+
+_current: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class RequestMetrics:
+    queries: int = 0
+    view_queries: int = 0
+    sql_ms: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    fragment_hits: int = 0
+    fragment_misses: int = 0
+    template_ms: float = 0.0
+    total_ms: float = 0.0
+
+    def as_fields(self) -> dict:
+        return {k: round(v, 2) if isinstance(v, float) else v for k, v in asdict(self).items()}
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            [
+                f'db;dur={self.sql_ms:.1f};desc="{self.queries} queries"',
+                f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+                f'frag;desc="{self.fragment_hits} hits, {self.fragment_misses} misses"',
+                f"tpl;dur={self.template_ms:.1f}",
+                f"total;dur={self.total_ms:.1f}",
+            ]
+        )
+
+
+def current_metrics() -> RequestMetrics | None:
+    return _current.get()
+
+
+def record_cache_lookup(hit: bool) -> None:
+    metrics = _current.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+_fragment_counts: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+_fragment_lock = threading.Lock()
+
+
+def record_fragment_lookup(name: str, hit: bool) -> None:
+    with _fragment_lock:
+        _fragment_counts[name][0 if hit else 1] += 1
+    metrics = _current.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.fragment_hits += 1
+    else:
+        metrics.fragment_misses += 1
+
+
+def fragment_stats() -> dict[str, dict]:
+    """
+    {fragment name: {"hits", "misses", "hit_ratio"}} since the process started (or reset_fragment_stats).
+    """
+    with _fragment_lock:
+        counts = {name: tuple(pair) for name, pair in _fragment_counts.items()}
+    return {
+        name: {"hits": hits, "misses": misses, "hit_ratio": round(hits / (hits + misses), 3)}
+        for name, (hits, misses) in sorted(counts.items())
+    }
+
+
+def reset_fragment_stats() -> None:
+    with _fragment_lock:
+        _fragment_counts.clear()
+
+
+def query_budget(limit: int):
+    """
+    Decorator for function views; class-based views set a `query_budget` class attribute instead.
+    """
+
+    def decorator(view_func):
+        view_func.query_budget = limit
+        return view_func
+
+    return decorator
+
+
+def _budget_for(view_func) -> int | None:
+    budget = getattr(view_func, "query_budget", None)
+    if budget is None:
+        budget = getattr(getattr(view_func, "view_class", None), "query_budget", None)
+    return budget
+
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.sql_ms += (time.perf_counter() - started) * 1000
+
+
+def install_query_recorder(sender, connection, **kwargs) -> None:
+    """
+    connection_created receiver (connected in core.apps); connections are per thread, so a wrapper entered
+    by the middleware would miss the queries sync_to_async runs in its executor threads.
+    """
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class RequestMetricsMiddleware:
+    """
+    Must be the first entry in MIDDLEWARE: it measures everything below it, and its
+    process_template_response runs last, so the render it times is the final one.
+    Template time includes post-render callbacks (e.g. storing the page in the page cache).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics, started)
+
+    def _finish(self, request, response, metrics: RequestMetrics, started: float):
+        metrics.total_ms = (time.perf_counter() - started) * 1000
+        if hasattr(request, "_queries_before_view"):
+            metrics.view_queries = metrics.queries - request._queries_before_view
+        self._report(request, response, metrics)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._query_budget = _budget_for(view_func)
+        metrics = _current.get()
+        request._queries_before_view = metrics.queries if metrics else 0
+
+    def process_template_response(self, request, response):
+        metrics = _current.get()
+        if metrics is not None and not response.is_rendered:
+            started = time.perf_counter()
+            response.render()
+            metrics.template_ms += (time.perf_counter() - started) * 1000
+        return response
+
+    def _report(self, request, response, metrics: RequestMetrics) -> None:
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else None
+        budget = getattr(request, "_query_budget", None)
+        over_budget = budget is not None and metrics.view_queries > budget
+
+        if getattr(settings, "SERVER_TIMING", True):
+            response["Server-Timing"] = metrics.server_timing()
+
+        logger.log(
+            logging.WARNING if over_budget else logging.INFO,
+            "%s %s %s",
+            request.method,
+            request.path,
+            response.status_code,
+            extra={
+                "view": view,
+                "status": response.status_code,
+                "query_budget": budget,
+                **metrics.as_fields(),
+            },
+        )
+        if over_budget and getattr(settings, "QUERY_BUDGET_STRICT", False):
+            raise QueryBudgetExceeded(f"{view or request.path}: {metrics.view_queries} queries, budget {budget}")
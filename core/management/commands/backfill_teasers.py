@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from core.services import sync_teaser_entries
+from guides.models import Guide
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+
+class Command(BaseCommand):
+    help = "Backfills the TeaserEntry read-model for existing Guides, Prompts and UseCases."
+
+    def handle(self, *args, **options):
+        for model in (Guide, Prompt, UseCase):
+            count = 0
+            for obj in model.objects.prefetch_related("translations").iterator(chunk_size=200):
+                sync_teaser_entries(obj)
+                count += 1
+            self.stdout.write(f"{model._meta.label}: {count} object(s) synced")
+        self.stdout.write(self.style.SUCCESS("Teaser entries backfilled."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from core.related import GRAPH_MODELS, rebuild_related
+
+
+class Command(BaseCommand):
+    help = "Computes the related-content graph (top-K neighbours per item and language) for Guides, Prompts and UseCases."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kind", choices=sorted(GRAPH_MODELS), help="Only rebuild one content kind.")
+
+    def handle(self, *args, **options):
+        kinds = [options["kind"]] if options.get("kind") else list(GRAPH_MODELS)
+        for kind in kinds:
+            edges = rebuild_related(kind)
+            self.stdout.write(f"{kind}: {edges} edge(s) written")
+        self.stdout.write(self.style.SUCCESS("Related-content graph rebuilt."))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.sitemaps import SITEMAPS, build_sitemaps, site_languages
+
+
+class Command(BaseCommand):
+    help = "Prebuilds the gzipped sitemap shards and the sitemap index (all languages and sections by default)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--language", action="append", dest="languages", help="Only this language (repeatable).")
+        parser.add_argument("--section", action="append", dest="sections", help="Only this section (repeatable).")
+
+    def handle(self, *args, languages=None, sections=None, **options):
+        unknown = set(languages or ()) - set(site_languages()) | set(sections or ()) - set(SITEMAPS)
+        if unknown:
+            raise CommandError(f"Unknown language/section: {', '.join(sorted(unknown))}")
+        total = build_sitemaps(languages=languages, sections=sections)
+        self.stdout.write(self.style.SUCCESS(f"Sitemaps built: {total} URL(s)."))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.cache import bump_page_generation, invalidate_tags
+
+
+class Command(BaseCommand):
+    help = (
+        "Purges cached public pages, in the page cache and at the CDN (surrogate keys): "
+        "by cache tag (e.g. guides.guide or guides.guide:12) or all of them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tag", action="append", dest="tags", help="Cache tag / surrogate key (repeatable).")
+        parser.add_argument("--all", action="store_true", help="Every cached page.")
+
+    def handle(self, *args, tags=None, **options):
+        if options["all"]:
+            bump_page_generation()
+            self.stdout.write(self.style.SUCCESS("All cached pages purged."))
+        elif tags:
+            invalidate_tags(*tags)
+            self.stdout.write(self.style.SUCCESS(f"Purged {len(tags)} tag(s)."))
+        else:
+            raise CommandError("Pass --tag (repeatable) or --all.")
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from catalog.models import Tool
+from compare.models import Comparison
+from core.search import sync_search_documents
+from glossary.models import GlossaryTerm
+from guides.models import Guide
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the SearchDocument index (rows and tsvectors) for all searchable content types."
+
+    def handle(self, *args, **options):
+        for model in (Guide, Prompt, UseCase, Comparison, Tool):
+            count = 0
+            for obj in model.objects.prefetch_related("translations").iterator(chunk_size=200):
+                sync_search_documents(obj)
+                count += 1
+            self.stdout.write(f"{model._meta.label}: {count} object(s) indexed")
+
+        count = 0
+        for term in GlossaryTerm.objects.iterator(chunk_size=500):
+            sync_search_documents(term)
+            count += 1
+        self.stdout.write(f"{GlossaryTerm._meta.label}: {count} object(s) indexed")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
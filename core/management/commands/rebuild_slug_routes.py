@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from core.routing import sync_slug_routes
+from guides.models import Guide
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the SlugRoute table from the live_i18n snapshots of Guides, Prompts and UseCases."
+
+    def handle(self, *args, **options):
+        for model in (Guide, Prompt, UseCase):
+            count = 0
+            for obj in model.objects.exclude(live_i18n={}).only("pk", "live_i18n").iterator():
+                sync_slug_routes(obj)
+                count += 1
+            self.stdout.write(f"{model._meta.label}: {count} object(s) synced")
+        self.stdout.write(self.style.SUCCESS("Slug routes rebuilt."))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from catalog.models import Tool
+from content.rendering import RENDERED_FIELDS, render, render_translation
+from guides.models import Guide, GuideSection
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfills the stored richtext renderings (sanitized HTML, text, word count, excerpt) of all translations "
+        "and live snapshots, e.g. after changing the sanitizer allow-lists."
+    )
+
+    def handle(self, *args, **options):
+        for model in (Guide, GuideSection, Prompt, UseCase, Tool):
+            fields = RENDERED_FIELDS[model._meta.label_lower]
+            Translation = model._parler_meta.root_model
+            rows = list(Translation.objects.all())
+            for row in rows:
+                row.rendered = render_translation(row, fields)
+            with transaction.atomic():
+                Translation.objects.bulk_update(rows, ["rendered"], batch_size=200)
+
+            masters = []
+            if any(f.name == "live_i18n" for f in model._meta.fields):
+                masters = list(model.objects.exclude(live_i18n={}))
+                for obj in masters:
+                    for snapshot in obj.live_i18n.values():
+                        snapshot["rendered"] = {f: render(snapshot.get(f)) for f in fields if f in snapshot}
+                with transaction.atomic():
+                    model.objects.bulk_update(masters, ["live_i18n"], batch_size=200)
+            self.stdout.write(f"{model._meta.label}: {len(rows)} translation(s), {len(masters)} snapshot(s)")
+        self.stdout.write(self.style.SUCCESS("Richtext renderings backfilled."))
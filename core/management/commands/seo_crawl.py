@@ -0,0 +1,100 @@
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import SeoCheckRun
+from core.seo.checker import diff_runs, execute_run
+from core.sitemaps import SITEMAPS, site_languages, sitemap_locations
+
+
+class Command(BaseCommand):
+    help = (
+        "Checks every sitemap URL (all languages and sections by default) for SEO tags, stores the results as a "
+        "SeoCheckRun and compares them with the previous crawl, including response time and HTML size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--language", action="append", dest="languages", help="Only this language (repeatable).")
+        parser.add_argument("--section", action="append", dest="sections", help="Only this section (repeatable).")
+        parser.add_argument("--workers", type=int, help="Concurrent checks (default: SEO_CHECK_WORKERS).")
+        parser.add_argument("--host", help="Host to render the pages for (default: the SITE_URL host).")
+        parser.add_argument("--compare", type=int, help="Run id to compare with (default: the previous crawl).")
+        parser.add_argument("--threshold", type=float, default=20.0, help="Regression threshold in percent.")
+        parser.add_argument("--min-ms", type=int, default=50, help="Ignore response time changes below this.")
+        parser.add_argument("--top", type=int, default=10, help="Number of slowest/largest pages to list.")
+        parser.add_argument("--fail-on-regression", action="store_true", help="Exit with an error on regressions.")
+
+    def handle(self, *args, languages=None, sections=None, **options):
+        unknown = set(languages or ()) - set(site_languages()) | set(sections or ()) - set(SITEMAPS)
+        if unknown:
+            raise CommandError(f"Unknown language/section: {', '.join(sorted(unknown))}")
+
+        base = self._base_run(options["compare"])
+        site = urlsplit(getattr(settings, "SITE_URL", "") or "https://localhost")
+        paths = list(dict.fromkeys(urlsplit(url).path or "/" for url in sitemap_locations(languages, sections)))
+        workers = options["workers"] if options["workers"] is not None else getattr(settings, "SEO_CHECK_WORKERS", 4)
+        workers = max(workers, 1)
+        run = SeoCheckRun.objects.create(
+            source=SeoCheckRun.SOURCE_CRAWL,
+            host=options["host"] or site.netloc,
+            secure=site.scheme != "http",
+            paths=paths,
+        )
+        self.stdout.write(f"Crawl #{run.pk}: {len(paths)} URL(s), {workers} worker(s)")
+
+        def progress(row):
+            if options["verbosity"] >= 2:
+                self.stdout.write(f"  {row.status_code} {row.response_ms} ms {row.html_bytes} B {row.path}")
+
+        run = execute_run(run.pk, workers=workers, on_result=progress)
+        if run.status == SeoCheckRun.STATUS_FAILED:
+            raise CommandError(f"Crawl #{run.pk} failed: {run.error}")
+
+        results = list(run.results.all())
+        self._summary(results, options["top"])
+        regressions = self._compare(base, run, options["threshold"] / 100, options["min_ms"]) if base else 0
+        if regressions and options["fail_on_regression"]:
+            raise CommandError(f"{regressions} performance regression(s) compared with run #{base.pk}.")
+        self.stdout.write(self.style.SUCCESS(f"Crawl #{run.pk} finished."))
+
+    def _base_run(self, run_id):
+        if run_id is None:
+            return SeoCheckRun.objects.filter(
+                source=SeoCheckRun.SOURCE_CRAWL, status=SeoCheckRun.STATUS_DONE
+            ).first()
+        base = SeoCheckRun.objects.filter(pk=run_id).first()
+        if base is None:
+            raise CommandError(f"Unknown run: {run_id}")
+        return base
+
+    def _summary(self, results, top):
+        failing = [r for r in results if r.status_code != 200]
+        errors = [r for r in results if any(i.get("level") == "error" for i in r.issues)]
+        self.stdout.write(f"{len(results)} checked, {len(failing)} non-200, {len(errors)} with errors")
+        for r in failing:
+            self.stdout.write(self.style.ERROR(f"  HTTP {r.status_code} {r.path}"))
+
+        timed = [r for r in results if r.response_ms is not None]
+        if timed:
+            self.stdout.write("Slowest:")
+            for r in sorted(timed, key=lambda r: r.response_ms, reverse=True)[:top]:
+                self.stdout.write(f"  {r.response_ms:>6} ms  {r.path}")
+            self.stdout.write("Largest:")
+            for r in sorted(timed, key=lambda r: r.html_bytes or 0, reverse=True)[:top]:
+                self.stdout.write(f"  {r.html_bytes:>8} B  {r.path}")
+
+    def _compare(self, base, run, threshold, min_ms) -> int:
+        self.stdout.write(f"Compared with run #{base.pk}:")
+        regressions = 0
+        for diff in diff_runs(base, run):
+            changes = diff.changes()
+            slower = diff.regressions(threshold, min_ms)
+            if changes:
+                self.stdout.write(f"  {diff.path}: {'; '.join(changes)}")
+            if slower:
+                regressions += 1
+                self.stdout.write(self.style.WARNING(f"  {diff.path}: {'; '.join(slower)}"))
+        if not regressions:
+            self.stdout.write("  no performance regressions")
+        return regressions
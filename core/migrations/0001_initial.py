@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-17 17:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlugRoute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('language', models.CharField(max_length=15, verbose_name='Language')),
+                ('slug', models.SlugField(max_length=220, verbose_name='Slug')),
+                ('is_live', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Slug route',
+                'verbose_name_plural': 'Slug routes',
+                'indexes': [models.Index(fields=['content_type', 'slug'], name='slugroute_type_slug_idx'), models.Index(fields=['content_type', 'object_id'], name='slugroute_type_object_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'language', 'slug'), name='uniq_slugroute_type_language_slug')],
+            },
+        ),
+    ]
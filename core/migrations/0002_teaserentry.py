@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-17 17:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TeaserEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('guide', 'Guide'), ('prompt', 'Prompt'), ('usecase', 'Usecase')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('language', models.CharField(max_length=15, verbose_name='Language')),
+                ('title', models.CharField(max_length=250, verbose_name='Title')),
+                ('teaser', models.TextField(blank=True, verbose_name='Teaser')),
+                ('url', models.CharField(max_length=300)),
+                ('date', models.DateTimeField(blank=True, null=True)),
+                ('badge', models.CharField(max_length=30)),
+            ],
+            options={
+                'verbose_name': 'Teaser entry',
+                'verbose_name_plural': 'Teaser entries',
+                'indexes': [models.Index(fields=['language', '-date'], name='teaserentry_language_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id', 'language'), name='uniq_teaserentry_kind_object_language')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-17 17:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_teaserentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('language', models.CharField(max_length=15, verbose_name='Language')),
+                ('related_id', models.PositiveIntegerField()),
+                ('score', models.PositiveIntegerField(default=0)),
+                ('rank', models.PositiveSmallIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Related item',
+                'verbose_name_plural': 'Related items',
+                'indexes': [models.Index(fields=['kind', 'object_id', 'language', 'rank'], name='relateditem_lookup_idx'), models.Index(fields=['kind', 'related_id'], name='relateditem_reverse_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id', 'language', 'related_id'), name='uniq_relateditem_edge')],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-17 18:05
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+def create_vector_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS searchdoc_vector_gin ON core_searchdocument USING gin (vector)"
+    )
+
+
+def drop_vector_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS searchdoc_vector_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_relateditem'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('guide', 'Guide'), ('prompt', 'Prompt'), ('usecase', 'Usecase'), ('comparison', 'Comparison'), ('tool', 'Tool'), ('glossary', 'Glossary')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('language', models.CharField(max_length=15, verbose_name='Language')),
+                ('title', models.CharField(max_length=250, verbose_name='Title')),
+                ('body', models.TextField(blank=True, verbose_name='Body')),
+                ('url', models.CharField(max_length=300)),
+                ('vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search document',
+                'verbose_name_plural': 'Search documents',
+                'indexes': [models.Index(fields=['language', 'kind'], name='searchdoc_language_kind_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id', 'language'), name='uniq_searchdocument_kind_object_language')],
+            },
+        ),
+        migrations.RunPython(create_vector_index, drop_vector_index),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-17 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_searchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SitemapFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(blank=True, max_length=15, verbose_name='Language')),
+                ('section', models.CharField(max_length=50)),
+                ('page', models.PositiveIntegerField(default=1)),
+                ('path', models.CharField(max_length=255)),
+                ('etag', models.CharField(max_length=64)),
+                ('url_count', models.PositiveIntegerField(default=0)),
+                ('last_modified', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Sitemap file',
+                'verbose_name_plural': 'Sitemap files',
+                'constraints': [models.UniqueConstraint(fields=('language', 'section', 'page'), name='uniq_sitemapfile_language_section_page')],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.8 on 2026-10-17 18:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_sitemapfile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeoCheckRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('host', models.CharField(max_length=255)),
+                ('secure', models.BooleanField(default=True)),
+                ('paths', models.JSONField(blank=True, default=list)),
+                ('crawl_sitemap', models.BooleanField(default=False)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('done', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'SEO check run',
+                'verbose_name_plural': 'SEO check runs',
+                'ordering': ['-created_at', '-pk'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SeoCheckResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=500)),
+                ('status_code', models.PositiveSmallIntegerField(default=0)),
+                ('issues', models.JSONField(blank=True, default=list)),
+                ('extracted', models.JSONField(blank=True, default=dict)),
+                ('checked_at', models.DateTimeField(auto_now_add=True)),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='core.seocheckrun')),
+            ],
+            options={
+                'verbose_name': 'SEO check result',
+                'verbose_name_plural': 'SEO check results',
+                'ordering': ['pk'],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-17 18:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_seocheck'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seocheckresult',
+            name='canonical',
+            field=models.CharField(blank=True, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='seocheckresult',
+            name='description_length',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='seocheckresult',
+            name='hreflang',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='seocheckresult',
+            name='html_bytes',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='seocheckresult',
+            name='response_ms',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='seocheckresult',
+            name='title_length',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='seocheckrun',
+            name='source',
+            field=models.CharField(choices=[('ops', 'Ops page'), ('crawl', 'Site crawl')], default='ops', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='seocheckresult',
+            index=models.Index(fields=['path', 'run'], name='core_seoche_path_a6e830_idx'),
+        ),
+    ]
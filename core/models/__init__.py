@@ -0,0 +1,6 @@
+from .related import RelatedItem  # noqa: F401
+from .routing import SlugRoute  # noqa: F401
+from .search import SearchDocument  # noqa: F401
+from .seo import SeoCheckResult, SeoCheckRun  # noqa: F401
+from .sitemaps import SitemapFile  # noqa: F401
+from .teasers import TeaserEntry  # noqa: F401
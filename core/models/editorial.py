@@ -1,5 +1,8 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import get_language
@@ -7,6 +10,56 @@ from django_fsm import transition, FSMField
 from parler.managers import TranslatableManager, TranslatableQuerySet
 from parler.utils.context import switch_language
 
+from core.routing import sync_slug_routes
+from core.urlbuilder import attach_urls
+
+_publishing: ContextVar[bool] = ContextVar("editorial_publishing", default=False)
+
+
+@contextmanager
+def publishing():
+    """
+    Marks a publish in progress; receivers that react to edits of child rows (guides.signals) stand down.
+    """
+    token = _publishing.set(True)
+    try:
+        yield
+    finally:
+        _publishing.reset(token)
+
+
+def is_publishing() -> bool:
+    return _publishing.get()
+
+
+def store_live_snapshots(objs) -> None:
+    """
+    Writes what publish computed in memory: the dependents' snapshots with one bulk_update per model
+    (across all objs), then the live slugs of each published object into SlugRoute.
+    """
+    published = [obj for obj in objs if "_live_snapshot_dependents" in obj.__dict__]
+    if not published:
+        return
+    by_model: dict = {}
+    for obj in published:
+        for row in obj.__dict__.pop("_live_snapshot_dependents"):
+            by_model.setdefault(type(row), []).append(row)
+    with transaction.atomic():
+        for model, rows in by_model.items():
+            model._default_manager.bulk_update(rows, ["live_i18n"], batch_size=200)
+        for obj in published:
+            sync_slug_routes(obj)
+
+
+def publish_content(obj, *, by, note="") -> None:
+    """
+    Publish pipeline: runs the transition (snapshots are computed in memory) and saves the object,
+    its translations and the dependents' snapshots in one transaction, with child-row signals suppressed.
+    """
+    with transaction.atomic(), publishing():
+        obj.publish(by=by, note=note)
+        obj.save()
+
 
 # -------- Manager --------
 
@@ -15,6 +68,20 @@ class EditorialQuerySet(TranslatableQuerySet):
     Parler-aware queryset with convenience filters for every workflow state (drafts, in_review, rework, published)
     and a visible_on_site scope that exposes published plus review only if a live revision exists.
     """
+    _display_language = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._display_language = self._display_language
+        return clone
+
+    def _fetch_all(self):
+        super()._fetch_all()
+        if self._display_language:
+            objs = [obj for obj in self._result_cache if isinstance(obj, EditorialWorkflowMixin)]
+            for obj in objs:
+                obj.attach_display_values(self._display_language)
+            attach_urls(objs, [self._display_language])
 
     def drafts(self):
         return self.filter(status=EditorialWorkflowMixin.STATUS_DRAFT).order_by("pk")
@@ -44,6 +111,16 @@ class EditorialQuerySet(TranslatableQuerySet):
             ).order_by("updated_at")
         )
 
+    def with_display_values(self, language: str | None = None):
+        """
+        Loads all translations with one prefetch query and resolves the display values
+        (live snapshot first, then the draft translation) and detail URLs once per row, so list templates
+        reading obj.display_title/display_intro/get_absolute_url run a constant number of queries per page.
+        """
+        clone = self.prefetch_related("translations")
+        clone._display_language = language or get_language()
+        return clone
+
 
 class EditorialManager(TranslatableManager.from_queryset(EditorialQuerySet)):  # type: ignore
     """
@@ -119,12 +196,15 @@ class EditorialWorkflowMixin(models.Model):
     review_note = models.TextField(blank=True)
     last_published_revision_id = models.IntegerField(null=True, blank=True)
 
-    def _update_live_snapshot(self) -> None:
+    def build_live_snapshot(self) -> dict | None:
+        """
+        LIVE_SNAPSHOT_FIELDS per available language, computed in memory; None for models without live_i18n.
+        """
         if not hasattr(self, "live_i18n"):
-            return
+            return None
 
         if not hasattr(self, "get_available_languages"):
-            return
+            return None
 
         live = {}
         for lang in self.get_available_languages():
@@ -136,16 +216,40 @@ class EditorialWorkflowMixin(models.Model):
                     else:
                         entry[fname] = None
                 live[lang] = entry
+        return live
 
-        self.live_i18n = live
-        try:
-            self.save(update_fields=["live_i18n"])
-        except Exception:
-            pass
+    def live_snapshot_dependents(self) -> list:
+        """
+        Related rows published together with this object (e.g. guide sections), with their new live_i18n
+        set in memory; publish writes them with one bulk_update per model once the object is saved.
+        """
+        return []
+
+    def write_live_snapshots(self) -> None:
+        """
+        Second half of publish, run from the object's post_save (core.signals); see store_live_snapshots.
+        """
+        store_live_snapshots([self])
 
     class Meta:
         abstract = True
 
+    def attach_display_values(self, language: str) -> None:
+        """
+        Precomputes get_display_value() for all LIVE_SNAPSHOT_FIELDS in one language (see with_display_values).
+        """
+        if not hasattr(self, "_current_values_for"):
+            return
+        cached = self.__dict__.setdefault("_display_values", {})
+        if language in cached:
+            return
+        live = (getattr(self, "live_i18n", None) or {}).get(language, {})
+        current = self._current_values_for(language)
+        cached[language] = {f: live.get(f) or current.get(f) for f in current}
+
+    def cached_display_values(self, language: str) -> dict | None:
+        return self.__dict__.get("_display_values", {}).get(language)
+
     # --- Transitions ---
 
     @transition(field='status', source=[STATUS_PUBLISHED], target=STATUS_REVIEW)
@@ -173,15 +277,22 @@ class EditorialWorkflowMixin(models.Model):
         self.reviewed_by = by
         if note:
             self.review_note = note
-        self._update_live_snapshot()
+        live = self.build_live_snapshot()
+        if live is not None:
+            self.live_i18n = live
         try:
             self.on_after_publish()
         except Exception:
             pass
+        # nothing is written here; the caller's save() stores the snapshot and triggers write_live_snapshots
+        if live is not None:
+            self._live_snapshot_dependents = self.live_snapshot_dependents()
 
     def on_after_publish(self) -> None:
         """
-        Post-publish extension point for subclasses (e.g., cache busting, search indexing).
+        Post-publish extension point for subclasses; runs inside the transition, before the save,
+        so it should only change in-memory state (see live_snapshot_dependents for related rows).
+        Work that needs the saved state (cache purges, search indexing) subscribes to core.events.content_changed.
         """
         pass
 
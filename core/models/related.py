@@ -0,0 +1,32 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class RelatedItem(models.Model):
+    """
+    One precomputed edge of the related-content graph: the top-K neighbours of an object per language,
+    ranked by weighted overlap of categories, tools, tags and persona (see core.related).
+    """
+    kind = models.CharField(max_length=20)
+    object_id = models.PositiveIntegerField()
+    language = models.CharField(_("Language"), max_length=15)
+    related_id = models.PositiveIntegerField()
+    score = models.PositiveIntegerField(default=0)
+    rank = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = _("Related item")
+        verbose_name_plural = _("Related items")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id", "language", "related_id"],
+                name="uniq_relateditem_edge",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "object_id", "language", "rank"], name="relateditem_lookup_idx"),
+            models.Index(fields=["kind", "related_id"], name="relateditem_reverse_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id} ({self.language}) → #{self.related_id} [{self.score}]"
@@ -0,0 +1,33 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SlugRoute(models.Model):
+    """
+    Routing table that maps (content type, language, slug) to an object id;
+    written from live snapshots so renamed or historical slugs resolve with one indexed query.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, related_name="+")
+    object_id = models.PositiveIntegerField()
+    language = models.CharField(_("Language"), max_length=15)
+    slug = models.SlugField(_("Slug"), max_length=220)
+    is_live = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Slug route")
+        verbose_name_plural = _("Slug routes")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "language", "slug"],
+                name="uniq_slugroute_type_language_slug",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["content_type", "slug"], name="slugroute_type_slug_idx"),
+            models.Index(fields=["content_type", "object_id"], name="slugroute_type_object_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type_id}:{self.language}:{self.slug} → #{self.object_id}"
@@ -0,0 +1,43 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchDocument(models.Model):
+    """
+    Search read-model (one row per object and language) across all public content types;
+    `vector` is a stored, weighted tsvector (title A, body B) with a GIN index on PostgreSQL.
+    """
+    KIND_CHOICES = (
+        ("guide", "Guide"),
+        ("prompt", "Prompt"),
+        ("usecase", "Usecase"),
+        ("comparison", "Comparison"),
+        ("tool", "Tool"),
+        ("glossary", "Glossary"),
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    language = models.CharField(_("Language"), max_length=15)
+    title = models.CharField(_("Title"), max_length=250)
+    body = models.TextField(_("Body"), blank=True)
+    url = models.CharField(max_length=300)
+    vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Search document")
+        verbose_name_plural = _("Search documents")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id", "language"],
+                name="uniq_searchdocument_kind_object_language",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["language", "kind"], name="searchdoc_language_kind_idx"),
+        ]
+        # GIN index on `vector`: created by migration 0004 on PostgreSQL only (tests also run on SQLite)
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id} ({self.language}): {self.title}"
@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SeoCheckRun(models.Model):
+    """
+    One SEO check job (core.seo.checker); it runs in the background and writes one SeoCheckResult per path
+    as soon as that path is checked, so the ops page can show results while the run is still going.
+    """
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, _("Queued")),
+        (STATUS_RUNNING, _("Running")),
+        (STATUS_DONE, _("Done")),
+        (STATUS_FAILED, _("Failed")),
+    ]
+    SOURCE_OPS = "ops"
+    SOURCE_CRAWL = "crawl"
+    SOURCE_CHOICES = [
+        (SOURCE_OPS, _("Ops page")),
+        (SOURCE_CRAWL, _("Site crawl")),
+    ]
+
+    source = models.CharField(max_length=10, choices=SOURCE_CHOICES, default=SOURCE_OPS)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL)
+    host = models.CharField(max_length=255)
+    secure = models.BooleanField(default=True)
+    paths = models.JSONField(default=list, blank=True)
+    crawl_sitemap = models.BooleanField(default=False)
+    total = models.PositiveIntegerField(default=0)
+    done = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at", "-pk"]
+        verbose_name = _("SEO check run")
+        verbose_name_plural = _("SEO check runs")
+
+    def __str__(self):
+        return f"SEO check #{self.pk} ({self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.STATUS_DONE, self.STATUS_FAILED)
+
+
+class SeoCheckResult(models.Model):
+    """
+    One checked URL. The measured columns (lengths, canonical, hreflang, response time, HTML size)
+    are stored flat so crawl runs can be compared per path (core.seo.checker.diff_runs).
+    """
+    run = models.ForeignKey(SeoCheckRun, on_delete=models.CASCADE, related_name="results")
+    path = models.CharField(max_length=500)
+    status_code = models.PositiveSmallIntegerField(default=0)
+    issues = models.JSONField(default=list, blank=True)  # [{"level", "field", "msg"}]
+    extracted = models.JSONField(default=dict, blank=True)
+    title_length = models.PositiveIntegerField(null=True, blank=True)
+    description_length = models.PositiveIntegerField(null=True, blank=True)
+    canonical = models.CharField(max_length=500, blank=True)
+    hreflang = models.JSONField(default=list, blank=True)  # [{"lang", "href"}]
+    response_ms = models.PositiveIntegerField(null=True, blank=True)
+    html_bytes = models.PositiveIntegerField(null=True, blank=True)
+    checked_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["pk"]
+        indexes = [models.Index(fields=["path", "run"])]
+        verbose_name = _("SEO check result")
+        verbose_name_plural = _("SEO check results")
+
+    def __str__(self):
+        return f"{self.path} ({self.status_code})"
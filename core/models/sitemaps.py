@@ -0,0 +1,31 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SitemapFile(models.Model):
+    """
+    Prebuilt, gzipped sitemap file (one per language, section and shard, plus the index)
+    kept in the "sitemaps" storage; etag/last_modified answer conditional requests without opening the file.
+    """
+    INDEX = "index"
+
+    language = models.CharField(_("Language"), max_length=15, blank=True)
+    section = models.CharField(max_length=50)
+    page = models.PositiveIntegerField(default=1)
+    path = models.CharField(max_length=255)
+    etag = models.CharField(max_length=64)
+    url_count = models.PositiveIntegerField(default=0)
+    last_modified = models.DateTimeField()
+
+    class Meta:
+        verbose_name = _("Sitemap file")
+        verbose_name_plural = _("Sitemap files")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["language", "section", "page"],
+                name="uniq_sitemapfile_language_section_page",
+            ),
+        ]
+
+    def __str__(self):
+        return self.path
@@ -0,0 +1,38 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class TeaserEntry(models.Model):
+    """
+    Denormalized teaser read-model (one row per object and language) for the home page and cross-type feeds;
+    maintained by core.signals so feeds need no translation loads, strip_tags or reverse() at request time.
+    """
+    KIND_CHOICES = (
+        ("guide", "Guide"),
+        ("prompt", "Prompt"),
+        ("usecase", "Usecase"),
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    language = models.CharField(_("Language"), max_length=15)
+    title = models.CharField(_("Title"), max_length=250)
+    teaser = models.TextField(_("Teaser"), blank=True)
+    url = models.CharField(max_length=300)
+    date = models.DateTimeField(null=True, blank=True)
+    badge = models.CharField(max_length=30)
+
+    class Meta:
+        verbose_name = _("Teaser entry")
+        verbose_name_plural = _("Teaser entries")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id", "language"],
+                name="uniq_teaserentry_kind_object_language",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["language", "-date"], name="teaserentry_language_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id} ({self.language}): {self.title}"
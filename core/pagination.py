@@ -0,0 +1,262 @@
+# core/pagination.py
+"""
+Keyset (cursor) pagination; pages are fetched with a WHERE on the sort key instead of OFFSET
+and without COUNT(*), so deep pages cost the same as the first one.
+Cursors are opaque (base64 JSON of direction + sort-key values of the boundary row).
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import json
+from functools import cached_property, reduce
+from operator import or_
+from urllib.parse import urlencode
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db import connections
+from django.db.models import F, Q, QuerySet
+from django.http import Http404
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _json_value(value):
+    # full precision (DjangoJSONEncoder cuts datetimes to milliseconds, which breaks ties)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def encode_cursor(direction: str, values: list) -> str:
+    raw = json.dumps({"d": direction, "v": [_json_value(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[str, list]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw)
+        direction, values = data["d"], data["v"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursor(token) from exc
+    if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+        raise InvalidCursor(token)
+    return direction, values
+
+
+def approximate_count(queryset: QuerySet) -> int:
+    """
+    Planner row estimate on PostgreSQL (no scan); exact COUNT(*) elsewhere.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPage:
+    """
+    Page object with the subset of django.core.paginator.Page that list templates use.
+    """
+    is_keyset = True
+
+    def __init__(self, object_list, paginator, *, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if self._has_next and self.object_list:
+            return encode_cursor(NEXT, self.paginator.key_values(self.object_list[-1]))
+        return None
+
+    @property
+    def previous_cursor(self):
+        if self._has_previous and self.object_list:
+            return encode_cursor(PREVIOUS, self.paginator.key_values(self.object_list[0]))
+        return None
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset by `ordering` (e.g. ("-published_at", "-pk")); the last key must be unique.
+    NULLs sort last. `count` is lazy and, with approximate=True, a planner estimate on PostgreSQL.
+    """
+
+    def __init__(self, queryset: QuerySet, ordering, per_page: int, approximate: bool = True):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.approximate = approximate
+        self.keys = [(name.lstrip("-"), name.startswith("-")) for name in ordering]
+
+    @cached_property
+    def count(self) -> int:
+        return approximate_count(self.queryset) if self.approximate else self.queryset.count()
+
+    def _field(self, name):
+        meta = self.queryset.model._meta
+        return meta.pk if name == "pk" else meta.get_field(name)
+
+    def key_values(self, obj) -> list:
+        return [getattr(obj, name) for name, _desc in self.keys]
+
+    def _ordering(self, reverse: bool):
+        nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+        return [
+            F(name).desc(**nulls) if desc != reverse else F(name).asc(**nulls)
+            for name, desc in self.keys
+        ]
+
+    def _after(self, values: list, reverse: bool, index: int = 0) -> Q:
+        """
+        Rows strictly after the boundary row in the (possibly reversed) key order.
+        """
+        name, desc = self.keys[index]
+        desc = desc != reverse
+        nulls_last = not reverse
+        value = values[index]
+        tie = self._after(values, reverse, index + 1) if index + 1 < len(self.keys) else None
+
+        parts = []
+        if value is None:
+            if not nulls_last:
+                parts.append(Q(**{f"{name}__isnull": False}))
+            if tie is not None:
+                parts.append(Q(**{f"{name}__isnull": True}) & tie)
+        else:
+            parts.append(Q(**{f"{name}__{'lt' if desc else 'gt'}": value}))
+            if nulls_last:
+                parts.append(Q(**{f"{name}__isnull": True}))
+            if tie is not None:
+                parts.append(Q(**{name: value}) & tie)
+        return reduce(or_, parts) if parts else Q(pk__in=[])
+
+    def _decode(self, cursor: str) -> tuple[str, list]:
+        direction, raw_values = decode_cursor(cursor)
+        if len(raw_values) != len(self.keys):
+            raise InvalidCursor(cursor)
+        try:
+            values = [
+                None if raw is None else self._field(name).to_python(raw)
+                for (name, _desc), raw in zip(self.keys, raw_values)
+            ]
+        except ValidationError as exc:
+            raise InvalidCursor(cursor) from exc
+        return direction, values
+
+    def _page_query(self, cursor: str | None) -> tuple[QuerySet, bool, list | None]:
+        direction, values = self._decode(cursor) if cursor else (NEXT, None)
+        reverse = direction == PREVIOUS
+
+        qs = self.queryset.order_by(*self._ordering(reverse))
+        if values is not None:
+            qs = qs.filter(self._after(values, reverse))
+        return qs[: self.per_page + 1], reverse, values
+
+    def _page(self, rows: list, reverse: bool, values: list | None) -> KeysetPage:
+        more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if reverse:
+            rows.reverse()
+            return KeysetPage(rows, self, has_next=True, has_previous=more)
+        return KeysetPage(rows, self, has_next=more, has_previous=values is not None)
+
+    def page(self, cursor: str | None = None) -> KeysetPage:
+        qs, reverse, values = self._page_query(cursor)
+        return self._page(list(qs), reverse, values)
+
+    async def apage(self, cursor: str | None = None) -> KeysetPage:
+        qs, reverse, values = self._page_query(cursor)
+        return self._page([row async for row in qs], reverse, values)
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin: ?cursor= pages with KeysetPaginator; plain ?page= links keep the numbered paginator.
+    """
+    keyset_ordering = ("-published_at", "-pk")
+    approximate_count = True
+
+    def uses_keyset(self) -> bool:
+        return "cursor" in self.request.GET or "page" not in self.request.GET
+
+    def keyset_paginator(self, queryset, page_size) -> KeysetPaginator:
+        return KeysetPaginator(queryset, self.keyset_ordering, page_size, approximate=self.approximate_count)
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.uses_keyset():
+            return super().paginate_queryset(queryset, page_size)
+        paginator = self.keyset_paginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get("cursor"))
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        params = [(k, v) for k, values in self.request.GET.lists() if k not in ("cursor", "page") for v in values]
+        ctx["page_query"] = urlencode(params)
+        return ctx
+
+
+async def apaginate_queryset(view, queryset, page_size):
+    """
+    MultipleObjectMixin.paginate_queryset (keyset pages for KeysetPaginationMixin views) for async views:
+    the count and the rows of the page are fetched with the async ORM, so rendering finds them loaded.
+    """
+    if isinstance(view, KeysetPaginationMixin) and view.uses_keyset():
+        paginator = view.keyset_paginator(queryset, page_size)
+        try:
+            page = await paginator.apage(view.request.GET.get("cursor"))
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    paginator = view.get_paginator(
+        queryset, page_size, orphans=view.get_paginate_orphans(), allow_empty_first_page=view.get_allow_empty()
+    )
+    # count is a cached_property; set here so Paginator.page() does not count synchronously
+    paginator.count = await queryset.acount()
+    page = view.kwargs.get(view.page_kwarg) or view.request.GET.get(view.page_kwarg) or 1
+    try:
+        page_number = paginator.num_pages if page == "last" else int(page)
+        page = paginator.page(page_number)
+    except (ValueError, InvalidPage):
+        raise Http404("Invalid page")
+    page.object_list = [row async for row in page.object_list]
+    return paginator, page, page.object_list, page.has_other_pages()
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.functions import Lower, Trim
+from parler.utils.i18n import get_active_language_choices
+
+from core.batching import collect_on_commit
+from core.models import RelatedItem
+from core.models.editorial import EditorialWorkflowMixin
+from guides.models import Guide
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+GRAPH_MODELS = {
+    "guide": Guide,
+    "prompt": Prompt,
+    "usecase": UseCase,
+}
+
+# (feature name, relation on the model) that contribute to the similarity of two items of the same kind
+GRAPH_RELATIONS = {
+    "guide": (("category", "categories"), ("tool", "tools")),
+    "prompt": (("tag", "tags"), ("tool", "tools")),
+    "usecase": (("tool", "tools"),),
+}
+
+FEATURE_WEIGHTS = {
+    "category": 3,
+    "tool": 2,
+    "tag": 1,
+    "persona": 2,
+}
+
+Feature = tuple[str, object]
+
+
+def top_k() -> int:
+    return int(getattr(settings, "RELATED_GRAPH_TOP_K", 12))
+
+
+def kind_for(obj) -> str | None:
+    for kind, model in GRAPH_MODELS.items():
+        if obj is model or isinstance(obj, model):
+            return kind
+    return None
+
+
+@dataclass
+class _Node:
+    pk: int
+    is_published: bool
+    published_at: float
+    features: set[Feature] = field(default_factory=set)
+    languages: set[str] = field(default_factory=set)
+    persona: dict[str, str] = field(default_factory=dict)
+
+    def visible_in(self, lang: str) -> bool:
+        return bool(self.languages.intersection(get_active_language_choices(lang)))
+
+    def features_for(self, lang: str) -> set[Feature]:
+        persona = self.persona.get(lang)
+        if persona:
+            return self.features | {("persona", persona)}
+        return self.features
+
+
+def _feature_pairs(kind: str, name: str, relation: str):
+    model = GRAPH_MODELS[kind]
+    if name == "tag":
+        through = model._meta.get_field(relation).remote_field.through
+        return through.objects.filter(content_type=ContentType.objects.get_for_model(model)), "object_id", "tag_id"
+    m2m = model._meta.get_field(relation)
+    return m2m.remote_field.through.objects.all(), f"{m2m.m2m_field_name()}_id", f"{m2m.m2m_reverse_field_name()}_id"
+
+
+def _translations(kind: str):
+    translation_model = GRAPH_MODELS[kind]._parler_meta.root_model
+    has_persona = any(f.name == "persona" for f in translation_model._meta.get_fields())
+    return translation_model.objects.all(), has_persona
+
+
+def _load_nodes(kind: str, pks: set[int] | None = None) -> dict[int, _Node]:
+    """
+    Loads every non-archived object of a kind (or of pks) with its feature set in a constant number of
+    queries (one per relation plus translations); no per-object queries.
+    """
+    model = GRAPH_MODELS[kind]
+    nodes: dict[int, _Node] = {}
+    rows = model.objects.exclude(status=EditorialWorkflowMixin.STATUS_ARCHIVED).order_by()
+    if pks is not None:
+        rows = rows.filter(pk__in=pks)
+    for pk, status, published_at in rows.values_list("pk", "status", "published_at"):
+        nodes[pk] = _Node(
+            pk=pk,
+            is_published=status == EditorialWorkflowMixin.STATUS_PUBLISHED,
+            published_at=published_at.timestamp() if published_at else 0.0,
+        )
+
+    for name, relation in GRAPH_RELATIONS[kind]:
+        pairs, source, value = _feature_pairs(kind, name, relation)
+        if pks is not None:
+            pairs = pairs.filter(**{f"{source}__in": pks})
+        for pk, feature in pairs.values_list(source, value):
+            node = nodes.get(pk)
+            if node:
+                node.features.add((name, feature))
+
+    translations, has_persona = _translations(kind)
+    if pks is not None:
+        translations = translations.filter(master_id__in=pks)
+    columns = ("master_id", "language_code", "persona") if has_persona else ("master_id", "language_code")
+    for row in translations.values_list(*columns):
+        node = nodes.get(row[0])
+        if not node:
+            continue
+        node.languages.add(row[1])
+        if has_persona and row[2]:
+            node.persona[row[1]] = row[2].strip().lower()
+    return nodes
+
+
+def _feature_holders(kind: str, features: set[Feature]) -> set[int]:
+    """
+    Objects of a kind that have at least one of features (one query per relation that occurs).
+    """
+    wanted: dict[str, set] = defaultdict(set)
+    for name, value in features:
+        wanted[name].add(value)
+    holders: set[int] = set()
+    for name, relation in GRAPH_RELATIONS[kind]:
+        if wanted.get(name):
+            pairs, source, value = _feature_pairs(kind, name, relation)
+            holders.update(pairs.filter(**{f"{value}__in": wanted[name]}).values_list(source, flat=True))
+    if wanted.get("persona"):
+        translations, _has_persona = _translations(kind)
+        holders.update(
+            translations.annotate(normalized=Lower(Trim("persona")))
+            .filter(normalized__in=wanted["persona"])
+            .values_list("master_id", flat=True)
+        )
+    return holders
+
+
+def _rank_neighbours(nodes: dict[int, _Node], sources: Iterable[int], lang: str, limit: int):
+    """
+    Scores sources against all published, visible candidates via an inverted feature index;
+    ties are broken by recency like the former ORDER BY ..., -published_at.
+    """
+    index: dict[Feature, list[int]] = defaultdict(list)
+    for node in nodes.values():
+        if node.is_published and node.visible_in(lang):
+            for feature in node.features_for(lang):
+                index[feature].append(node.pk)
+
+    for pk in sources:
+        node = nodes.get(pk)
+        if not node or not node.visible_in(lang):
+            continue
+        scores: dict[int, int] = defaultdict(int)
+        for feature in node.features_for(lang):
+            weight = FEATURE_WEIGHTS[feature[0]]
+            for other in index.get(feature, ()):
+                if other != pk:
+                    scores[other] += weight
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], -nodes[kv[0]].published_at, kv[0]))
+        for rank, (other, score) in enumerate(ranked[:limit]):
+            yield pk, other, score, rank
+
+
+def _write_edges(kind: str, nodes: dict[int, _Node], sources: set[int] | None) -> int:
+    targets = set(nodes) if sources is None else sources
+    limit = top_k()
+    edges = [
+        RelatedItem(kind=kind, object_id=pk, language=code, related_id=other, score=score, rank=rank)
+        for code, _name in settings.LANGUAGES
+        for pk, other, score, rank in _rank_neighbours(nodes, targets, code, limit)
+    ]
+    with transaction.atomic():
+        stale = RelatedItem.objects.filter(kind=kind)
+        if sources is not None:
+            stale = stale.filter(object_id__in=sources)
+        stale.delete()
+        RelatedItem.objects.bulk_create(edges, batch_size=1000)
+    return len(edges)
+
+
+def rebuild_related(kind: str, object_ids: Iterable[int] | None = None) -> int:
+    """
+    Recomputes the stored neighbours of the given objects (or the whole kind) for every site language;
+    returns the number of edges written.
+    """
+    sources = None if object_ids is None else set(object_ids)
+    return _write_edges(kind, _load_nodes(kind), sources)
+
+
+def _node_features(node) -> set:
+    return node.features | {("persona", p) for p in node.persona.values()}
+
+
+def _neighbourhood_features(nodes: dict[int, _Node]) -> set[Feature]:
+    return set().union(*(_node_features(node) for node in nodes.values()))
+
+
+def refresh_related(kind: str, pks: Iterable[int]) -> None:
+    """
+    Incremental update after the objects pks changed (relations, persona or workflow state): recomputes
+    them, every item sharing a feature with one of them and every item that currently lists one.
+    Only that neighbourhood and the candidates it is ranked against are loaded, not the whole graph.
+    """
+    pks = set(pks)
+    affected = pks | _feature_holders(kind, _neighbourhood_features(_load_nodes(kind, pks)))
+    affected.update(
+        RelatedItem.objects.filter(kind=kind, related_id__in=pks).values_list("object_id", flat=True)
+    )
+    candidates = affected | _feature_holders(kind, _neighbourhood_features(_load_nodes(kind, affected)))
+    _write_edges(kind, _load_nodes(kind, candidates), affected)
+
+
+def refresh_related_for(*objs) -> None:
+    """
+    refresh_related() for objs right away; objects of the same kind are refreshed together (bulk transitions).
+    """
+    by_kind: dict[str, set[int]] = {}
+    for obj in objs:
+        kind = kind_for(obj)
+        if kind and obj.pk:
+            by_kind.setdefault(kind, set()).add(obj.pk)
+    for kind, pks in by_kind.items():
+        refresh_related(kind, pks)
+
+
+def _enqueue(items: set) -> None:
+    from core.tasks import refresh_related_task
+
+    refresh_related_task.delay(sorted(items))
+
+
+def schedule_related_refresh(kind: str, pks: Iterable[int]) -> None:
+    """
+    Queues refresh_related() as one task after the current transaction commits; all saves and relation
+    changes of a transaction (master, translations, m2m) share one refresh.
+    """
+    collect_on_commit(_enqueue, [(kind, pk) for pk in pks if pk])
+
+
+def related_ids(kind: str, object_id: int, language: str, limit: int) -> list[int]:
+    return list(
+        RelatedItem.objects
+        .filter(kind=kind, object_id=object_id, language=language)
+        .order_by("rank")
+        .values_list("related_id", flat=True)[:limit]
+    )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from asgiref.sync import sync_to_async
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+from core.models.routing import SlugRoute
+
+ROUTE_SLUG_FIELDS = ("public_slug", "slug")
+
+
+def _live_slugs(obj) -> set[tuple[str, str]]:
+    """
+    Collects (language, slug) pairs from the object's live_i18n snapshot;
+    both public_slug and slug are routable.
+    """
+    pairs = set()
+    for lang, data in (getattr(obj, "live_i18n", None) or {}).items():
+        for fname in ROUTE_SLUG_FIELDS:
+            slug = (data or {}).get(fname)
+            if slug:
+                pairs.add((lang, slug))
+    return pairs
+
+
+def sync_slug_routes(obj) -> None:
+    """
+    Mirrors the live snapshot slugs of obj into SlugRoute;
+    slugs that left the snapshot stay resolvable but are flagged is_live=False.
+    """
+    if not getattr(obj, "pk", None):
+        return
+
+    ct = ContentType.objects.get_for_model(obj)
+    wanted = _live_slugs(obj)
+
+    with transaction.atomic():
+        existing = SlugRoute.objects.filter(content_type=ct, object_id=obj.pk, is_live=True)
+        stale = [r.pk for r in existing.only("pk", "language", "slug") if (r.language, r.slug) not in wanted]
+        if stale:
+            SlugRoute.objects.filter(pk__in=stale).update(is_live=False)
+        if wanted:
+            SlugRoute.objects.bulk_create(
+                [
+                    SlugRoute(content_type=ct, object_id=obj.pk, language=lang, slug=slug, is_live=True)
+                    for lang, slug in sorted(wanted)
+                ],
+                update_conflicts=True,
+                unique_fields=["content_type", "language", "slug"],
+                update_fields=["object_id", "is_live", "updated_at"],
+            )
+
+
+def _by_current_slug(qs: QuerySet, slug: str) -> QuerySet:
+    return qs.filter(Q(translations__public_slug=slug) | Q(translations__slug=slug)).distinct()
+
+
+def _routed_ids(content_type, slug: str) -> QuerySet:
+    return (
+        SlugRoute.objects
+        .filter(content_type=content_type, slug=slug)
+        .order_by("-is_live", "-updated_at")
+        .values_list("object_id", flat=True)
+    )
+
+
+def resolve_by_slug(qs: QuerySet, slug: str) -> object | None:
+    """
+    Resolves a detail slug for any live_i18n content model: current Parler slugs first,
+    then the SlugRoute table (live before retired routes); both lookups are indexed.
+    """
+    if not slug:
+        return None
+
+    obj = _by_current_slug(qs, slug).first()
+    if obj:
+        return obj
+
+    object_id = _routed_ids(ContentType.objects.get_for_model(qs.model), slug).first()
+    if object_id is None:
+        return None
+    return qs.filter(pk=object_id).first()
+
+
+async def aresolve_by_slug(qs: QuerySet, slug: str) -> object | None:
+    """
+    resolve_by_slug for async views.
+    """
+    if not slug:
+        return None
+
+    obj = await _by_current_slug(qs, slug).afirst()
+    if obj:
+        return obj
+
+    content_type = await sync_to_async(ContentType.objects.get_for_model)(qs.model)
+    object_id = await _routed_ids(content_type, slug).afirst()
+    if object_id is None:
+        return None
+    return await qs.filter(pk=object_id).afirst()
@@ -0,0 +1,225 @@
+# core/search.py
+"""
+Site search over the SearchDocument read-model; rows are maintained by core.signals,
+vectors are weighted tsvectors (title A, body B) in the text-search config of the row's language.
+List filters (matching_ids) also match the last word as a prefix, as the icontains filters they replaced did.
+On non-PostgreSQL databases (SQLite test runs) matching falls back to icontains over the same table.
+Tools are public once their published_at has passed; index_due_tools (run periodically by core.tasks) indexes
+scheduled tools when that happens, since no save marks the moment.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection, transaction
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
+from django.urls import NoReverseMatch
+from django.utils import timezone, translation
+from django.utils.html import strip_tags
+from django.utils.translation import get_language
+from parler.utils.context import switch_language
+from parler.utils.i18n import get_active_language_choices
+
+from core.models import SearchDocument
+
+SEARCH_KINDS = {
+    "guides.guide": "guide",
+    "prompts.prompt": "prompt",
+    "usecases.usecase": "usecase",
+    "compare.comparison": "comparison",
+    "catalog.tool": "tool",
+    "glossary.glossaryterm": "glossary",
+}
+
+# (title field, body fields) per kind; translated fields for Parler models
+SEARCH_FIELDS = {
+    "guide": ("title", ("intro", "body")),
+    "prompt": ("title", ("intro", "body", "outro")),
+    "usecase": ("title", ("persona", "intro", "body", "outro")),
+    "comparison": ("title", ("intro",)),
+    "tool": ("name", ("short_description", "long_description")),
+    "glossary": ("term", ("short_definition", "long_definition", "category")),
+}
+
+# glossary terms are not translated: every searchable field is on the row itself
+GLOSSARY_SOURCE_FIELDS = {"term", "slug", "language", *SEARCH_FIELDS["glossary"][1]}
+
+DEFAULT_SEARCH_CONFIGS = {"de": "german", "en": "english"}
+WEBSEARCH_OPERATORS = re.compile(r'["-]|\bor\b', re.IGNORECASE)
+
+
+def search_config(language: str) -> str:
+    configs = getattr(settings, "SEARCH_CONFIGS", DEFAULT_SEARCH_CONFIGS)
+    return configs.get((language or "")[:2], "simple")
+
+
+def uses_postgres() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def _is_public(obj, kind: str) -> bool:
+    if kind == "tool":
+        return bool(obj.published_at and obj.published_at <= timezone.now())
+    if kind == "glossary":
+        return True
+    return getattr(obj, "status", None) == getattr(obj, "STATUS_PUBLISHED", "published")
+
+
+def _document(obj, kind: str, language: str) -> SearchDocument | None:
+    title_field, body_fields = SEARCH_FIELDS[kind]
+    title = getattr(obj, title_field, "") or ""
+    parts = [strip_tags(getattr(obj, f, "") or "") for f in body_fields]
+    if kind == "comparison":
+        # comparisons are found by the names of the compared tools
+        parts.extend(t.safe_translation_getter("name", any_language=True) or "" for t in obj.tools.all())
+    body = "\n".join(p for p in parts if p)
+    try:
+        url = obj.get_absolute_url() if kind == "glossary" else obj.get_absolute_url(language=language)
+    except NoReverseMatch:
+        # incomplete translation (e.g. slug not set yet) – indexed once the translation is saved
+        return None
+    return SearchDocument(
+        kind=kind, object_id=obj.pk, language=language, title=title[:250], body=body.strip(), url=url
+    )
+
+
+def _documents_for(obj, kind: str) -> list[SearchDocument]:
+    if kind == "glossary":
+        with translation.override(obj.language):
+            doc = _document(obj, kind, obj.language)
+        return [doc] if doc else []
+
+    docs = []
+    available = set(obj.get_available_languages())
+    for code, _name in settings.LANGUAGES:
+        if not available.intersection(get_active_language_choices(code)):
+            continue
+        with switch_language(obj, code), translation.override(code):
+            doc = _document(obj, kind, code)
+        if doc:
+            docs.append(doc)
+    return docs
+
+
+def update_vectors(queryset: QuerySet) -> None:
+    """
+    Recomputes the stored vectors of the given documents, one UPDATE per language config.
+    """
+    if not uses_postgres():
+        return
+    for language in queryset.values_list("language", flat=True).distinct():
+        config = search_config(language)
+        queryset.filter(language=language).update(
+            vector=SearchVector("title", weight="A", config=config)
+            + SearchVector("body", weight="B", config=config)
+        )
+
+
+def sync_search_documents(obj) -> None:
+    """
+    Rebuilds the SearchDocument rows of obj while it is public (one per site language for Parler models,
+    one for glossary terms), none otherwise.
+    """
+    kind = SEARCH_KINDS.get(obj._meta.label_lower)
+    if not kind or not obj.pk:
+        return
+
+    existing = SearchDocument.objects.filter(kind=kind, object_id=obj.pk)
+    if not _is_public(obj, kind):
+        existing.delete()
+        return
+
+    docs = _documents_for(obj, kind)
+    with transaction.atomic():
+        existing.exclude(language__in=[d.language for d in docs]).delete()
+        if docs:
+            SearchDocument.objects.bulk_create(
+                docs,
+                update_conflicts=True,
+                unique_fields=["kind", "object_id", "language"],
+                update_fields=["title", "body", "url", "updated_at"],
+            )
+            update_vectors(existing)
+
+
+def index_due_tools() -> int:
+    """
+    Indexes the tools whose published_at has passed since they were saved (scheduled publication);
+    returns how many were indexed.
+    """
+    from catalog.models import Tool
+
+    indexed = SearchDocument.objects.filter(kind="tool").values("object_id")
+    due = Tool.objects.filter(published_at__lte=timezone.now()).exclude(pk__in=indexed)
+    count = 0
+    for tool in due.prefetch_related("translations").iterator(chunk_size=200):
+        sync_search_documents(tool)
+        count += 1
+    return count
+
+
+def remove_search_documents(obj) -> None:
+    kind = SEARCH_KINDS.get(obj._meta.label_lower)
+    if kind:
+        SearchDocument.objects.filter(kind=kind, object_id=obj.pk).delete()
+
+
+def prefix_tsquery(q: str) -> str | None:
+    """
+    Raw tsquery requiring every word of q, the last one as a prefix ("prompt engin" -> 'prompt' & 'engin':*).
+    """
+    words = re.findall(r"\w+", q)
+    if not words:
+        return None
+    return " & ".join([f"'{word}'" for word in words[:-1]] + [f"'{words[-1]}':*"])
+
+
+def search(
+    q: str, language: str | None = None, kinds: Iterable[str] | None = None, prefix: bool = False
+) -> QuerySet:
+    """
+    Ranked SearchDocument queryset for q in one language (websearch syntax on PostgreSQL:
+    quoted phrases, OR, -exclusion); best matches first. With prefix, a query without websearch operators
+    also matches its last word as a prefix (type-ahead style filters).
+    """
+    q = (q or "").strip()
+    lang = language or get_language()
+    qs = SearchDocument.objects.filter(language=lang)
+    if kinds:
+        qs = qs.filter(kind__in=list(kinds))
+    if not q:
+        return qs.none()
+
+    if uses_postgres():
+        config = search_config(lang)
+        query = SearchQuery(q, config=config, search_type="websearch")
+        raw = prefix_tsquery(q) if prefix and not WEBSEARCH_OPERATORS.search(q) else None
+        if raw:
+            query |= SearchQuery(raw, config=config, search_type="raw")
+        return (
+            qs.filter(vector=query)
+            .annotate(rank=SearchRank(F("vector"), query))
+            .order_by("-rank", "title")
+        )
+
+    return (
+        qs.filter(Q(title__icontains=q) | Q(body__icontains=q))
+        .annotate(
+            rank=Case(
+                When(title__icontains=q, then=Value(1.0)),
+                default=Value(0.4),
+                output_field=FloatField(),
+            )
+        )
+        .order_by("-rank", "title")
+    )
+
+
+def matching_ids(kind: str, q: str, language: str | None = None) -> QuerySet:
+    """
+    object_id subquery for narrowing a list view (e.g. Tool.objects.filter(pk__in=...)); prefix matching on.
+    """
+    return search(q, language=language, kinds=[kind], prefix=True).values("object_id")
@@ -0,0 +1,455 @@
+# core/seo/checker.py
+"""
+SEO smoke test as a Celery task (core.tasks.run_seo_check_task). A SeoCheckRun fans its paths out over a pool
+of worker threads; every worker renders pages in-process through the project's request handler (BaseHandler with
+the full middleware stack, no network, no second server, no request_started/finished signals) and feeds the body
+chunk by chunk to a <head> parser that stops parsing at </head>. Each finished path is stored right away as a
+SeoCheckResult, which the ops page polls (content.views.seo_check); runs whose worker died are marked failed
+after SEO_CHECK_STALE_MINUTES (fail_stale_runs). Runs can include every URL of the
+prebuilt sitemaps (core.sitemaps). `manage.py seo_crawl` runs the same checks over every sitemap URL and
+compares the run with an earlier one (diff_runs), including response time and HTML size per path.
+"""
+from __future__ import annotations
+
+import codecs
+import functools
+import gzip
+import logging
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from html.parser import HTMLParser
+from typing import Any
+from urllib.parse import urlparse
+from xml.etree import ElementTree
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.db import connections, transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.test import RequestFactory
+from django.utils import timezone
+
+from core.cache import bypass_page_cache
+from core.models import SeoCheckResult, SeoCheckRun, SitemapFile
+from core.sitemaps import build_sitemaps, sitemap_storage
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 8192
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+@dataclass
+class SeoIssue:
+    level: str  # "ok" | "warn" | "error"
+    field: str
+    msg: str
+
+
+@dataclass
+class SeoResult:
+    path: str
+    status_code: int
+    issues: list[SeoIssue]
+    extracted: dict[str, Any]
+    title_length: int | None = None
+    description_length: int | None = None
+    response_ms: int | None = None
+    html_bytes: int | None = None
+
+
+@dataclass
+class HeadTags:
+    title: str | None = None
+    description: str | None = None
+    robots: str | None = None
+    canonical: str | None = None
+    og_image: str | None = None
+    hreflang: list = field(default_factory=list)
+
+
+class HeadParser(HTMLParser):
+    """
+    Collects the SEO tags of <head> in one pass over the markup; `done` is set at </head> (or <body>),
+    so callers feeding chunks can stop reading there.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.head = HeadTags()
+        self.done = False
+        self._in_title = False
+        self._title: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        a = {k.lower(): (v or "") for k, v in attrs}
+        if tag == "title" and self.head.title is None:
+            self._in_title = True
+        elif tag == "meta":
+            name = a.get("name", "").lower()
+            if name == "description" and self.head.description is None:
+                self.head.description = a.get("content", "")
+            elif name == "robots" and self.head.robots is None:
+                self.head.robots = a.get("content", "")
+            elif a.get("property", "").lower() == "og:image" and self.head.og_image is None:
+                self.head.og_image = a.get("content", "")
+        elif tag == "link":
+            rel = a.get("rel", "").lower()
+            if rel == "canonical" and self.head.canonical is None:
+                self.head.canonical = a.get("href", "")
+            elif rel == "alternate" and a.get("hreflang"):
+                self.head.hreflang.append({"lang": a["hreflang"], "href": a.get("href", "")})
+        elif tag == "body":
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self.head.title = "".join(self._title)
+        elif tag == "head":
+            self.done = True
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title.append(data)
+
+
+def parse_head(chunks: Iterable[bytes]) -> HeadTags:
+    """
+    Feeds chunks until the parser reaches </head>; the rest of the iterator is left unread.
+    """
+    parser = HeadParser()
+    decoder = codecs.getincrementaldecoder("utf-8")("ignore")
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+        if parser.done:
+            break
+    parser.close()
+    return parser.head
+
+
+def _chunks(content: bytes) -> Iterator[bytes]:
+    for start in range(0, len(content), CHUNK_SIZE):
+        yield content[start:start + CHUNK_SIZE]
+
+
+def _abbrev(text: str, n: int = 120) -> str:
+    return (text[:n] + "…") if text and len(text) > n else (text or "")
+
+
+def _is_absolute(url: str) -> bool:
+    try:
+        p = urlparse(url)
+    except ValueError:
+        return False
+    return bool(p.scheme) and bool(p.netloc)
+
+
+def _squash(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def evaluate(path: str, status: int, head: HeadTags, base: str) -> SeoResult:
+    issues: list[SeoIssue] = []
+    extracted: dict[str, Any] = {
+        "title": "",
+        "description": "",
+        "canonical": "",
+        "og_image": "",
+        "hreflang": [],
+    }
+
+    lengths: dict[str, int] = {}
+
+    # Status
+    if status != 200:
+        issues.append(SeoIssue("error", "status", f"HTTP {status} (erwartet 200)"))
+        return SeoResult(path, status, issues, extracted)
+
+    # <title>
+    if head.title is None:
+        issues.append(SeoIssue("error", "title", "<title> fehlt"))
+    else:
+        title = _squash(head.title)
+        extracted["title"] = title
+        lengths["title_length"] = len(title)
+        if len(title) < 10:
+            issues.append(SeoIssue("warn", "title", f"zu kurz ({len(title)})"))
+        if len(title) > 60:
+            issues.append(SeoIssue("warn", "title", f"zu lang ({len(title)})"))
+
+    if head.description is None:
+        issues.append(SeoIssue("error", "description", "meta description fehlt"))
+    else:
+        desc = _squash(head.description)
+        extracted["description"] = _abbrev(desc, 200)
+        lengths["description_length"] = len(desc)
+        if len(desc) > 160:
+            issues.append(SeoIssue("warn", "description", f"länger als 160 ({len(desc)})"))
+
+    if head.robots is not None:
+        robots = head.robots.lower().strip()
+        extracted["robots"] = robots
+        if "noindex" in robots:
+            issues.append(SeoIssue("warn", "robots", f"noindex set ({robots})"))
+    else:
+        extracted["robots"] = "—"
+
+    # canonical
+    if head.canonical is None:
+        issues.append(SeoIssue("error", "canonical", "<link rel='canonical'> fehlt"))
+    else:
+        canonical = head.canonical.strip()
+        extracted["canonical"] = canonical
+        if not _is_absolute(canonical):
+            issues.append(SeoIssue("warn", "canonical", "Canonical ist bot absolute"))
+        if _is_absolute(canonical) and not canonical.startswith(base):
+            issues.append(SeoIssue("warn", "canonical", "Canonical points to a foreign domain"))
+
+    if head.og_image is None:
+        issues.append(SeoIssue("warn", "og:image", "og:image not set (fallback may be from base.html)"))
+    else:
+        og = head.og_image.strip()
+        extracted["og_image"] = og
+        if not _is_absolute(og):
+            issues.append(SeoIssue("warn", "og:image", "og:image is bot absolutw"))
+
+    # hreflang
+    extracted["hreflang"] = head.hreflang
+    langs = {a["lang"].lower() for a in head.hreflang}
+    if head.hreflang and not ({"de", "en"} & langs):
+        issues.append(SeoIssue("warn", "hreflang", "hreflang vorhanden, aber weder 'de' noch 'en' gefunden"))
+
+    return SeoResult(path, status, issues, extracted, **lengths)
+
+
+@functools.cache
+def _handler() -> BaseHandler:
+    # one handler for all worker threads, as under a threaded WSGI server
+    handler = BaseHandler()
+    handler.load_middleware()
+    return handler
+
+
+def _fetch(path: str, host: str, secure: bool):
+    """
+    The response for path as a fresh visitor sees it, following redirects on the same host; rendered fresh,
+    past the page caches, so response times and markup are those of the current code.
+    """
+    factory = RequestFactory()
+    for _hop in range(MAX_REDIRECTS + 1):
+        request = bypass_page_cache(factory.get(path, secure=secure, HTTP_HOST=host))
+        response = _handler().get_response(request)
+        if response.status_code not in REDIRECT_CODES:
+            break
+        location = urlparse(response["Location"])
+        if location.netloc and location.netloc != host:
+            break
+        path = location.path + (f"?{location.query}" if location.query else "")
+    return response
+
+
+def _read(response) -> tuple[HeadTags, int]:
+    """
+    Parses <head> from the body as it arrives and counts the remaining bytes without parsing them.
+    """
+    chunks = iter(response.streaming_content if response.streaming else _chunks(response.content))
+    size = 0
+
+    def counted():
+        nonlocal size
+        for chunk in chunks:
+            size += len(chunk)
+            yield chunk
+
+    head = parse_head(counted())
+    size += sum(len(chunk) for chunk in chunks)
+    return head, size
+
+
+def check_path(path: str, host: str, secure: bool = True) -> SeoResult:
+    """
+    View errors reach this as 500 responses (the handler converts exceptions like a live request).
+    """
+    if path.startswith(("http://", "https://")):
+        path = urlparse(path).path or "/"
+    base = f"{'https' if secure else 'http'}://{host}/"
+    started = time.perf_counter()
+    response = _fetch(path, host, secure)
+    status = response.status_code
+    head, size = _read(response) if status == 200 else (HeadTags(), len(getattr(response, "content", b"")))
+    elapsed_ms = round((time.perf_counter() - started) * 1000)
+    result = evaluate(path, status, head, base)
+    result.response_ms, result.html_bytes = elapsed_ms, size
+    return result
+
+
+def _check_in_worker(path: str, host: str, secure: bool) -> SeoResult:
+    try:
+        return check_path(path, host, secure)
+    finally:
+        connections.close_all()  # worker threads outlive the run; do not keep their connections open
+
+
+def check_paths(paths: list[str], host: str, secure: bool = True, workers: int | None = None) -> Iterator[SeoResult]:
+    """
+    Yields results in completion order; workers <= 1 checks inline in the calling thread.
+    """
+    workers = getattr(settings, "SEO_CHECK_WORKERS", 4) if workers is None else workers
+    if workers <= 1:
+        for path in paths:
+            yield check_path(path, host, secure)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seo-check-worker") as pool:
+        futures = [pool.submit(_check_in_worker, path, host, secure) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def sitemap_paths(languages=None) -> list[str]:
+    """
+    Paths of every URL in the prebuilt sitemap shards (built first if there are none).
+    """
+    shards = SitemapFile.objects.exclude(section=SitemapFile.INDEX)
+    if languages:
+        shards = shards.filter(language__in=languages)
+    if not shards.exists():
+        build_sitemaps(languages=languages)
+    paths: list[str] = []
+    storage = sitemap_storage()
+    for entry in shards.order_by("language", "section", "page"):
+        if not storage.exists(entry.path):
+            continue
+        with storage.open(entry.path, "rb") as fh:
+            root = ElementTree.fromstring(gzip.decompress(fh.read()))
+        for loc in root.iter(f"{SITEMAP_NS}loc"):
+            paths.append(urlparse((loc.text or "").strip()).path or "/")
+    return list(dict.fromkeys(paths))
+
+
+def _save(run: SeoCheckRun, result: SeoResult) -> SeoCheckResult:
+    row = SeoCheckResult.objects.create(
+        run=run,
+        path=result.path,
+        status_code=result.status_code,
+        issues=[asdict(i) for i in result.issues],
+        extracted=result.extracted,
+        title_length=result.title_length,
+        description_length=result.description_length,
+        canonical=(result.extracted.get("canonical") or "")[:500],
+        hreflang=result.extracted.get("hreflang") or [],
+        response_ms=result.response_ms,
+        html_bytes=result.html_bytes,
+    )
+    SeoCheckRun.objects.filter(pk=run.pk).update(done=F("done") + 1)
+    return row
+
+
+def execute_run(run_id: int, workers: int | None = None, on_result: Callable | None = None) -> SeoCheckRun:
+    run = SeoCheckRun.objects.get(pk=run_id)
+    run.status = SeoCheckRun.STATUS_RUNNING
+    run.started_at = timezone.now()
+    run.save(update_fields=["status", "started_at"])
+    try:
+        paths = list(dict.fromkeys(run.paths + (sitemap_paths() if run.crawl_sitemap else [])))
+        SeoCheckRun.objects.filter(pk=run.pk).update(total=len(paths))
+        for result in check_paths(paths, run.host, run.secure, workers):
+            row = _save(run, result)
+            if on_result:
+                on_result(row)
+        run.status = SeoCheckRun.STATUS_DONE
+    except Exception as exc:  # the run is marked failed, the traceback goes to the log
+        logger.exception("SEO check run %s failed", run_id)
+        run.status = SeoCheckRun.STATUS_FAILED
+        run.error = str(exc)
+    run.finished_at = timezone.now()
+    run.save(update_fields=["status", "error", "finished_at"])
+    return run
+
+
+def fail_stale_runs() -> int:
+    """
+    Marks runs failed that made no progress for SEO_CHECK_STALE_MINUTES: still queued, or running without
+    a new result (a lost task or a worker that was restarted mid-run). Returns how many.
+    """
+    cutoff = timezone.now() - timedelta(minutes=getattr(settings, "SEO_CHECK_STALE_MINUTES", 15))
+    recent = SeoCheckResult.objects.filter(run=OuterRef("pk"), checked_at__gte=cutoff)
+    stale = SeoCheckRun.objects.filter(
+        Q(status=SeoCheckRun.STATUS_QUEUED, created_at__lt=cutoff)
+        | Q(status=SeoCheckRun.STATUS_RUNNING, started_at__lt=cutoff) & ~Exists(recent)
+    )
+    return stale.update(
+        status=SeoCheckRun.STATUS_FAILED, error="No progress; the worker running it was lost.", finished_at=timezone.now()
+    )
+
+
+def start_run(run: SeoCheckRun) -> None:
+    """
+    Queues the run as a Celery task once the creating transaction commits;
+    with SEO_CHECK_WORKERS = 0 (tests) it runs inline instead.
+    """
+    if getattr(settings, "SEO_CHECK_WORKERS", 4) == 0:
+        execute_run(run.pk, workers=0)
+        return
+    from core.tasks import run_seo_check_task
+
+    transaction.on_commit(lambda: run_seo_check_task.delay(run.pk))
+
+
+# ---------- Comparing runs ----------
+
+DIFF_FIELDS = ("status_code", "title_length", "description_length", "canonical", "hreflang")
+
+
+@dataclass
+class PathDiff:
+    path: str
+    before: SeoCheckResult | None
+    after: SeoCheckResult | None
+
+    def changes(self) -> list[str]:
+        if self.before is None:
+            return ["new"]
+        if self.after is None:
+            return ["gone"]
+        changed = [
+            f"{name}: {getattr(self.before, name)!r} -> {getattr(self.after, name)!r}"
+            for name in DIFF_FIELDS
+            if getattr(self.before, name) != getattr(self.after, name)
+        ]
+        before_issues, after_issues = len(self.before.issues), len(self.after.issues)
+        if before_issues != after_issues:
+            changed.append(f"issues: {before_issues} -> {after_issues}")
+        return changed
+
+    def regressions(self, threshold: float = 0.2, min_ms: int = 50) -> list[str]:
+        """
+        Response time up by more than `threshold` (and at least min_ms, to ignore noise on fast pages)
+        or HTML size up by more than `threshold`.
+        """
+        if self.before is None or self.after is None:
+            return []
+        found = []
+        old_ms, new_ms = self.before.response_ms, self.after.response_ms
+        if old_ms is not None and new_ms is not None and new_ms - old_ms >= min_ms and new_ms > old_ms * (1 + threshold):
+            found.append(f"response {old_ms} ms -> {new_ms} ms")
+        old_size, new_size = self.before.html_bytes, self.after.html_bytes
+        if old_size and new_size is not None and new_size > old_size * (1 + threshold):
+            found.append(f"html {old_size} B -> {new_size} B")
+        return found
+
+
+def diff_runs(base: SeoCheckRun, run: SeoCheckRun) -> list[PathDiff]:
+    """
+    Pairs the results of two runs by path (in the order of `run`, paths only in `base` last).
+    """
+    before = {r.path: r for r in base.results.all()}
+    after = {r.path: r for r in run.results.all()}
+    paths = list(dict.fromkeys([*after, *before]))
+    return [PathDiff(path, before.get(path), after.get(path)) for path in paths]
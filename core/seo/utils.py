@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.urls import reverse
 
+from core.urlbuilder import route, urls_for
+
 
 def absolute_url(path_or_url: str) -> str:
     if path_or_url.startswith("http"):
@@ -13,8 +15,20 @@ def localized_alternates(request, url_name: str, kwargs: dict | None = None) ->
     from django.utils.translation import override
     alts = []
     for code, _ in settings.LANGUAGES:
-        with override(code):
-            path = reverse(url_name, kwargs=kwargs or {})
-            alts.append({"lang": code, "url": absolute_url(path)})
+        if not kwargs or set(kwargs) == {"slug"}:
+            path = route(url_name, code, (kwargs or {}).get("slug"))
+        else:
+            with override(code):
+                path = reverse(url_name, kwargs=kwargs)
+        alts.append({"lang": code, "url": absolute_url(path)})
+    alts.append({"lang": "x-default", "url": absolute_url(request.path)})
+    return alts
+
+
+def object_alternates(request, obj) -> list[dict]:
+    """
+    hreflang links of a detail page: the object's own URL in every language it exists in.
+    """
+    alts = [{"lang": code, "url": absolute_url(path)} for code, path in urls_for(obj).items()]
     alts.append({"lang": "x-default", "url": absolute_url(request.path)})
     return alts
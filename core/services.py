@@ -2,190 +2,169 @@ from __future__ import annotations
 
 import difflib
 import re
+from collections.abc import Iterable
 from html import escape
-from typing import Any, Dict, List, Tuple, Optional, Iterable
-
-from django.db.models import Count, Q, QuerySet
-from django.urls import reverse
-from django.utils.html import strip_tags
+from typing import Any
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.urls import NoReverseMatch, reverse
+from django.utils import translation
 from django.utils.translation import get_language
 from parler.utils.context import switch_language
+from parler.utils.i18n import get_active_language_choices
 from reversion.models import Version
 
-from guides.models import Guide
+from content.rendering import plain_text
+from core.models import TeaserEntry
+from core.related import related_ids
+from core.urlbuilder import attach_urls
+from guides.models import Guide, GuideItem
 from prompts.models import Prompt
 from usecases.models import UseCase
 
 
-def get_latest_items(limit: int = 6, mix: Tuple[int, int, int] = (3, 2, 1)) -> List[Dict[str, Any]]:
+def _latest_rows(language: str, limit: int):
     """
-    Returns a balanced, recency-sorted mix of Guides/Prompts/UseCases based on mix;
-    includes robust fallbacks when a type has too few items.
+    Newest `limit` TeaserEntry rows per kind in one windowed query.
     """
-    g_need, p_need, u_need = mix
-
-    # Base-Querysets – robust sortiert
-    g_qs: QuerySet = _safe_order_by_published(Guide.published)
-    p_qs: QuerySet = _safe_order_by_published(Prompt.published)
-    u_qs: QuerySet = _safe_order_by_published(UseCase.published)
-
-    items: List[Dict[str, Any]] = []
+    return (
+        TeaserEntry.objects
+        .filter(language=language)
+        .annotate(
+            kind_rank=Window(
+                RowNumber(),
+                partition_by=[F("kind")],
+                order_by=F("date").desc(nulls_last=True),
+            )
+        )
+        .filter(kind_rank__lte=limit)
+        .order_by(F("date").desc(nulls_last=True))
+        .values("kind", "title", "teaser", "url", "date", "badge", "kind_rank")
+    )
 
-    # Primärbedarf decken
-    g_pick = list(g_qs[:g_need])
-    p_pick = list(p_qs[:p_need])
-    u_pick = list(u_qs[:u_need])
 
-    items.extend([to_teaser_item(g, "guide") for g in g_pick])
-    items.extend([to_teaser_item(p, "prompt") for p in p_pick])
-    items.extend([to_teaser_item(u, "usecase") for u in u_pick])
+def _mix_latest(rows, limit: int, mix: tuple[int, int, int]) -> list[dict[str, Any]]:
+    needs = dict(zip(("guide", "prompt", "usecase"), mix))
+    items: list[dict[str, Any]] = []
+    leftovers: list[dict[str, Any]] = []
+    for row in rows:
+        rank = row.pop("kind_rank")
+        (items if rank <= needs.get(row["kind"], 0) else leftovers).append(row)
 
     # Fill remaining slots with the most recent leftover items (all types together)
     deficit = max(0, limit - len(items))
-    if deficit:
-        # IDs ausschließen, die schon drin sind
-        taken_ids = {
-            *[("guide", g.pk) for g in g_pick],
-            *[("prompt", p.pk) for p in p_pick],
-            *[("usecase", u.pk) for u in u_pick],
-        }
-
-        def rest(qs, kind):
-            for obj in qs:
-                key = (kind, obj.pk)
-                if key not in taken_ids:
-                    yield to_teaser_item(obj, kind)
-
-        merged = []
-        merged.extend(list(rest(g_qs[g_need: g_need + limit * 2], "guide")))
-        merged.extend(list(rest(p_qs[p_need: p_need + limit * 2], "prompt")))
-        merged.extend(list(rest(u_qs[u_need: u_need + limit * 2], "usecase")))
-        merged.sort(key=lambda x: (x.get("date") or 0), reverse=True)
-        items.extend(merged[:deficit])
+    items.extend(leftovers[:deficit])
 
     items.sort(key=lambda x: (x.get("date") or 0), reverse=True)
     return items[:limit]
 
 
-def related_guides(guide, limit=6):
+def get_latest_items(limit: int = 6, mix: tuple[int, int, int] = (3, 2, 1),
+                     language: str | None = None) -> list[dict[str, Any]]:
     """
-    Finds relevant Guides by shared categories and tools;
-    falls back to temporally close Guides when metadata is sparse;
-    excludes the current item.
+    Returns a balanced, recency-sorted mix of Guides/Prompts/UseCases based on mix;
+    reads the TeaserEntry read-model with one windowed query (newest `limit` rows per kind)
+    and fills slots of types with too few items from the most recent leftovers.
     """
+    rows = list(_latest_rows(language or get_language(), limit))
+    return _mix_latest(rows, limit, mix)
 
-    if guide is None:
-        return Guide.objects.none()
-    cat_ids = _ids(guide.categories.all()) if hasattr(guide, "categories") else []
-    tool_ids = (
-        _ids(guide.tools.all()) if hasattr(guide, "tools") else []
-    )
 
-    qs = Guide.published.exclude(pk=guide.pk).prefetch_related(
-        "categories", "tools__translations"
-    )
+async def aget_latest_items(limit: int = 6, mix: tuple[int, int, int] = (3, 2, 1),
+                            language: str | None = None) -> list[dict[str, Any]]:
+    """
+    get_latest_items for async views (async ORM, no thread hop of its own).
+    """
+    rows = [row async for row in _latest_rows(language or get_language(), limit)]
+    return _mix_latest(rows, limit, mix)
 
-    qs = (
-        qs.filter(Q(categories__in=cat_ids) | Q(tools__in=tool_ids))
-        .annotate(
-            cat_matches=Count(
-                "categories", filter=Q(categories__in=cat_ids), distinct=True
-            ),
-            tool_matches=Count(
-                "tools", filter=Q(tools__in=tool_ids), distinct=True
-            ),
-        )
-        .annotate(score=Count("id"))
-        .order_by("-cat_matches", "-tool_matches", "-published_at")
-    )
 
-    items = list(qs[:limit])
+def _related_from_graph(model, kind: str, obj, limit: int) -> list:
+    """
+    Reads the precomputed neighbours of obj (core.related) for the active language,
+    keeps only currently published ones and tops up with the most recent items when the graph is sparse.
+    """
+    ids = related_ids(kind, obj.pk, get_language(), limit * 2)
+    by_pk = model.published.in_bulk(ids) if ids else {}
+    items = [by_pk[pk] for pk in ids if pk in by_pk][:limit]
     if len(items) < limit:
-        fallback = Guide.published.exclude(
-            pk__in=[g.pk for g in items] + [guide.pk]
+        fallback = model.published.exclude(
+            pk__in=[i.pk for i in items] + [obj.pk]
         ).order_by("-published_at")[: limit - len(items)]
         items.extend(fallback)
     return items[:limit]
 
 
-def related_prompts(prompt, limit=8):
+def related_guides(guide, limit=6):
     """
-    Like related_guides but for Prompts: ranks by overlapping categories/tools;
-    uses a time-based fallback if relations are missing.
+    Finds relevant Guides by shared categories and tools (weighted, precomputed graph);
+    falls back to temporally close Guides when metadata is sparse;
+    excludes the current item.
     """
-    tag_ids = _ids(prompt.tags.all()) if hasattr(prompt, "tags") else []
-    tool_ids = _ids(prompt.tools.all()) if hasattr(prompt, "tools") else []
+    if guide is None:
+        return Guide.objects.none()
+    return _related_from_graph(Guide, "guide", guide, limit)
 
-    qs = Prompt.published.exclude(pk=prompt.pk).prefetch_related("tags", "tools__translations")
 
-    if tag_ids or tool_ids:
-        qs = (
-            qs.filter(Q(tags__in=tag_ids) | Q(tools__in=tool_ids))
-            .annotate(
-                tag_matches=Count("tags", filter=Q(tags__in=tag_ids), distinct=True),
-                tool_matches=Count(
-                    "tools", filter=Q(tools__in=tool_ids), distinct=True
-                ),
-            )
-            .order_by("-tag_matches", "-tool_matches", "-published_at")
-        )
-    else:
-        qs = qs.order_by("-published_at")
-
-    items = list(qs[:limit])
-    if len(items) < limit:
-        fallback = Prompt.published.exclude(
-            pk__in=[p.pk for p in items] + [prompt.pk]
-        ).order_by("-published_at")[: limit - len(items)]
-        items.extend(fallback)
-    return items[:limit]
+def related_prompts(prompt, limit=8):
+    """
+    Like related_guides but for Prompts: ranks by overlapping tags/tools;
+    uses a time-based fallback if relations are missing.
+    """
+    return _related_from_graph(Prompt, "prompt", prompt, limit)
 
 
 def related_usecases(usecase, limit=6):
     """
-    Like above for UseCases;
+    Like above for UseCases (persona and tools);
     ensures “something useful” is returned even for fresh entries with little metadata.
     """
-    lang = get_language() or "en"
-    persona = usecase.safe_translation_getter("persona", any_language=False)
-    tool_ids = _ids(usecase.tools.all()) if hasattr(usecase, "tools") else []
-
-    qs = UseCase.published.exclude(pk=usecase.pk).prefetch_related("tools")
+    return _related_from_graph(UseCase, "usecase", usecase, limit)
 
-    persona_q = Q()
-    if persona:
-        persona_q = Q(persona__iexact=persona)
 
-    if persona or tool_ids:
-        qs = (
-            qs.filter(persona_q | Q(tools__in=tool_ids))
-            .annotate(
-                persona_match=Count("id", filter=Q(translations__language_code=lang, translations__persona=persona)),
-                tool_matches=Count("tools", filter=Q(tools__in=tool_ids), distinct=True),
-            )
-            .order_by("-persona_match", "-tool_matches", "-published_at")
-        )
-    else:
-        qs = qs.order_by("-published_at")
+# ---------- Guide items ----------
 
-    items = list(qs[:limit])
-    if len(items) < limit:
-        fallback = UseCase.published.exclude(
-            pk__in=[u.pk for u in items] + [usecase.pk]
-        ).order_by("-published_at")[: limit - len(items)]
-        items.extend(fallback)
-    return items[:limit]
 
+def attach_item_content(items: Iterable[GuideItem], language: str | None = None) -> None:
+    """
+    Batch stage for guide item cards: groups the items by content_type, loads each target model in one
+    query (translations prefetched, URLs attached), fills the content_object caches and stores title,
+    teaser and url on the items, so rendering the cards needs no further queries.
+    """
+    language = language or get_language()
+    items = [item for item in items if item is not None]
+    wanted: dict[int, set] = {}
+    for item in items:
+        if item.content_type_id and item.object_id:
+            wanted.setdefault(item.content_type_id, set()).add(item.object_id)
 
-# ---------- Helpers ----------
+    with translation.override(language):
+        targets = {}
+        for ct_id, ids in wanted.items():
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            if model is None:
+                continue
+            qs = model._default_manager.filter(pk__in=ids)
+            if hasattr(model, "_parler_meta"):
+                qs = qs.prefetch_related("translations")
+            objs = list(qs)
+            attach_urls(objs, [language])
+            targets.update({(ct_id, obj.pk): obj for obj in objs})
+
+        field = GuideItem._meta.get_field("content_object")
+        for item in items:
+            item.set_current_language(language)
+            item.__dict__.pop("_card", None)
+            if item.content_type_id and item.object_id:
+                field.set_cached_value(item, targets.get((item.content_type_id, item.object_id)))
+            item.__dict__["_card"] = {"title": item.get_title(), "teaser": item.get_teaser(), "url": item.get_url()}
 
 
-def _safe_order_by_published(qs):
-    try:
-        str(qs.order_by("-published_at").query)
-        return qs.order_by("-published_at")
-    except Exception:
-        return qs.order_by("-id")
+# ---------- Helpers ----------
 
 
 def _first(seq):
@@ -205,7 +184,7 @@ def teaser_for_guide(g: Guide, limit: int = 160) -> str:
         src = getter("intro", any_language=True) or getter("body", any_language=True) or ""
     else:
         src = getattr(g, "intro", None) or getattr(g, "body", "") or ""
-    return (strip_tags(src) or "")[:limit]
+    return plain_text(g, src)[:limit]
 
 
 def teaser_for_prompt(p: Prompt, limit: int = 160) -> str:
@@ -227,7 +206,7 @@ def teaser_for_prompt(p: Prompt, limit: int = 160) -> str:
         body = getattr(p, "intro", None) or getattr(p, "body", "") or ""
 
     src = ex or body
-    return (strip_tags(src) or "")[:limit]
+    return plain_text(p, src)[:limit]
 
 
 def teaser_for_usecase(u: UseCase, limit: int = 160) -> str:
@@ -246,7 +225,7 @@ def teaser_for_usecase(u: UseCase, limit: int = 160) -> str:
         step0 = _first(steps) if isinstance(steps, (list, tuple)) else ""
         src = step0 or ""
 
-    return (strip_tags(src) or "")[:limit]
+    return plain_text(u, src)[:limit]
 
 
 def _t(obj, field):
@@ -260,7 +239,7 @@ def _t(obj, field):
     return getattr(obj, field, "") or ""
 
 
-def to_teaser_item(obj, kind: str) -> Dict[str, Any]:
+def to_teaser_item(obj, kind: str) -> dict[str, Any]:
     """
     Factory that converts any supported object into the unified teaser dict
     based on kind to simplify front-end consumption.
@@ -298,8 +277,49 @@ def to_teaser_item(obj, kind: str) -> Dict[str, Any]:
     }
 
 
-def _ids(qs, field="id"):
-    return list(qs.values_list(field, flat=True))
+TEASER_KINDS = {
+    "guides.guide": "guide",
+    "prompts.prompt": "prompt",
+    "usecases.usecase": "usecase",
+}
+
+
+def sync_teaser_entries(obj) -> None:
+    """
+    Rebuilds the TeaserEntry rows of a Guide/Prompt/UseCase: one row per site language
+    (including Parler fallbacks) while the object is published, none otherwise.
+    """
+    kind = TEASER_KINDS.get(obj._meta.label_lower)
+    if not kind or not obj.pk:
+        return
+
+    entries = TeaserEntry.objects.filter(kind=kind, object_id=obj.pk)
+    if getattr(obj, "status", None) != getattr(obj, "STATUS_PUBLISHED", "published"):
+        entries.delete()
+        return
+
+    available = set(obj.get_available_languages())
+    rows = []
+    for code, _name in settings.LANGUAGES:
+        if not available.intersection(get_active_language_choices(code)):
+            continue
+        with switch_language(obj, code), translation.override(code):
+            try:
+                item = to_teaser_item(obj, kind)
+            except NoReverseMatch:
+                # incomplete translation (e.g. slug not set yet) – retried once the translation is saved
+                continue
+        rows.append(TeaserEntry(kind=kind, object_id=obj.pk, language=code, **item))
+
+    with transaction.atomic():
+        entries.exclude(language__in=[r.language for r in rows]).delete()
+        if rows:
+            TeaserEntry.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["kind", "object_id", "language"],
+                update_fields=["title", "teaser", "url", "date", "badge"],
+            )
 
 
 TEXT_FIELDS = ("title", "intro", "body")
@@ -366,7 +386,7 @@ class _LiveSnapshotProxy:
         return self.__getattr__("public_slug")
 
 
-def get_live_display_instance(obj, language: Optional[str] = None):
+def get_live_display_instance(obj, language: str | None = None):
     """
     Builds a display-only proxy for the live snapshot in the requested (or current) language;
     safe to pass into templates/serializers.
@@ -0,0 +1,349 @@
+# core/signals.py
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django_fsm.signals import post_transition, pre_transition
+
+from catalog.models import Tool
+from compare.models import Comparison
+from content.rendering import RENDERED_FIELDS, render_translation
+from content.sanitizer import warm
+from core.cache import invalidate_tags, tag_for
+from core.events import (
+    EVENT_TRANSITIONS,
+    LIVE_EDIT_EVENT,
+    begin_event,
+    content_changed,
+    flush_events,
+    queue_event,
+)
+from core.models import RelatedItem, TeaserEntry
+from core.models.editorial import EditorialWorkflowMixin
+from core.related import GRAPH_MODELS, kind_for, schedule_related_refresh
+from core.search import (
+    GLOSSARY_SOURCE_FIELDS,
+    remove_search_documents,
+    sync_search_documents,
+)
+from core.services import TEASER_KINDS, sync_teaser_entries
+from core.sitemaps import SECTION_FOR_MODEL, schedule_sitemap_refresh
+from glossary.autocomplete import invalidate_trie
+from glossary.models import GlossaryTerm
+from guides.models import Guide, GuideItem, GuideSection
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+TEASER_SOURCE_FIELDS = {"status", "published_at"}
+
+GuideTranslation = Guide._parler_meta.root_model
+PromptTranslation = Prompt._parler_meta.root_model
+UseCaseTranslation = UseCase._parler_meta.root_model
+ComparisonTranslation = Comparison._parler_meta.root_model
+ToolTranslation = Tool._parler_meta.root_model
+GuideItemTranslation = GuideItem._parler_meta.root_model
+
+# translation models with a stored `rendered` column (content.rendering)
+RENDERED_TRANSLATIONS = {
+    model._parler_meta.root_model: RENDERED_FIELDS[model._meta.label_lower]
+    for model in (Guide, GuideSection, Prompt, UseCase, Tool)
+}
+# remaining fields rendered through the `richtext` filter
+RICHTEXT_FIELDS = {
+    ComparisonTranslation: ("intro",),
+    GlossaryTerm: ("long_definition",),
+}
+
+
+@receiver(post_save, sender=Guide)
+@receiver(post_save, sender=Prompt)
+@receiver(post_save, sender=UseCase)
+def teaser_master_saved(sender, instance, update_fields=None, **kwargs):
+    """
+    Re-syncs the teaser read-model whenever the workflow state may have changed (publish, archive, ...);
+    narrow saves such as update_fields=["live_i18n"] are skipped.
+    """
+    if update_fields and not TEASER_SOURCE_FIELDS.intersection(update_fields):
+        return
+    sync_teaser_entries(instance)
+
+
+@receiver(post_save, sender=GuideTranslation)
+@receiver(post_save, sender=PromptTranslation)
+@receiver(post_save, sender=UseCaseTranslation)
+def teaser_translation_saved(sender, instance, **kwargs):
+    """
+    Parler saves translations after their master, so titles and intros are only final here.
+    """
+    master = getattr(instance, "master", None)
+    if master is not None:
+        sync_teaser_entries(master)
+
+
+@receiver(post_delete, sender=Guide)
+@receiver(post_delete, sender=Prompt)
+@receiver(post_delete, sender=UseCase)
+def teaser_master_deleted(sender, instance, **kwargs):
+    TeaserEntry.objects.filter(kind=TEASER_KINDS[sender._meta.label_lower], object_id=instance.pk).delete()
+
+
+# ---------- Related-content graph ----------
+
+
+@receiver(post_save, sender=Guide)
+@receiver(post_save, sender=Prompt)
+@receiver(post_save, sender=UseCase)
+def related_master_saved(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    Publishing/archiving changes which neighbours are eligible, so the affected nodes are recomputed.
+    """
+    if created or (update_fields and not TEASER_SOURCE_FIELDS.intersection(update_fields)):
+        return
+    schedule_related_refresh(kind_for(instance), [instance.pk])
+
+
+@receiver(post_save, sender=UseCaseTranslation)
+def related_persona_saved(sender, instance, **kwargs):
+    if instance.master_id:
+        schedule_related_refresh("usecase", [instance.master_id])
+
+
+@receiver(m2m_changed, sender=Guide.categories.through)
+@receiver(m2m_changed, sender=Guide.tools.through)
+@receiver(m2m_changed, sender=Prompt.tools.through)
+@receiver(m2m_changed, sender=Prompt.tags.through)
+@receiver(m2m_changed, sender=UseCase.tools.through)
+def related_relations_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Only the changed item and its (old or new) neighbours are recomputed;
+    reverse-side changes (e.g. category.guide_set.add) refresh every touched item.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if kind_for(instance):
+        schedule_related_refresh(kind_for(instance), [instance.pk])
+    elif model in GRAPH_MODELS.values() and pk_set:
+        schedule_related_refresh(kind_for(model), pk_set)
+
+
+@receiver(post_delete, sender=Guide)
+@receiver(post_delete, sender=Prompt)
+@receiver(post_delete, sender=UseCase)
+def related_master_deleted(sender, instance, **kwargs):
+    kind = kind_for(instance)
+    RelatedItem.objects.filter(kind=kind, object_id=instance.pk).delete()
+    RelatedItem.objects.filter(kind=kind, related_id=instance.pk).delete()
+
+
+# ---------- Search documents ----------
+
+
+@receiver(post_save, sender=Guide)
+@receiver(post_save, sender=Prompt)
+@receiver(post_save, sender=UseCase)
+@receiver(post_save, sender=Comparison)
+@receiver(post_save, sender=Tool)
+@receiver(post_save, sender=GlossaryTerm)
+def search_master_saved(sender, instance, update_fields=None, **kwargs):
+    source_fields = GLOSSARY_SOURCE_FIELDS if sender is GlossaryTerm else TEASER_SOURCE_FIELDS
+    if update_fields and not source_fields.intersection(update_fields):
+        return
+    sync_search_documents(instance)
+
+
+@receiver(post_save, sender=GuideTranslation)
+@receiver(post_save, sender=PromptTranslation)
+@receiver(post_save, sender=UseCaseTranslation)
+@receiver(post_save, sender=ComparisonTranslation)
+@receiver(post_save, sender=ToolTranslation)
+def search_translation_saved(sender, instance, **kwargs):
+    master = getattr(instance, "master", None)
+    if master is not None:
+        sync_search_documents(master)
+
+
+@receiver(m2m_changed, sender=Comparison.tools.through)
+def search_comparison_tools_changed(sender, instance, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear") and isinstance(instance, Comparison):
+        sync_search_documents(instance)
+
+
+@receiver(post_delete, sender=Guide)
+@receiver(post_delete, sender=Prompt)
+@receiver(post_delete, sender=UseCase)
+@receiver(post_delete, sender=Comparison)
+@receiver(post_delete, sender=Tool)
+@receiver(post_delete, sender=GlossaryTerm)
+def search_master_deleted(sender, instance, **kwargs):
+    remove_search_documents(instance)
+
+
+# ---------- Editorial events / cache tags ----------
+
+
+@receiver(pre_transition)
+def content_transition_started(sender, instance, name, **kwargs):
+    if isinstance(instance, EditorialWorkflowMixin) and name in EVENT_TRANSITIONS:
+        begin_event(instance)
+
+
+@receiver(post_transition)
+def content_transition_done(sender, instance, name, **kwargs):
+    """
+    Transitions only change the in-memory state; the event is sent once the caller has saved it.
+    """
+    if isinstance(instance, EditorialWorkflowMixin) and name in EVENT_TRANSITIONS:
+        queue_event(instance, name)
+
+
+def _queue_live_edit(instance) -> None:
+    """
+    Content without a live snapshot (comparisons) shows its current fields, so saving a published item is an
+    event of its own even without a transition.
+    """
+    live = not hasattr(instance, "live_i18n") and instance.status == instance.STATUS_PUBLISHED
+    if live and not getattr(instance, "_content_events", None):
+        queue_event(instance, LIVE_EDIT_EVENT)
+
+
+@receiver(post_save)
+def content_transition_saved(sender, instance, **kwargs):
+    if isinstance(instance, EditorialWorkflowMixin):
+        instance.write_live_snapshots()
+        _queue_live_edit(instance)
+        flush_events(instance)
+
+
+@receiver(post_save, sender=ComparisonTranslation)
+@receiver(m2m_changed, sender=Comparison.tools.through)
+def comparison_parts_changed(sender, instance, action=None, model=None, pk_set=None, **kwargs):
+    """
+    Translations and tools of a published comparison are live as well.
+    """
+    if action not in (None, "post_add", "post_remove", "post_clear"):
+        return
+    if sender is ComparisonTranslation:
+        comparisons = [instance.master]
+    elif isinstance(instance, Comparison):
+        comparisons = [instance]
+    else:  # tool.comparisons.add(...)
+        comparisons = Comparison.objects.filter(pk__in=pk_set or ())
+    for comparison in comparisons:
+        _queue_live_edit(comparison)
+        flush_events(comparison)
+
+
+@receiver(content_changed)
+def purge_content_tags(sender, instance, **kwargs):
+    invalidate_tags(sender, instance)
+
+
+@receiver(post_save, sender=Tool)
+@receiver(post_save, sender=GlossaryTerm)
+@receiver(post_delete, sender=Tool)
+@receiver(post_delete, sender=GlossaryTerm)
+def purge_catalog_tags(sender, instance, **kwargs):
+    """
+    Tools and glossary terms have no workflow; every save is live.
+    """
+    transaction.on_commit(lambda: invalidate_tags(sender, instance))
+
+
+@receiver(post_save, sender=GuideItem)
+@receiver(post_save, sender=GuideItemTranslation)
+@receiver(post_delete, sender=GuideItem)
+def purge_guide_item_tags(sender, instance, **kwargs):
+    """
+    Guide items have no updated_at; their cached cards (guideitem-card fragment) are purged by tag.
+    """
+    item_id = instance.master_id if sender is GuideItemTranslation else instance.pk
+    transaction.on_commit(lambda: invalidate_tags(tag_for(GuideItem, item_id)))
+
+
+# ---------- Glossary autocomplete ----------
+
+
+def _glossary_languages(instance) -> set[str]:
+    """
+    The term's language and, if the save moved it, the language it had before.
+    """
+    return {instance.language} | getattr(instance, "_languages_before_save", set())
+
+
+@receiver(pre_save, sender=GlossaryTerm)
+def glossary_language_before_save(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        return
+    before = sender._default_manager.filter(pk=instance.pk).values_list("language", flat=True).first()
+    instance._languages_before_save = {before} if before and before != instance.language else set()
+
+
+@receiver(post_save, sender=GlossaryTerm)
+@receiver(post_delete, sender=GlossaryTerm)
+def glossary_trie_changed(sender, instance, **kwargs):
+    """
+    The tries of the term's languages (old and new) are rebuilt on their next lookup (in every worker).
+    """
+    languages = _glossary_languages(instance)
+
+    def invalidate():
+        for language in languages:
+            invalidate_trie(language)
+
+    transaction.on_commit(invalidate)
+
+
+# ---------- Sitemaps ----------
+
+
+@receiver(content_changed)
+def sitemap_content_changed(sender, instance, languages=(), old_slugs=None, **kwargs):
+    """
+    Only the section of the changed model is rebuilt, in the languages the item had or has.
+    """
+    section = SECTION_FOR_MODEL.get(sender._meta.label_lower)
+    if section:
+        schedule_sitemap_refresh(section, set(languages) | set(old_slugs or ()))
+
+
+@receiver(post_save, sender=Tool)
+@receiver(post_save, sender=ToolTranslation)
+@receiver(post_delete, sender=Tool)
+def sitemap_tool_changed(sender, instance, **kwargs):
+    schedule_sitemap_refresh("tools")
+
+
+@receiver(post_save, sender=GlossaryTerm)
+@receiver(post_delete, sender=GlossaryTerm)
+def sitemap_glossary_changed(sender, instance, **kwargs):
+    schedule_sitemap_refresh("glossary-terms", _glossary_languages(instance))
+
+
+# ---------- Richtext sanitizer ----------
+
+
+@receiver(pre_save)
+def richtext_render(sender, instance, update_fields=None, **kwargs):
+    """
+    Sanitize-on-save pipeline: stores sanitized HTML, plain text, word count and excerpt of every
+    richtext field in the translation's `rendered` column (unchanged fields are not cleaned again).
+    """
+    fields = RENDERED_TRANSLATIONS.get(sender)
+    if not fields:
+        return
+    if update_fields is not None and "rendered" not in update_fields:
+        return
+    instance.rendered = render_translation(instance, fields)
+
+
+@receiver(post_save)
+def richtext_saved(sender, instance, **kwargs):
+    """
+    Sanitize-on-save (RICHTEXT_SANITIZE_ON_SAVE): the memoized sanitizer is filled after commit,
+    so the first render is already a cache lookup.
+    """
+    fields = RICHTEXT_FIELDS.get(sender)
+    if not fields or not getattr(settings, "RICHTEXT_SANITIZE_ON_SAVE", False):
+        return
+    values = [getattr(instance, f, "") for f in fields]
+    transaction.on_commit(lambda: warm(*values))
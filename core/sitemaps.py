@@ -1,11 +1,33 @@
-# core/sitemaps.py (Pfad an dein Projekt anpassen)
+# core/sitemaps.py
+"""
+Sitemap sections plus the build stage that renders them ahead of time: per language and section,
+shards of up to Sitemap.limit (50k) URLs are gzipped into the shared file storage (sitemap_storage) and
+recorded as SitemapFile rows, together with one index over all shards. Crawlers get these files
+(core.views_sitemaps); sections are rebuilt incrementally when content changes (core.signals, debounced into
+one Celery task per section, core.tasks) or by `manage.py build_sitemaps`.
+"""
+import gzip
+import hashlib
+from types import SimpleNamespace
+from urllib.parse import urlsplit
 
+from django.conf import settings
 from django.contrib.sitemaps import Sitemap
-from django.utils import timezone
+from django.contrib.sitemaps.views import SitemapIndexItem
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage, storages
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils import timezone, translation
 from django.utils.translation import get_language
 
 from catalog.models import Tool
 from compare.models import Comparison
+from core.batching import collect_on_commit
+from core.models import SitemapFile
+from core.seo.utils import absolute_url
+from core.urlbuilder import UrlPaginator, site_languages
 from glossary.models import GlossaryTerm
 from guides.models import Guide
 from prompts.models import Prompt
@@ -17,55 +39,50 @@ DEFAULT_LANG = "de"
 class BasePublishableSitemap(Sitemap):
     changefreq = "weekly"
     priority = 0.8
+    lastmod_field = "updated_at"
 
     def lastmod(self, obj):
-        for field in (
-                "last_published_at",
-                "updated_at",
-                "modified",
-                "created",
-                "created_at",
-        ):
-            value = getattr(obj, field, None)
-            if value:
-                return value
-        return timezone.now()
+        return getattr(obj, self.lastmod_field, None)
 
     def location(self, obj):
         return obj.get_absolute_url()
 
 
-class GuideSitemap(BasePublishableSitemap):
-    def items(self):
-        manager = getattr(Guide, "published", None)
-        return (manager or Guide.objects).all()
+class TranslatedSitemap(BasePublishableSitemap):
+    """
+    Loads all translations of a shard in one prefetch query; locations come from the batch URL builder.
+    """
+    model = None
 
+    @property
+    def paginator(self):
+        return UrlPaginator(self._items(), self.limit)
 
-class PromptSitemap(BasePublishableSitemap):
     def items(self):
-        manager = getattr(Prompt, "published", None)
-        return (manager or Prompt.objects).all()
+        manager = getattr(self.model, "published", None)
+        return (manager or self.model.objects).all().prefetch_related("translations").order_by("pk")
 
 
-class UseCaseSitemap(BasePublishableSitemap):
-    def items(self):
-        manager = getattr(UseCase, "published", None)
-        return (manager or UseCase.objects).all()
+class GuideSitemap(TranslatedSitemap):
+    model = Guide
 
 
-class ComparisonSitemap(BasePublishableSitemap):
-    def items(self):
-        manager = getattr(Comparison, "published", None)
-        return (manager or Comparison.objects).all()
+class PromptSitemap(TranslatedSitemap):
+    model = Prompt
+
+
+class UseCaseSitemap(TranslatedSitemap):
+    model = UseCase
+
 
+class ComparisonSitemap(TranslatedSitemap):
+    model = Comparison
 
-class ToolSitemap(BasePublishableSitemap):
+
+class ToolSitemap(TranslatedSitemap):
     changefreq = "weekly"
     priority = 0.6
-
-    def items(self):
-        manager = getattr(Tool, "published", None)
-        return (manager or Tool.objects).all()
+    model = Tool
 
 
 class GlossaryIndexSitemap(Sitemap):
@@ -87,7 +104,7 @@ class GlossaryTermSitemap(BasePublishableSitemap):
     def items(self):
         lang = get_language() or DEFAULT_LANG
         manager = getattr(GlossaryTerm, "published", None)
-        qs = (manager or GlossaryTerm.objects).filter(language=lang)
+        qs = (manager or GlossaryTerm.objects).filter(language=lang).order_by("pk")
         return qs
 
 
@@ -103,3 +120,204 @@ class LegalSitemap(Sitemap):
         lang = get_language() or DEFAULT_LANG
         # -> /en/legal/privacy/, /de/legal/privacy/ etc.
         return f"/{lang}/legal/{item}/"
+
+
+SITEMAPS = {
+    "guides": GuideSitemap,
+    "prompts": PromptSitemap,
+    "usecases": UseCaseSitemap,
+    "comparisons": ComparisonSitemap,
+    "tools": ToolSitemap,
+    "glossary-index": GlossaryIndexSitemap,
+    "glossary-terms": GlossaryTermSitemap,
+    "legal": LegalSitemap,
+}
+
+# model label -> section rebuilt when objects of that model change
+SECTION_FOR_MODEL = {
+    "guides.guide": "guides",
+    "prompts.prompt": "prompts",
+    "usecases.usecase": "usecases",
+    "compare.comparison": "comparisons",
+    "catalog.tool": "tools",
+    "glossary.glossaryterm": "glossary-terms",
+}
+
+
+# ---------- Prebuilt files ----------
+
+
+def sitemap_storage():
+    """
+    A "sitemaps" entry in STORAGES if configured, else the default storage, which every instance of a
+    deployment shares (files under sitemaps/).
+    """
+    if "sitemaps" in settings.STORAGES:
+        return storages["sitemaps"]
+    return default_storage
+
+
+def _site():
+    """
+    Protocol and site from SITE_URL, so builds outside a request produce the public URLs
+    (Sitemap.get_urls only reads site.domain).
+    """
+    parts = urlsplit(getattr(settings, "SITE_URL", "") or "https://localhost")
+    return parts.scheme or "https", SimpleNamespace(domain=parts.netloc)
+
+
+def _file_path(language: str, section: str, page: int) -> str:
+    if section == SitemapFile.INDEX:
+        return "sitemaps/sitemap.xml.gz"
+    return f"sitemaps/{language}/{section}-{page}.xml.gz"
+
+
+def _store(language: str, section: str, page: int, xml: str, url_count: int) -> SitemapFile:
+    """
+    Writes the gzipped file unless its content is unchanged; an unchanged file keeps its ETag and
+    Last-Modified, so crawlers keep getting 304s for it.
+    """
+    data = xml.encode("utf-8")
+    etag = hashlib.md5(data).hexdigest()
+    path = _file_path(language, section, page)
+    storage = sitemap_storage()
+    entry = SitemapFile.objects.filter(language=language, section=section, page=page).first()
+    if entry and entry.etag == etag and storage.exists(entry.path):
+        return entry
+
+    if storage.exists(path):
+        storage.delete(path)
+    storage.save(path, ContentFile(gzip.compress(data, mtime=0)))
+    entry, _created = SitemapFile.objects.update_or_create(
+        language=language,
+        section=section,
+        page=page,
+        defaults={"path": path, "etag": etag, "url_count": url_count, "last_modified": timezone.now()},
+    )
+    return entry
+
+
+def _delete_files(entries) -> None:
+    storage = sitemap_storage()
+    for entry in entries:
+        if storage.exists(entry.path):
+            storage.delete(entry.path)
+        entry.delete()
+
+
+def build_section(language: str, section: str) -> int:
+    """
+    Renders every shard of one section in one language; shards that no longer exist are removed.
+    Returns the number of URLs.
+    """
+    sitemap = SITEMAPS[section]()
+    protocol, site = _site()
+    total = 0
+    with translation.override(language):
+        paginator = sitemap.paginator
+        pages = paginator.num_pages if paginator.count else 0
+        for page in range(1, pages + 1):
+            urls = sitemap.get_urls(page=page, protocol=protocol, site=site)
+            _store(language, section, page, render_to_string("sitemap.xml", {"urlset": urls}), len(urls))
+            total += len(urls)
+    _delete_files(SitemapFile.objects.filter(language=language, section=section, page__gt=pages))
+    return total
+
+
+def build_index() -> SitemapFile:
+    items = []
+    shards = SitemapFile.objects.exclude(section=SitemapFile.INDEX).order_by("language", "section", "page")
+    for entry in shards:
+        location = reverse(
+            "sitemap_section", kwargs={"language": entry.language, "section": entry.section, "page": entry.page}
+        )
+        items.append(SitemapIndexItem(absolute_url(location), entry.last_modified))
+    xml = render_to_string("sitemap_index.xml", {"sitemaps": items})
+    return _store("", SitemapFile.INDEX, 1, xml, len(items))
+
+
+def build_sitemaps(languages=None, sections=None) -> int:
+    """
+    (Re)builds the given sections (default: all) in the given languages (default: all site languages)
+    and then the index. Returns the number of URLs written.
+    """
+    total = 0
+    for language in languages or site_languages():
+        for section in sections or SITEMAPS:
+            total += build_section(language, section)
+    build_index()
+    return total
+
+
+def sitemap_locations(languages=None, sections=None) -> list[str]:
+    """
+    Every URL the given sections (default: all) list in the given languages (default: all site languages),
+    taken straight from the sitemap classes rather than from the prebuilt files.
+    """
+    protocol, site = _site()
+    locations: list[str] = []
+    for language in languages or site_languages():
+        for section in sections or SITEMAPS:
+            sitemap = SITEMAPS[section]()
+            with translation.override(language):
+                paginator = sitemap.paginator
+                for page in range(1, (paginator.num_pages if paginator.count else 0) + 1):
+                    locations.extend(url["location"] for url in sitemap.get_urls(page=page, protocol=protocol, site=site))
+    return list(dict.fromkeys(locations))
+
+
+SCHEDULED_KEY = "sitemaps:scheduled:{language}:{section}"
+
+
+def refresh_delay() -> int:
+    return getattr(settings, "SITEMAP_REFRESH_DELAY", 60)
+
+
+def refresh_sections(pairs) -> None:
+    """
+    Rebuilds the given (language, section) pairs and the index; run by core.tasks.refresh_sitemaps_task.
+    """
+    pairs = sorted({tuple(pair) for pair in pairs})
+    # cleared before the build reads any row, so changes committed from here on schedule another run
+    cache.delete_many([SCHEDULED_KEY.format(language=language, section=section) for language, section in pairs])
+    for language, section in pairs:
+        if section != SitemapFile.INDEX:  # the index is rebuilt last in any case
+            build_section(language, section)
+    build_index()
+
+
+def _enqueue(pairs: set) -> None:
+    """
+    Debounce: the first change of a section schedules its rebuild refresh_delay() seconds later, and
+    changes until then (e.g. the rest of a bulk import) ride along with that run.
+    """
+    from core.tasks import refresh_sitemaps_task
+
+    delay = refresh_delay()
+    due = [
+        (language, section) for language, section in sorted(pairs)
+        if cache.add(SCHEDULED_KEY.format(language=language, section=section), 1, delay * 2 + 60)
+    ]
+    if due:
+        refresh_sitemaps_task.apply_async((due,), countdown=delay)
+
+
+def schedule_missing_files(language: str, section: str) -> None:
+    """
+    A requested file that was never built (first request after a deploy) or is gone from the storage is
+    built by the debounced refresh task, not in the request; a missing index on a site without any shard
+    brings every section along.
+    """
+    pairs = {(language, section)}
+    if section == SitemapFile.INDEX and not SitemapFile.objects.exclude(section=SitemapFile.INDEX).exists():
+        pairs |= {(lang, name) for lang in site_languages() for name in SITEMAPS}
+    _enqueue(pairs)
+
+
+def schedule_sitemap_refresh(section: str, languages=None) -> None:
+    """
+    Rebuilds one section in the background after the current transaction commits; requests queued by several
+    saves in one transaction (master plus translations) are merged, later ones are debounced (_enqueue).
+    """
+    known = site_languages()
+    collect_on_commit(_enqueue, [(language, section) for language in languages or known if language in known])
@@ -0,0 +1,55 @@
+# core/tasks.py
+"""
+Celery tasks for work that must not run in the request: CDN purges (core.cdn), sitemap rebuilds
+(core.sitemaps), related-graph refreshes (core.related), SEO check runs (core.seo.checker) and the side
+effects of bulk transitions (core.workflow), plus the periodic indexing of tools whose scheduled publication
+date has passed (core.search; CELERY_BEAT_SCHEDULE).
+"""
+from celery import shared_task
+
+from core.cdn import purge_backend
+from core.related import refresh_related
+from core.search import index_due_tools
+from core.seo.checker import execute_run
+from core.sitemaps import refresh_sections
+from core.workflow import run_side_effects
+
+
+# URLError/timeouts of the purge API; the CDN copy expires after PAGE_CACHE_CDN_MAX_AGE regardless
+@shared_task(autoretry_for=(OSError,), retry_backoff=True, max_retries=3, ignore_result=True)
+def purge_surrogate_keys_task(keys: list[str]) -> None:
+    purge_backend().purge(keys)
+
+
+@shared_task(autoretry_for=(OSError,), retry_backoff=True, max_retries=3, ignore_result=True)
+def purge_all_pages_task() -> None:
+    purge_backend().purge_all()
+
+
+@shared_task(ignore_result=True)
+def refresh_sitemaps_task(pairs: list[list[str]]) -> None:
+    refresh_sections(pairs)
+
+
+@shared_task(ignore_result=True)
+def refresh_related_task(items: list[list]) -> None:
+    by_kind: dict[str, set[int]] = {}
+    for kind, pk in items:
+        by_kind.setdefault(kind, set()).add(pk)
+    for kind, pks in by_kind.items():
+        refresh_related(kind, pks)
+
+
+@shared_task(ignore_result=True, acks_late=True)
+def run_seo_check_task(run_id: int) -> None:
+    execute_run(run_id)
+
+
+@shared_task(ignore_result=True)
+def run_side_effects_task(label: str, events: list) -> None:
+    run_side_effects(label, events)
+
+
+@shared_task(ignore_result=True)
+def index_due_tools_task() -> None:
+    index_due_tools()
@@ -0,0 +1,69 @@
+import time
+
+from django import template
+from django.conf import settings
+from django.template.base import token_kwargs
+
+from core.cache import fragment_key, fragment_tags, get_tagged, set_tagged
+from core.instrumentation import record_fragment_lookup
+
+register = template.Library()
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, name, vary_on, options):
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+        self.options = options
+
+    def render(self, context):
+        name = str(self.name.resolve(context))
+        vary_on = [expr.resolve(context) for expr in self.vary_on]
+        options = {key: expr.resolve(context) for key, expr in self.options.items()}
+        extra_tags = options.get("tags") or ()
+        if isinstance(extra_tags, str):
+            extra_tags = [tag for tag in extra_tags.split(",") if tag]
+
+        key = fragment_key(name, vary_on)
+        cached = get_tagged(key)
+        record_fragment_lookup(name, hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        started_at = time.time_ns()
+        value = self.nodelist.render(context)
+        timeout = options.get("timeout") or getattr(settings, "FRAGMENT_CACHE_TIMEOUT", 3600)
+        set_tagged(key, value, fragment_tags(name, vary_on, extra_tags), timeout, started_at=started_at)
+        return value
+
+
+@register.tag("cachefragment")
+def do_cachefragment(parser, token):
+    """
+    Caches the enclosed markup per active language and content version:
+
+        {% cachefragment "guideitem" item tags=item.content_tag %} ... {% endcachefragment %}
+
+    Positional values after the name form the key; model instances contribute pk, updated_at and
+    the published revision id, other values their JSON form (repr if they are not serializable). The entry is tagged with the objects' cache tags
+    plus `tags` (string or list), so invalidate_tags() on any of them purges it. Optional `timeout` (seconds).
+    Per-visitor output (csrf_token, request-dependent links) must stay outside the block.
+    """
+    nodelist = parser.parse(("endcachefragment",))
+    parser.delete_first_token()
+    bits = token.split_contents()[1:]
+    if not bits:
+        raise template.TemplateSyntaxError("'cachefragment' requires a fragment name.")
+    name = parser.compile_filter(bits.pop(0))
+    vary_on, options = [], {}
+    for bit in bits:
+        kwarg = token_kwargs([bit], parser)
+        if kwarg:
+            options.update(kwarg)
+        else:
+            vary_on.append(parser.compile_filter(bit))
+    unknown = set(options) - {"tags", "timeout"}
+    if unknown:
+        raise template.TemplateSyntaxError(f"'cachefragment' got unknown option(s): {', '.join(sorted(unknown))}")
+    return FragmentCacheNode(nodelist, name, vary_on, options)
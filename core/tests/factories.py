@@ -0,0 +1,19 @@
+from django.utils import timezone
+
+from core.models.editorial import EditorialWorkflowMixin
+from guides.models import Guide
+
+INTROS = {"en": "<p>Intro</p>", "de": "<p>Einleitung</p>"}
+
+
+def make_guide(slug, *, status=EditorialWorkflowMixin.STATUS_PUBLISHED, minutes_ago=0, languages=("en", "de"),
+               **fields):
+    """
+    A guide with one translation per language (slug "<slug>-<lang>", title "<slug> <LANG>", a short intro);
+    `fields` override the translated values in every language.
+    """
+    g = Guide.objects.create(status=status, published_at=timezone.now() - timezone.timedelta(minutes=minutes_ago))
+    for language in languages:
+        values = {"slug": f"{slug}-{language}", "title": f"{slug} {language.upper()}", "intro": INTROS[language]}
+        g.create_translation(language, **{"body": "", **values, **fields})
+    return g
@@ -0,0 +1,88 @@
+import json
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone, translation
+
+from catalog.models import Tool
+from catalog.views import ToolDetailView, ToolListView
+from content.views.home import HomePageView
+from core.cache import PAGE_CACHE_HEADER
+from core.tests.factories import make_guide
+from glossary.models import GlossaryTerm
+from glossary.views import (
+    GlossaryApiView,
+    GlossaryAutocompleteView,
+    GlossaryDetailView,
+    GlossaryListView,
+)
+from guides.views import GuideDetailView
+from prompts.views import PromptDetailView
+from usecases.views import UseCaseDetailView
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "async-views"}}
+
+
+class AsyncViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        make_guide("async-home")
+        tool = Tool.objects.create(is_featured=True, published_at=timezone.now())
+        tool.create_translation("en", name="Featured Tool", slug="featured-tool", short_description="<p>Fast</p>")
+        GlossaryTerm.objects.create(
+            term="Agent", slug="agent", short_definition="Acts", long_definition="<p>Acts</p>", language="en"
+        )
+
+    def test_hot_read_views_are_async(self):
+        views = (
+            HomePageView, GlossaryListView, GlossaryDetailView, GlossaryAutocompleteView, GlossaryApiView,
+            ToolListView, ToolDetailView, GuideDetailView, PromptDetailView, UseCaseDetailView,
+        )
+        for view in views:
+            self.assertTrue(view.view_is_async, view.__name__)
+
+    async def test_async_list_and_detail_pages_load_their_rows_before_rendering(self):
+        tools = await self.async_client.get("/en/catalog/")
+        self.assertEqual([t.name for t in tools.context["object_list"]], ["Featured Tool"])
+        self.assertEqual(type(tools.context["object_list"]), list)
+        self.assertEqual((await self.async_client.get("/en/catalog/featured-tool/")).status_code, 200)
+        self.assertEqual((await self.async_client.get("/en/catalog/nope/")).status_code, 404)
+
+        guide = await self.async_client.get("/en/guides/async-home-en/")
+        self.assertEqual(guide.context["object"].title, "async-home EN")
+        again = await self.async_client.get("/en/guides/async-home-en/", headers={"if-none-match": guide["ETag"]})
+        self.assertEqual(again.status_code, 304)
+
+    async def test_home_loads_latest_items_and_featured_tools(self):
+        response = await self.async_client.get("/en/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([t.name for t in response.context["featured_tools"]], ["Featured Tool"])
+        self.assertEqual([i["title"] for i in response.context["latest_items"]], ["async-home EN"])
+
+    async def test_glossary_api_and_autocomplete(self):
+        api = GlossaryApiView.as_view()
+        with translation.override("en"):
+            data = json.loads((await api(RequestFactory().get("/api/", {"count": "exact"}))).content)
+            bad = await api(RequestFactory().get("/api/", {"cursor": "broken"}))
+        self.assertEqual((data["count"], data["results"][0]["slug"]), (1, "agent"))
+        self.assertEqual(bad.status_code, 400)
+
+        hits = (await self.async_client.get("/en/glossary/autocomplete/", {"q": "ag", "format": "json"})).json()
+        self.assertEqual([r["term"] for r in hits["results"]], ["Agent"])
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    async def test_async_detail_goes_through_the_page_cache(self):
+        await cache.aclear()
+        first = await self.async_client.get("/en/glossary/agent/")
+        second = await self.async_client.get("/en/glossary/agent/")
+        self.assertEqual((first[PAGE_CACHE_HEADER], second[PAGE_CACHE_HEADER]), ("miss", "hit"))
+
+        listing = await self.async_client.get("/en/glossary/")
+        self.assertEqual([t.term for t in listing.context["terms"]], ["Agent"])
+        again = await self.async_client.get("/en/glossary/", headers={"if-none-match": listing["ETag"]})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual((await self.async_client.get("/en/glossary/", {"page": "last"})).status_code, 200)
+        self.assertEqual((await self.async_client.get("/en/glossary/", {"page": "2"})).status_code, 404)
+
+        missing = await self.async_client.get("/en/glossary/nope/")
+        self.assertEqual(missing.status_code, 404)
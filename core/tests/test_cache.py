@@ -0,0 +1,268 @@
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from catalog.models import Tool
+from compare.models import Comparison
+from core.cache import (
+    PAGE_CACHE_HEADER,
+    AnonymousPageCacheMiddleware,
+    LocalLRU,
+    get_tagged,
+    hot_cache,
+    invalidate_tags,
+    set_tagged,
+)
+from core.cdn import purge_backend, purge_batch
+from core.events import content_changed
+from core.models.editorial import EditorialWorkflowMixin
+from core.tests.factories import make_guide
+from guides.models import Guide
+from prompts.models import Prompt
+
+User = get_user_model()
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-cache"}}
+
+
+class LocalLRUTests(TestCase):
+    def test_evicts_least_recently_used_and_expired_entries(self):
+        lru = LocalLRU(maxsize=2)
+        lru.set("a", 1, ttl=60)
+        lru.set("b", 2, ttl=60)
+        lru.get("a")
+        lru.set("c", 3, ttl=60)
+        self.assertEqual(lru.get("a"), 1)
+        self.assertIsNone(lru.get("b"))
+
+        lru.set("gone", 4, ttl=-1)
+        self.assertIsNone(lru.get("gone"))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PublicPageCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+        cls.guide = make_guide("cached")
+
+    def setUp(self):
+        cache.clear()
+        hot_cache.local.clear()
+
+    def test_second_anonymous_request_is_served_from_cache(self):
+        first = self.client.get("/en/guides/cached-en/")
+        second = self.client.get("/en/guides/cached-en/")
+        self.assertEqual(first[PAGE_CACHE_HEADER], "miss")
+        self.assertEqual(second[PAGE_CACHE_HEADER], "hit")
+        self.assertContains(second, "cached EN")
+        self.assertNotContains(second, "__csrf_token_placeholder__")
+
+    def test_query_string_order_is_normalized_and_language_is_part_of_the_key(self):
+        self.client.get("/en/guides/?page=1&q=x")
+        self.assertEqual(self.client.get("/en/guides/?q=x&page=1")[PAGE_CACHE_HEADER], "hit")
+        self.assertEqual(self.client.get("/de/guides/?q=x&page=1")[PAGE_CACHE_HEADER], "miss")
+
+    def test_logged_in_users_bypass_the_cache(self):
+        self.client.get("/en/guides/")
+        self.client.force_login(self.editor)
+        self.assertNotIn(PAGE_CACHE_HEADER, self.client.get("/en/guides/"))
+
+    def test_archive_purges_the_detail_page_and_the_list_but_not_unrelated_pages(self):
+        prompt = Prompt.objects.create(status=EditorialWorkflowMixin.STATUS_PUBLISHED, published_at=timezone.now())
+        prompt.create_translation("en", slug="unrelated", title="Unrelated", intro="", body="")
+        for url in ("/en/guides/cached-en/", "/en/prompts/unrelated/", "/en/guides/"):
+            self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guide.archive(by=self.editor)
+            self.guide.save()
+        self.assertEqual(self.guide.status, EditorialWorkflowMixin.STATUS_ARCHIVED)
+
+        self.assertNotEqual(self.client.get("/en/guides/cached-en/").get(PAGE_CACHE_HEADER), "hit")
+        self.assertNotEqual(self.client.get("/en/guides/").get(PAGE_CACHE_HEADER), "hit")
+        self.assertEqual(self.client.get("/en/prompts/unrelated/").get(PAGE_CACHE_HEADER), "hit")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheTagTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        hot_cache.local.clear()
+
+    def test_invalidating_a_tag_purges_only_entries_that_declared_it(self):
+        set_tagged("a", "A", {"guides.guide:1"})
+        set_tagged("b", "B", {"guides.guide:2"})
+        invalidate_tags(Guide(pk=1))
+        self.assertIsNone(get_tagged("a"))
+        self.assertEqual(get_tagged("b"), "B")
+
+    def test_value_built_before_a_purge_is_not_stored(self):
+        invalidate_tags("guides.guide")
+        self.assertFalse(set_tagged("late", "stale", {"guides.guide"}, started_at=0))
+        self.assertIsNone(get_tagged("late"))
+
+
+class ContentEventTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+
+    def setUp(self):
+        self.events = []
+        content_changed.connect(self._record)
+        self.addCleanup(content_changed.disconnect, self._record)
+
+    def _record(self, sender, **kwargs):
+        self.events.append((sender, kwargs))
+
+    def test_publish_reports_languages_and_slug_change_after_commit(self):
+        g = make_guide("event", status=EditorialWorkflowMixin.STATUS_REVIEW)
+        g.live_i18n = {"en": {"slug": "old-en", "public_slug": "old-en"}}
+        g.save(update_fields=["live_i18n"])
+        g.set_current_language("en")
+        g.slug = "new-en"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            g.publish(by=self.editor)
+            self.assertEqual(self.events, [])
+            g.save()
+
+        self.assertEqual(len(self.events), 1)
+        sender, payload = self.events[0]
+        self.assertIs(sender, Guide)
+        self.assertEqual(payload["action"], "publish")
+        self.assertEqual(set(payload["languages"]), {"en", "de"})
+        self.assertEqual(payload["old_slugs"], {"en": "old-en"})
+        self.assertEqual(payload["new_slugs"], {"en": "new-en", "de": "event-de"})
+
+    def test_archive_leaves_no_public_slugs(self):
+        g = make_guide("gone")
+        with self.captureOnCommitCallbacks(execute=True):
+            g.archive(by=self.editor)
+            g.save()
+        self.assertEqual([p["action"] for _, p in self.events], ["archive"])
+        self.assertEqual(self.events[0][1]["new_slugs"], {})
+
+
+    def test_edits_of_published_comparisons_are_events(self):
+        comparison = Comparison.objects.create(status=EditorialWorkflowMixin.STATUS_PUBLISHED)
+        comparison.create_translation("en", title="A vs B", slug="a-vs-b")
+        draft = Comparison.objects.create(status=EditorialWorkflowMixin.STATUS_DRAFT)
+        tool = Tool.objects.create(name="Tool", slug="tool")
+        self.events.clear()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            draft.save()
+            comparison.save()
+        self.assertEqual([(sender, p["action"]) for sender, p in self.events], [(Comparison, "update")])
+
+        for change in (
+            lambda: comparison.create_translation("de", title="A gegen B", slug="a-gegen-b"),
+            lambda: comparison.tools.add(tool),
+            lambda: tool.comparisons.remove(comparison),
+        ):
+            self.events.clear()
+            with self.captureOnCommitCallbacks(execute=True):
+                change()
+            self.assertEqual([p["action"] for _, p in self.events], ["update"])
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES, PAGE_CACHE_ANONYMOUS=True, SURROGATE_PURGE_BACKEND="core.cdn.LocalPurgeBackend"
+)
+class AnonymousPageCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+        cls.guide = make_guide("shared")
+
+    def setUp(self):
+        cache.clear()
+        hot_cache.local.clear()
+        purge_backend().reset()
+
+    def test_pages_are_shareable_with_surrogate_keys(self):
+        response = self.client.get("/en/guides/shared-en/")
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("s-maxage=600", response["Cache-Control"])
+        self.assertIn(f"guides.guide:{self.guide.pk}", response["Surrogate-Key"].split())
+        self.assertNotIn("cookie", response.get("Vary", "").lower())
+        self.assertFalse(response.cookies)
+
+    def test_hits_skip_the_stack_below_the_middleware(self):
+        self.client.get("/en/guides/shared-en/")
+        with self.assertNumQueries(0), mock.patch("guides.views.GuideDetailView.get") as view:
+            hit = self.client.get("/en/guides/shared-en/")
+        view.assert_not_called()
+        self.assertEqual(hit[PAGE_CACHE_HEADER], "hit")
+        self.assertContains(hit, "shared EN")
+        self.assertIn(f"guides.guide:{self.guide.pk}", hit["Surrogate-Key"].split())
+        self.assertEqual(self.client.get("/de/guides/shared-de/")[PAGE_CACHE_HEADER], "miss")
+
+    async def test_async_stack_uses_the_async_cache_path(self):
+        await self.async_client.get("/en/guides/shared-en/")
+        calls = []
+
+        async def below(request):
+            calls.append(request.path)
+            response = HttpResponse("fresh")
+            response["Surrogate-Key"] = "guides.guide"
+            response["Vary"] = "Cookie, Accept-Language"
+            return response
+
+        middleware = AnonymousPageCacheMiddleware(below)
+        self.assertTrue(iscoroutinefunction(middleware))
+        hit = await middleware(RequestFactory().get("/en/guides/shared-en/"))
+        self.assertEqual(hit[PAGE_CACHE_HEADER], "hit")
+        self.assertContains(hit, "shared EN")
+        miss = await middleware(RequestFactory().get("/en/guides/"))
+        self.assertEqual((calls, miss["Vary"]), (["/en/guides/"], "Accept-Language"))
+
+    def test_hits_carry_the_headers_of_the_skipped_middleware(self):
+        miss = self.client.get("/en/guides/shared-en/")
+        hit = self.client.get("/en/guides/shared-en/")
+        self.assertEqual(hit[PAGE_CACHE_HEADER], "hit")
+        for header in ("X-Frame-Options", "Content-Language", "Vary"):
+            self.assertEqual(hit.get(header), miss.get(header), header)
+        self.assertEqual(hit["X-Frame-Options"], "DENY")
+        self.assertEqual(hit["Content-Language"], "en")
+
+    def test_language_switch_is_a_link_and_set_language_keeps_csrf(self):
+        response = self.client.get("/en/guides/shared-en/")
+        self.assertContains(response, 'value="/de/guides/shared-de/"')
+        self.assertNotContains(response, "csrfmiddlewaretoken")
+        client = self.client_class(enforce_csrf_checks=True)
+        self.assertEqual(client.post("/i18n/setlang/", {"language": "de", "next": "/de/"}).status_code, 403)
+
+    def test_visitors_with_a_session_are_not_served_shared_pages(self):
+        self.client.get("/en/guides/shared-en/")
+        self.client.force_login(self.editor)
+        response = self.client.get("/en/guides/shared-en/")
+        self.assertNotIn(PAGE_CACHE_HEADER, response)
+        self.assertNotIn("Surrogate-Key", response)
+
+    def test_transitions_purge_the_surrogate_keys(self):
+        with purge_batch(), self.captureOnCommitCallbacks(execute=True):
+            self.guide.archive(by=self.editor)
+            self.guide.save()
+        # one purge per transaction, sent after commit
+        self.assertEqual(len(purge_backend().purged), 1)
+        self.assertTrue({f"guides.guide:{self.guide.pk}", "guides.guide"} <= set(purge_backend().purged[0]))
+
+    def test_rolled_back_transactions_purge_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    invalidate_tags(self.guide)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            invalidate_tags(Prompt)
+        self.assertEqual(purge_backend().purged, [["prompts.prompt"]])
@@ -0,0 +1,101 @@
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+
+from catalog.models import Tool
+from core.cache import PAGE_CACHE_HEADER, hot_cache, invalidate_tags
+from core.conditional import object_validators
+from core.tests.factories import make_guide
+from core.tests.test_cache import LOCMEM_CACHES
+from glossary.models import GlossaryTerm
+from glossary.views import GlossaryApiView
+from guides.models import Guide
+from guides.views import GuideDetailView
+
+User = get_user_model()
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+        cls.guide = make_guide("cond")
+
+    def test_detail_revalidation_ends_before_the_context_is_built(self):
+        first = self.client.get("/en/guides/cond-en/")
+        self.assertTrue(first["ETag"].startswith('W/"'))
+        self.assertIn("Last-Modified", first)
+
+        with (
+            mock.patch.object(GuideDetailView, "get_context_data", side_effect=AssertionError("rendered")),
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            second = self.client.get("/en/guides/cond-en/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertLessEqual(len(ctx.captured_queries), 2)
+
+        third = self.client.get("/en/guides/cond-en/", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(third.status_code, 304)
+
+    def test_changes_and_viewers_get_new_validators(self):
+        etag = self.client.get("/en/guides/cond-en/")["ETag"]
+        self.assertNotEqual(self.client.get("/de/guides/cond-de/")["ETag"], etag)
+
+        Guide.objects.filter(pk=self.guide.pk).update(last_published_revision_id=99)
+        self.assertEqual(self.client.get("/en/guides/cond-en/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        self.client.force_login(self.editor)
+        self.assertNotEqual(self.client.get("/en/guides/cond-en/")["ETag"], etag)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_detail_validators_follow_the_related_models(self):
+        cache.clear()
+        hot_cache.local.clear()
+        request = RequestFactory().get("/en/guides/cond-en/")
+        plain = object_validators(request, self.guide)
+        with_tools = object_validators(request, self.guide, related=[Tool])
+        invalidate_tags(Tool)
+        self.assertEqual(object_validators(request, self.guide), plain)
+        self.assertNotEqual(object_validators(request, self.guide, related=[Tool])[0], with_tools[0])
+
+    def test_list_validators_follow_the_queryset(self):
+        etag = self.client.get("/en/guides/")["ETag"]
+        self.assertEqual(self.client.get("/en/guides/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        make_guide("another")
+        self.assertEqual(self.client.get("/en/guides/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_glossary_api_answers_304(self):
+        GlossaryTerm.objects.create(term="Token", slug="token", short_definition="Unit", language="en")
+        def get(**headers):
+            request = RequestFactory().get("/en/glossary/api/", **headers)
+            with translation.override("en"):
+                return async_to_sync(GlossaryApiView.as_view())(request)
+
+        first = get()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(get(HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedPageRevalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        hot_cache.local.clear()
+        make_guide("hit")
+
+    def test_cached_pages_keep_their_validators(self):
+        first = self.client.get("/en/guides/hit-en/")
+        hit = self.client.get("/en/guides/hit-en/")
+        self.assertEqual(hit[PAGE_CACHE_HEADER], "hit")
+        self.assertEqual(hit["ETag"], first["ETag"])
+
+        revalidated = self.client.get("/en/guides/hit-en/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated[PAGE_CACHE_HEADER], "hit")
@@ -0,0 +1,41 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.tests.factories import make_guide
+from guides.models import Guide
+from prompts.models import Prompt
+
+
+class DisplayValuesTests(TestCase):
+    def _list_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_guide_list_query_count_does_not_grow_with_page_size(self):
+        for i in range(2):
+            make_guide(f"few{i}")
+        few = self._list_queries("/en/guides/")
+        for i in range(10):
+            make_guide(f"many{i}")
+        self.assertEqual(self._list_queries("/en/guides/"), few)
+
+    def test_live_snapshot_wins_over_draft_and_missing_languages_fall_back(self):
+        g = make_guide("snap")
+        g.live_i18n = {"en": {"title": "Live title"}}
+        g.save(update_fields=["live_i18n"])
+        g.set_current_language("en")
+        g.title = "Draft title"
+        g.save()
+
+        obj = Guide.objects.filter(pk=g.pk).with_display_values("en").get()
+        with self.assertNumQueries(0):
+            self.assertEqual(obj.display_title, "Live title")
+            self.assertEqual(obj.display_intro, "<p>Intro</p>")
+            self.assertEqual(obj.get_display_value("title", "de"), "snap DE")
+
+    def test_non_model_results_are_left_alone(self):
+        make_guide("plain")
+        self.assertEqual(len(Prompt.objects.with_display_values("en").values_list("pk", flat=True)), 0)
+        self.assertEqual(len(Guide.objects.with_display_values("en").values("pk")), 1)
@@ -0,0 +1,58 @@
+from django.core.cache import cache
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from core.cache import invalidate_fragments, invalidate_tags
+from core.instrumentation import fragment_stats, reset_fragment_stats
+from core.tests.factories import make_guide
+from guides.models import Guide
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "fragments"}}
+
+TEMPLATE = Template(
+    '{% load fragment_cache %}{% cachefragment "card" guide tags=extra %}{{ guide.pk }}:{{ label }}{% endcachefragment %}'
+)
+
+
+def render(guide, label, extra=""):
+    return TEMPLATE.render(Context({"guide": guide, "label": label, "extra": extra}))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_fragment_stats()
+        self.guide = make_guide("frag")
+
+    def test_fragment_is_reused_per_language_and_version(self):
+        with translation.override("en"):
+            self.assertEqual(render(self.guide, "first"), f"{self.guide.pk}:first")
+            self.assertEqual(render(self.guide, "second"), f"{self.guide.pk}:first")
+        with translation.override("de"):
+            self.assertEqual(render(self.guide, "second"), f"{self.guide.pk}:second")
+
+        self.guide.save()  # new updated_at -> new key
+        with translation.override("en"):
+            self.assertEqual(render(Guide.objects.get(pk=self.guide.pk), "third"), f"{self.guide.pk}:third")
+
+    def test_invalidation_by_content_tag_and_by_name(self):
+        with translation.override("en"):
+            render(self.guide, "first", extra="prompts.prompt:7")
+            invalidate_tags(self.guide)
+            self.assertEqual(render(self.guide, "second", extra="prompts.prompt:7"), f"{self.guide.pk}:second")
+            invalidate_tags("prompts.prompt:7")
+            self.assertEqual(render(self.guide, "third", extra="prompts.prompt:7"), f"{self.guide.pk}:third")
+            invalidate_fragments("card")
+            self.assertEqual(render(self.guide, "fourth", extra="prompts.prompt:7"), f"{self.guide.pk}:fourth")
+
+    def test_hit_ratio_is_reported(self):
+        with translation.override("en"):
+            for _ in range(4):
+                render(self.guide, "x")
+        self.assertEqual(fragment_stats()["card"], {"hits": 3, "misses": 1, "hit_ratio": 0.75})
+
+    def test_unknown_option_is_a_syntax_error(self):
+        with self.assertRaises(TemplateSyntaxError):
+            Template('{% load fragment_cache %}{% cachefragment "x" ttl=5 %}{% endcachefragment %}')
@@ -0,0 +1,49 @@
+import json
+import logging
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from core.instrumentation import QueryBudgetExceeded
+from core.tests.factories import make_guide
+from guides.views import GuideListView
+from mentoroai.logging import JsonFormatter
+
+
+class RequestMetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        make_guide("metrics")
+
+    def test_server_timing_and_structured_log_fields(self):
+        with self.assertLogs("mentoroai.requests", level="INFO") as logs:
+            response = self.client.get("/en/guides/")
+        self.assertRegex(response["Server-Timing"], r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn("tpl;dur=", response["Server-Timing"])
+
+        payload = json.loads(JsonFormatter().format(logs.records[-1]))
+        self.assertEqual(payload["message"], "GET /en/guides/ 200")
+        self.assertEqual(payload["view"], "guides:list")
+        self.assertEqual(payload["query_budget"], GuideListView.query_budget)
+        self.assertGreater(payload["view_queries"], 0)
+        self.assertGreater(payload["template_ms"], 0)
+
+    async def test_queries_of_async_views_are_counted(self):
+        with self.assertLogs("mentoroai.requests", level="INFO") as logs:
+            response = await self.async_client.get("/en/glossary/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(logs.records[-1].view, "glossary:list")
+        self.assertGreater(logs.records[-1].view_queries, 0)
+        self.assertRegex(response["Server-Timing"], r'desc="[1-9]\d* queries"')
+
+    def test_exceeding_the_query_budget_fails_in_strict_mode(self):
+        with mock.patch.object(GuideListView, "query_budget", 0):
+            with override_settings(QUERY_BUDGET_STRICT=True), self.assertRaises(QueryBudgetExceeded):
+                self.client.get("/en/guides/")
+            with override_settings(QUERY_BUDGET_STRICT=False), self.assertLogs("mentoroai.requests", "WARNING"):
+                self.assertEqual(self.client.get("/en/guides/").status_code, 200)
+
+    @override_settings(SERVER_TIMING=False)
+    def test_server_timing_header_can_be_disabled(self):
+        with self.assertLogs("mentoroai.requests", level=logging.INFO):
+            self.assertNotIn("Server-Timing", self.client.get("/en/guides/"))
@@ -0,0 +1,90 @@
+import json
+
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory, TestCase
+from django.utils import timezone, translation
+
+from core.pagination import KeysetPaginator, decode_cursor, encode_cursor
+from core.tests.factories import make_guide
+from glossary.models import GlossaryTerm
+from glossary.views import GlossaryApiView
+from guides.models import Guide
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        # equal timestamps force the pk tie-breaker; NULLs sort last
+        cls.guides = [Guide.objects.create(published_at=now) for _ in range(3)]
+        cls.guides += [Guide.objects.create(published_at=None) for _ in range(2)]
+
+    def _walk(self, paginator):
+        seen, page = [], paginator.page()
+        while True:
+            seen.extend(g.pk for g in page)
+            if not page.has_next():
+                return seen, page
+            page = paginator.page(page.next_cursor)
+
+    def test_next_and_previous_cover_every_row_once(self):
+        paginator = KeysetPaginator(Guide.objects.all(), ("-published_at", "-pk"), per_page=2)
+        seen, last = self._walk(paginator)
+        expected = [g.pk for g in reversed(self.guides[:3])] + [g.pk for g in reversed(self.guides[3:])]
+        self.assertEqual(seen, expected)
+
+        previous = paginator.page(last.previous_cursor)
+        self.assertEqual([g.pk for g in previous], expected[2:4])
+        self.assertTrue(previous.has_next())
+        self.assertTrue(previous.has_previous())
+
+    def test_cursor_round_trip_keeps_microseconds(self):
+        value = timezone.now().replace(microsecond=123456)
+        direction, values = decode_cursor(encode_cursor("n", [value, 7]))
+        self.assertEqual(direction, "n")
+        self.assertEqual(values, [value.isoformat(), 7])
+
+
+class KeysetListViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(25):
+            make_guide(f"page{i}", minutes_ago=i)
+
+    def test_cursor_links_walk_the_guide_list(self):
+        first = self.client.get("/en/guides/")
+        page = first.context["page_obj"]
+        self.assertTrue(page.is_keyset)
+        self.assertContains(first, f"cursor={page.next_cursor}")
+
+        second = self.client.get("/en/guides/", {"cursor": page.next_cursor})
+        self.assertEqual(len(second.context["page_obj"]) + len(page), 25)
+        self.assertContains(second, 'aria-label="Previous Page"')
+
+    def test_invalid_cursor_is_404_and_page_param_keeps_numbered_pages(self):
+        self.assertEqual(self.client.get("/en/guides/", {"cursor": "garbage"}).status_code, 404)
+        legacy = self.client.get("/en/guides/", {"page": 2})
+        self.assertEqual(legacy.context["page_obj"].number, 2)
+
+
+class GlossaryApiKeysetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for term in ("Agent", "Benchmark", "Context", "Decoder", "Embedding"):
+            GlossaryTerm.objects.create(term=term, slug=term.lower(), short_definition="-", language="en")
+
+    def _get(self, **params):
+        request = RequestFactory().get("/en/glossary/api/", params)
+        with translation.override("en"):
+            return json.loads(async_to_sync(GlossaryApiView.as_view())(request).content)
+
+    def test_pages_by_term_with_cursors(self):
+        first = self._get(limit=2)
+        self.assertEqual([r["term"] for r in first["results"]], ["Agent", "Benchmark"])
+        self.assertEqual(first["count"], 5)
+        self.assertIsNone(first["previous"])
+
+        second = self._get(limit=2, cursor=first["next"], count="none")
+        self.assertEqual([r["term"] for r in second["results"]], ["Context", "Decoder"])
+        self.assertIsNone(second["count"])
+        self.assertEqual(self._get(limit=2, cursor=second["previous"])["results"], first["results"])
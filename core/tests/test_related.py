@@ -0,0 +1,78 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from catalog.models import Category, Tool
+from core.models import RelatedItem
+from core.models.editorial import EditorialWorkflowMixin
+from core.related import rebuild_related, refresh_related
+from core.services import related_guides
+from core.tests.factories import make_guide
+
+
+class RelatedGraphTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.cat = Category.objects.create(name="Writing", slug="writing")
+        cls.tool = Tool.objects.create(name="Tool", slug="tool")
+        cls.target = make_guide("target")
+        cls.both = make_guide("both", minutes_ago=5)
+        cls.cat_only = make_guide("cat-only", minutes_ago=1)
+        cls.unrelated = make_guide("unrelated")
+        cls.draft = make_guide("draft", status=EditorialWorkflowMixin.STATUS_DRAFT)
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.target.categories.add(self.cat)
+            self.target.tools.add(self.tool)
+            self.both.categories.add(self.cat)
+            self.both.tools.add(self.tool)
+            self.cat_only.categories.add(self.cat)
+            self.draft.categories.add(self.cat)
+
+    def test_m2m_change_updates_stored_neighbours(self):
+        edges = list(
+            RelatedItem.objects.filter(kind="guide", object_id=self.target.pk, language="en")
+            .order_by("rank").values_list("related_id", "score")
+        )
+        self.assertEqual(edges, [(self.both.pk, 5), (self.cat_only.pk, 3)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cat_only.categories.clear()
+        ids = list(
+            RelatedItem.objects.filter(kind="guide", object_id=self.target.pk, language="en")
+            .values_list("related_id", flat=True)
+        )
+        self.assertEqual(ids, [self.both.pk])
+
+    def test_changes_of_a_transaction_share_one_refresh(self):
+        other = Category.objects.create(name="Coding", slug="coding")
+        with mock.patch("core.tasks.refresh_related_task.delay") as delay, self.captureOnCommitCallbacks(execute=True):
+            self.unrelated.categories.add(other)
+            self.unrelated.tools.add(self.tool)
+            other.guide_set.add(self.target)
+        delay.assert_called_once_with([("guide", self.target.pk), ("guide", self.unrelated.pk)])
+
+    def test_refresh_only_loads_the_neighbourhood(self):
+        isolated = make_guide("isolated")
+        with mock.patch("core.related._write_edges") as write:
+            refresh_related("guide", [self.unrelated.pk])
+        nodes, affected = write.call_args.args[1:]
+        self.assertEqual(affected, {self.unrelated.pk})
+        self.assertNotIn(isolated.pk, nodes)
+        self.assertNotIn(self.target.pk, nodes)
+
+        with mock.patch("core.related._write_edges") as write:
+            refresh_related("guide", [self.cat_only.pk])
+        nodes, affected = write.call_args.args[1:]
+        self.assertEqual(affected, {self.target.pk, self.both.pk, self.cat_only.pk, self.draft.pk})
+        self.assertNotIn(isolated.pk, nodes)
+
+    def test_related_guides_reads_graph_then_falls_back_to_recency(self):
+        rebuild_related("guide")
+        with self.settings(LANGUAGE_CODE="en"):
+            items = related_guides(self.target, limit=3)
+        self.assertEqual(items[:2], [self.both, self.cat_only])
+        self.assertEqual(len(items), 3)
+        self.assertNotIn(self.draft, items)
+        self.assertNotIn(self.target, items)
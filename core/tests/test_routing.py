@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from parler.utils.context import switch_language
+
+from core.models import SlugRoute
+from core.models.editorial import EditorialWorkflowMixin, publish_content
+from core.routing import resolve_by_slug
+from guides.models import Guide
+from prompts.models import Prompt
+
+User = get_user_model()
+
+
+def make_prompt(slug):
+    p = Prompt.objects.create(status=EditorialWorkflowMixin.STATUS_REVIEW)
+    p.create_translation("en", slug=f"{slug}-en", title="Prompt EN", intro="", body="")
+    p.create_translation("de", slug=f"{slug}-de", title="Prompt DE", intro="", body="")
+    return p
+
+
+class SlugRouteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+
+    def test_publish_writes_live_routes(self):
+        p = make_prompt("routed")
+        p.publish(by=self.editor)
+        p.save()
+        slugs = set(SlugRoute.objects.filter(object_id=p.pk, is_live=True).values_list("language", "slug"))
+        self.assertIn(("en", "routed-en"), slugs)
+        self.assertIn(("de", "routed-de"), slugs)
+
+    def test_renamed_slug_still_resolves_via_route(self):
+        p = make_prompt("old-name")
+        p.publish(by=self.editor)
+        p.save()
+        with switch_language(p, "en"):
+            p.slug = "new-name-en"
+            p.public_slug = "new-name-en"
+            p.save()
+        p.submit_for_review(by=self.editor)
+        publish_content(p, by=self.editor)
+
+        self.assertEqual(resolve_by_slug(Prompt.objects.all(), "old-name-en"), p)
+        self.assertFalse(SlugRoute.objects.get(slug="old-name-en").is_live)
+
+    def test_unknown_slug_returns_none(self):
+        self.assertIsNone(resolve_by_slug(Guide.objects.all(), "does-not-exist"))
+
+    def test_detail_view_resolves_retired_slug(self):
+        p = make_prompt("retired")
+        p.publish(by=self.editor)
+        p.save()
+        with switch_language(p, "en"):
+            p.slug = "renamed-en"
+            p.public_slug = "renamed-en"
+            p.save()
+        resp = self.client.get(reverse("prompts:detail", kwargs={"slug": "retired-en"}))
+        self.assertEqual(resp.status_code, 200)
@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from parler.utils.context import switch_language
+
+from catalog.models import Tool
+from core.models import SearchDocument
+from core.search import index_due_tools, prefix_tsquery, search
+from core.tests.factories import make_guide
+from glossary.models import GlossaryTerm
+
+User = get_user_model()
+
+
+class SearchDocumentTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+
+    def test_published_guide_is_indexed_per_language_and_archive_removes_it(self):
+        g = make_guide("findme")
+        docs = {d.language: d for d in SearchDocument.objects.filter(kind="guide", object_id=g.pk)}
+        self.assertEqual(set(docs), {"en", "de"})
+        self.assertEqual(docs["de"].title, "findme DE")
+        self.assertEqual(docs["de"].url, "/de/guides/findme-de/")
+        self.assertIn("Einleitung", docs["de"].body)
+
+        g.archive(by=self.editor)
+        g.save()
+        self.assertFalse(SearchDocument.objects.filter(kind="guide", object_id=g.pk).exists())
+
+    def test_search_ranks_title_matches_first_and_respects_language(self):
+        make_guide("other")
+        g = make_guide("prompting")
+        term = GlossaryTerm.objects.create(
+            term="Token", slug="token", short_definition="Used when prompting models", language="en"
+        )
+
+        hits = list(search("prompting", language="en"))
+        self.assertEqual([(h.kind, h.object_id) for h in hits], [("guide", g.pk), ("glossary", term.pk)])
+        self.assertEqual(list(search("prompting", language="de", kinds=["glossary"])), [])
+
+    def test_tool_list_filters_through_the_index(self):
+        now = timezone.now()
+        for slug, name in (("alpha", "Alpha Writer"), ("beta", "Beta Painter")):
+            tool = Tool.objects.create(slug=slug, published_at=now)
+            with switch_language(tool, "en"):
+                tool.name = name
+                tool.short_description = f"{name} short"
+                tool.save()
+
+        resp = self.client.get("/en/catalog/?q=writer")
+        self.assertEqual([t.slug for t in resp.context["object_list"]], ["alpha"])
+
+    def test_scheduled_tools_are_indexed_once_due(self):
+        tool = Tool.objects.create(slug="later", published_at=timezone.now() + timedelta(hours=1))
+        with switch_language(tool, "en"):
+            tool.name = "Later Tool"
+            tool.save()
+        self.assertFalse(SearchDocument.objects.filter(kind="tool", object_id=tool.pk).exists())
+
+        Tool.objects.filter(pk=tool.pk).update(published_at=timezone.now() - timedelta(minutes=1))
+        self.assertEqual(index_due_tools(), 1)
+        self.assertEqual(index_due_tools(), 0)
+        self.assertEqual([h.object_id for h in search("later", language="en", kinds=["tool"])], [tool.pk])
+
+    def test_glossary_category_changes_are_indexed(self):
+        term = GlossaryTerm.objects.create(term="Agent", slug="agent", short_definition="Acts", language="en")
+        term.category = "Robotics"
+        term.save(update_fields=["category", "updated_at"])
+        self.assertEqual([h.object_id for h in search("robotics", language="en", kinds=["glossary"])], [term.pk])
+
+    def test_list_filters_match_the_last_word_as_prefix(self):
+        self.assertEqual(prefix_tsquery("prompt engin"), "'prompt' & 'engin':*")
+        self.assertEqual(prefix_tsquery("gpt-4o"), "'gpt' & '4o':*")
+        self.assertIsNone(prefix_tsquery("  ?! "))
+
+    def test_search_view(self):
+        make_guide("viewable")
+        resp = self.client.get("/en/search/?q=viewable")
+        self.assertEqual(resp.status_code, 200)
+        self.assertContains(resp, "/en/guides/viewable-en/")
+        self.assertEqual(len(resp.context["results"]), 1)
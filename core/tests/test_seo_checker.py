@@ -0,0 +1,146 @@
+from datetime import timedelta
+from io import StringIO
+from urllib.parse import urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.cache import PAGE_CACHE_HEADER, hot_cache
+from core.models import SeoCheckRun
+from core.seo.checker import (
+    _fetch,
+    check_paths,
+    diff_runs,
+    fail_stale_runs,
+    parse_head,
+    sitemap_paths,
+    start_run,
+)
+from core.sitemaps import sitemap_locations
+from core.tests.factories import make_guide
+from core.tests.test_cache import LOCMEM_CACHES
+
+User = get_user_model()
+
+HTML = (
+    b"<html><head><title>Mentoro  Guide</title><meta name='description' content='About'>"
+    b"<link rel='canonical' href='https://example.com/en/'><link rel='alternate' hreflang='de' href='/de/'>"
+    b"</head><body><title>ignored</title><meta name='robots' content='noindex'></body></html>"
+)
+
+
+@override_settings(SEO_CHECK_WORKERS=0)
+class SeoCheckerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(username="ops", password="pw", email="ops@example.com", is_staff=True)
+        make_guide("seo")
+
+    def test_head_parser_stops_at_body_across_chunk_boundaries(self):
+        head = parse_head(HTML[i:i + 7] for i in range(0, len(HTML), 7))
+        self.assertEqual((head.title, head.description, head.robots), ("Mentoro  Guide", "About", None))
+        self.assertEqual(head.hreflang, [{"lang": "de", "href": "/de/"}])
+
+    def test_threaded_check_matches_inline_check(self):
+        # worker threads use their own DB connections, so stick to pages that do not need the test fixtures
+        paths = ["/en/", "/de/", "/en/nope/"]
+        inline = {r.path: (r.status_code, r.issues) for r in check_paths(paths, "testserver", False, workers=0)}
+        threaded = {r.path: (r.status_code, r.issues) for r in check_paths(paths, "testserver", False, workers=3)}
+        self.assertEqual(inline, threaded)
+        self.assertEqual(inline["/en/nope/"][0], 404)
+
+    @override_settings(CACHES=LOCMEM_CACHES, PAGE_CACHE_ANONYMOUS=True)
+    def test_crawl_requests_bypass_the_page_cache(self):
+        hot_cache.local.clear()
+        self.client.get("/en/guides/seo-en/")
+        self.assertEqual(self.client.get("/en/guides/seo-en/")[PAGE_CACHE_HEADER], "hit")
+        for _ in range(2):
+            response = _fetch("/en/guides/seo-en/", "testserver", False)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn(PAGE_CACHE_HEADER, response)
+
+    def test_sitemap_crawl_covers_published_content(self):
+        self.assertIn("/de/guides/seo-de/", sitemap_paths())
+
+    def test_ops_page_starts_run_and_polls_new_rows(self):
+        self.client.force_login(self.staff)
+        response = self.client.post("/ops/seo-check/", {"paths": "/en/\n/en/guides/seo-en/"})
+        run = SeoCheckRun.objects.get()
+        self.assertRedirects(response, f"/ops/seo-check/?run={run.pk}", fetch_redirect_response=False)
+        self.assertEqual((run.status, run.total, run.done), (SeoCheckRun.STATUS_DONE, 2, 2))
+
+        page = self.client.get(f"/ops/seo-check/?run={run.pk}")
+        self.assertEqual(len(page.context["results"]), 2)
+        self.assertNotContains(page, "hx-trigger")  # finished runs stop polling
+
+        first, second = run.results.all()
+        poll = self.client.get(f"/ops/seo-check/{run.pk}/results/", {"after": first.pk})
+        self.assertEqual([r.pk for r in poll.context["results"]], [second.pk])
+        self.assertContains(poll, 'hx-swap-oob="beforeend:#seo-results"')
+
+    def test_non_staff_is_redirected(self):
+        response = self.client.get("/ops/seo-check/")
+        self.assertEqual(response.status_code, 302)
+
+
+@override_settings(SEO_CHECK_WORKERS=0)
+class SeoCrawlTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        make_guide("crawl")
+
+    def crawl(self, *args):
+        out = StringIO()
+        call_command("seo_crawl", "--workers", "1", "--host", "testserver", *args, stdout=out)
+        return SeoCheckRun.objects.first(), out.getvalue()
+
+    def test_urls_come_from_the_sitemap_classes_in_both_languages(self):
+        paths = [urlsplit(loc).path for loc in sitemap_locations()]
+        self.assertIn("/de/guides/crawl-de/", paths)
+        self.assertIn("/en/guides/crawl-en/", paths)
+        self.assertEqual(len(paths), len(set(paths)))
+
+    def test_crawl_stores_metrics_and_diffs_against_previous_run(self):
+        first, _out = self.crawl("--section", "guides")
+        row = first.results.get(path="/de/guides/crawl-de/")
+        self.assertEqual((first.source, row.status_code), (SeoCheckRun.SOURCE_CRAWL, 200))
+        self.assertGreater(row.html_bytes, 0)
+        self.assertIsNotNone(row.response_ms)
+        self.assertEqual(row.title_length, len(row.extracted["title"]))
+
+        second, out = self.crawl("--section", "guides")
+        self.assertIn(f"Compared with run #{first.pk}", out)
+
+        row.response_ms, row.html_bytes = 1000, 1000
+        row.save()
+        slower = second.results.get(path=row.path)
+        slower.response_ms, slower.html_bytes = 1500, 1100
+        slower.save()
+        diff = {d.path: d for d in diff_runs(first, second)}[row.path]
+        self.assertEqual(diff.regressions(threshold=0.2), ["response 1000 ms -> 1500 ms"])
+        self.assertEqual(diff.changes(), [])
+
+
+class SeoRunLifecycleTests(TestCase):
+    def test_runs_without_progress_are_marked_failed(self):
+        old = timezone.now() - timedelta(hours=1)
+        lost = SeoCheckRun.objects.create(host="testserver", status=SeoCheckRun.STATUS_RUNNING, started_at=old)
+        busy = SeoCheckRun.objects.create(host="testserver", status=SeoCheckRun.STATUS_RUNNING, started_at=old)
+        busy.results.create(path="/en/", status_code=200)
+        fresh = SeoCheckRun.objects.create(host="testserver")
+        self.assertEqual(fail_stale_runs(), 1)
+        statuses = dict(SeoCheckRun.objects.values_list("pk", "status"))
+        self.assertEqual(statuses[lost.pk], SeoCheckRun.STATUS_FAILED)
+        self.assertEqual(statuses[busy.pk], SeoCheckRun.STATUS_RUNNING)
+        self.assertEqual(statuses[fresh.pk], SeoCheckRun.STATUS_QUEUED)
+
+    @override_settings(SEO_CHECK_WORKERS=2)
+    def test_started_runs_are_queued_as_a_task(self):
+        run = SeoCheckRun.objects.create(host="testserver", secure=False, paths=["/en/nope/"])
+        with self.captureOnCommitCallbacks(execute=True):
+            start_run(run)
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.done), (SeoCheckRun.STATUS_DONE, 1))
+        self.assertEqual(run.results.get().status_code, 404)
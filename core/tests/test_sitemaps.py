@@ -0,0 +1,102 @@
+import gzip
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.models import SitemapFile
+from core.models.editorial import EditorialWorkflowMixin
+from core.sitemaps import build_sitemaps, refresh_sections, schedule_sitemap_refresh
+from core.tests.factories import make_guide
+from core.tests.test_cache import LOCMEM_CACHES
+
+User = get_user_model()
+
+
+class PrebuiltSitemapTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+        cls.guide = make_guide("mapped")
+
+    def setUp(self):
+        build_sitemaps()
+
+    def test_shards_are_served_gzipped_with_validators(self):
+        response = self.client.get("/sitemaps/de/guides-1.xml", HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn(b"/de/guides/mapped-de/", gzip.decompress(response.content))
+
+        with self.assertNumQueries(1):
+            revalidated = self.client.get("/sitemaps/de/guides-1.xml", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(self.client.get("/sitemaps/de/nope-1.xml").status_code, 404)
+
+    def test_unchanged_rebuild_keeps_etag_and_publish_refreshes_only_its_section(self):
+        before = {(f.language, f.section): (f.etag, f.last_modified) for f in SitemapFile.objects.all()}
+        build_sitemaps()
+        after = {(f.language, f.section): (f.etag, f.last_modified) for f in SitemapFile.objects.all()}
+        self.assertEqual(before, after)
+
+        draft = make_guide("fresh", status=EditorialWorkflowMixin.STATUS_REVIEW)
+        with self.captureOnCommitCallbacks(execute=True):
+            draft.publish(by=self.editor)
+            draft.save()
+
+        refreshed = {(f.language, f.section): f.etag for f in SitemapFile.objects.all()}
+        self.assertNotEqual(refreshed["en", "guides"], before["en", "guides"][0])
+        self.assertEqual(refreshed["en", "legal"], before["en", "legal"][0])
+        self.assertIn(b"/en/guides/fresh-en/", self.client.get("/sitemaps/en/guides-1.xml").content)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_missing_files_are_queued_instead_of_built_in_the_request(self):
+        cache.clear()
+        with mock.patch("core.tasks.refresh_sitemaps_task.apply_async") as apply_async:
+            for _ in range(2):
+                self.assertEqual(self.client.get("/sitemaps/en/guides-999.xml").status_code, 404)
+            apply_async.assert_not_called()
+
+            SitemapFile.objects.filter(language="en", section="guides").delete()
+            for _ in range(2):
+                pending = self.client.get("/sitemaps/en/guides-1.xml")
+                self.assertEqual((pending.status_code, pending["Retry-After"]), (503, "60"))
+            apply_async.assert_called_once_with(([("en", "guides")],), countdown=60)
+
+            apply_async.reset_mock()
+            SitemapFile.objects.filter(section=SitemapFile.INDEX).delete()
+            self.assertEqual(self.client.get("/sitemap.xml").status_code, 503)
+            apply_async.assert_called_once_with(([("", SitemapFile.INDEX)],), countdown=60)
+
+        refresh_sections([("", SitemapFile.INDEX), ("en", "guides")])
+        self.assertEqual(self.client.get("/sitemap.xml").status_code, 200)
+        self.assertEqual(self.client.get("/sitemaps/en/guides-1.xml").status_code, 200)
+
+    def test_language_sitemap_urls_redirect_to_the_index(self):
+        for url in ("/de/sitemap.xml", "/en/sitemap.xml"):
+            self.assertRedirects(self.client.get(url), "/sitemap.xml", status_code=301, fetch_redirect_response=False)
+
+    def test_gzip_is_negotiated_with_quality_values(self):
+        refused = self.client.get("/sitemaps/de/guides-1.xml", HTTP_ACCEPT_ENCODING="gzip;q=0, identity")
+        self.assertNotIn("Content-Encoding", refused)
+        self.assertIn(b"/de/guides/mapped-de/", refused.content)
+        wildcard = self.client.get("/sitemaps/de/guides-1.xml", HTTP_ACCEPT_ENCODING="br, *;q=0.5")
+        self.assertEqual(wildcard["Content-Encoding"], "gzip")
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_refreshes_are_debounced_across_transactions(self):
+        cache.clear()
+        with mock.patch("core.tasks.refresh_sitemaps_task.apply_async") as apply_async:
+            for _ in range(3):
+                with self.captureOnCommitCallbacks(execute=True):
+                    schedule_sitemap_refresh("tools")
+                    schedule_sitemap_refresh("tools", ["en"])
+        apply_async.assert_called_once_with(([("de", "tools"), ("en", "tools")],), countdown=60)
+
+        refresh_sections([("en", "tools")])
+        with (
+            mock.patch("core.tasks.refresh_sitemaps_task.apply_async") as apply_async,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            schedule_sitemap_refresh("tools")
+        apply_async.assert_called_once_with(([("en", "tools")],), countdown=60)
@@ -0,0 +1,46 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import TeaserEntry
+from core.models.editorial import EditorialWorkflowMixin
+from core.services import get_latest_items
+from core.tests.factories import make_guide
+from prompts.models import Prompt
+
+User = get_user_model()
+
+
+class TeaserEntryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+
+    def test_published_object_gets_one_entry_per_language(self):
+        g = make_guide("feed")
+        entries = {e.language: e for e in TeaserEntry.objects.filter(kind="guide", object_id=g.pk)}
+        self.assertEqual(set(entries), {"en", "de"})
+        self.assertEqual(entries["de"].title, "feed DE")
+        self.assertEqual(entries["de"].teaser, "Einleitung")
+        self.assertEqual(entries["de"].url, "/de/guides/feed-de/")
+
+    def test_draft_has_no_entries_and_archive_removes_them(self):
+        draft = make_guide("draft", status=EditorialWorkflowMixin.STATUS_DRAFT)
+        self.assertFalse(TeaserEntry.objects.filter(object_id=draft.pk, kind="guide").exists())
+
+        g = make_guide("gone")
+        g.archive(by=self.editor)
+        g.save(update_fields=["status", "review_note", "is_published", "updated_at"])
+        self.assertFalse(TeaserEntry.objects.filter(object_id=g.pk, kind="guide").exists())
+
+    def test_latest_items_respects_mix_and_fills_deficit(self):
+        for i in range(5):
+            make_guide(f"g{i}", minutes_ago=i)
+        p = Prompt.objects.create(status=EditorialWorkflowMixin.STATUS_PUBLISHED, published_at=timezone.now())
+        p.create_translation("en", slug="only-prompt", title="Only Prompt", intro="", body="")
+
+        items = get_latest_items(limit=6, language="en")
+        self.assertEqual(len(items), 6)
+        self.assertEqual([i["badge"] for i in items].count("Prompt"), 1)
+        dates = [i["date"] for i in items]
+        self.assertEqual(dates, sorted(dates, reverse=True))
@@ -0,0 +1,56 @@
+import uuid
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import translation
+from parler.utils.context import switch_language
+
+from catalog.models import Tool
+from core.tests.factories import make_guide
+from core.urlbuilder import attach_urls, route, urls_for
+from glossary.models import GlossaryTerm
+from guides.models import Guide
+
+
+class UrlBuilderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.guides = [make_guide(f"batch{i}") for i in range(3)]
+        cls.tool = Tool.objects.create(slug="tool", website="https://example.com")
+        with switch_language(cls.tool, "en"):
+            cls.tool.name = "Tool"
+            cls.tool.slug = "tool-en"
+            cls.tool.save()
+
+    def test_route_matches_reverse(self):
+        with translation.override("de"):
+            expected = reverse("guides:detail", kwargs={"slug": "abc"})
+        self.assertEqual(route("guides:detail", "de", "abc"), expected)
+
+    def test_one_translation_query_per_model_for_all_languages(self):
+        guides = list(Guide.objects.filter(pk__in=[g.pk for g in self.guides]))
+        tool = Tool.objects.get(pk=self.tool.pk)
+        with self.assertNumQueries(2):
+            attach_urls(guides + [tool], ["en", "de"])
+        with self.assertNumQueries(0):
+            urls = [(g.get_absolute_url("en"), g.get_absolute_url("de")) for g in guides]
+            tool_de = tool.get_absolute_url("de")
+        self.assertIn(("/en/guides/batch0-en/", "/de/guides/batch0-de/"), urls)
+        # no German translation: Parler fallback slug, under the German prefix
+        self.assertEqual(tool_de, "/de/catalog/tool-en/")
+
+    def test_live_snapshot_wins_and_glossary_uses_translation_group(self):
+        g = self.guides[0]
+        g.live_i18n = {"de": {"slug": "live-de"}}
+        self.assertEqual(urls_for(g, ["de"]), {"de": "/de/guides/live-de/"})
+
+        group = uuid.uuid4()
+        en = GlossaryTerm.objects.create(term="Token", slug="token", short_definition="-", language="en",
+                                         translation_group=group)
+        GlossaryTerm.objects.create(term="Token", slug="token-de", short_definition="-", language="de",
+                                    translation_group=group)
+        self.assertEqual(urls_for(en), {"en": "/en/glossary/token/", "de": "/de/glossary/token-de/"})
+
+    def test_detail_page_hreflang_uses_each_languages_slug(self):
+        html = self.client.get("/en/guides/batch1-en/").content.decode()
+        self.assertIn('hreflang="de" href="https://www.mentoro-ai.com/de/guides/batch1-de/"', html)
@@ -0,0 +1,77 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from parler.utils.context import switch_language
+from reversion.models import Version
+
+from core.models import SlugRoute, TeaserEntry
+from core.models.editorial import EditorialWorkflowMixin
+from core.tests.test_routing import make_prompt
+from core.workflow import bulk_transition
+from prompts.models import Prompt
+
+User = get_user_model()
+
+
+class BulkTransitionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_superuser(username="ed", password="pw", email="ed@example.com")
+
+    def test_publish_writes_state_snapshots_and_one_revision(self):
+        prompts = [make_prompt(f"bulk-{i}") for i in range(3)]
+        draft = Prompt.objects.create(status=EditorialWorkflowMixin.STATUS_DRAFT)
+        with self.captureOnCommitCallbacks(execute=True):
+            result = bulk_transition(Prompt.objects.all(), "publish", by=self.editor, note="batch")
+
+        self.assertEqual(len(result.done), 3)
+        self.assertEqual(result.skipped, [(draft.pk, "Transition 'publish' not possible")])
+        for p in Prompt.objects.filter(pk__in=[p.pk for p in prompts]):
+            self.assertEqual((p.status, p.is_published, p.review_note), ("published", True, "batch"))
+            self.assertEqual(p.live_i18n["en"]["title"], "Prompt EN")
+            with switch_language(p, "de"):
+                self.assertEqual(p.public_slug, p.slug)
+
+        versions = Version.objects.get_for_model(Prompt)
+        self.assertEqual(versions.values("revision").distinct().count(), 1)
+        self.assertEqual(Prompt.objects.filter(last_published_revision_id__in=versions.values("pk")).count(), 3)
+        self.assertTrue(SlugRoute.objects.filter(slug="bulk-1-de", is_live=True).exists())
+        # side effects ran after commit
+        self.assertEqual(TeaserEntry.objects.filter(kind="prompt").count(), 6)
+
+    def test_side_effects_are_queued_as_one_task(self):
+        prompts = [make_prompt(f"queued-{i}") for i in range(2)]
+        with (
+            mock.patch("core.tasks.run_side_effects_task.delay") as delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            bulk_transition(Prompt.objects.all(), "publish", by=self.editor)
+        delay.assert_called_once()
+        label, events = delay.call_args.args
+        self.assertEqual(label, "prompts.Prompt")
+        self.assertEqual(sorted(e[0] for e in events), sorted(p.pk for p in prompts))
+
+    def test_archive_applies_extra_values_and_removes_teasers(self):
+        p = make_prompt("gone")
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_transition(Prompt.objects.filter(pk=p.pk), "publish", by=self.editor)
+        with self.captureOnCommitCallbacks(execute=True):
+            result = bulk_transition(
+                Prompt.objects.filter(pk=p.pk), "archive", by=self.editor, values={"is_published": False}
+            )
+        self.assertEqual(len(result.done), 1)
+        p = Prompt.objects.get(pk=p.pk)
+        self.assertEqual((p.status, p.is_published), ("archived", False))
+        self.assertFalse(TeaserEntry.objects.filter(kind="prompt", object_id=p.pk).exists())
+
+    def test_admin_action_publishes_the_selection(self):
+        prompts = [make_prompt(f"admin-{i}") for i in range(2)]
+        self.client.force_login(self.editor)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("admin:prompts_prompt_changelist"),
+                {"action": "action_publish", "_selected_action": [p.pk for p in prompts]},
+            )
+        self.assertEqual(Prompt.objects.filter(status="published").count(), 2)
@@ -0,0 +1,183 @@
+# core/urlbuilder.py
+"""
+Batch URL builder for translated content; canonical and hreflang URLs of many objects in many languages
+come from one translation query per model (none when translations are prefetched), and reverse() runs
+once per route and language: the resolved path is cached as a template with a slug placeholder.
+Results are attached to the instances, so get_absolute_url() returns them without language switching.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import NoReverseMatch, reverse
+from django.utils import translation
+from django.utils.encoding import iri_to_uri
+from parler.utils.i18n import get_active_language_choices
+
+SLUG_PLACEHOLDER = "url-builder-slug"
+
+
+@dataclass(frozen=True)
+class UrlSpec:
+    url_name: str
+    slug_fields: tuple[str, ...]  # translated fields, first non-empty wins
+    live: bool = False  # read live_i18n (published snapshot) before the draft translation
+
+
+URL_SPECS = {
+    "guides.guide": UrlSpec("guides:detail", ("public_slug", "slug"), live=True),
+    "prompts.prompt": UrlSpec("prompts:detail", ("public_slug", "slug"), live=True),
+    "usecases.usecase": UrlSpec("usecases:detail", ("public_slug", "slug"), live=True),
+    "compare.comparison": UrlSpec("compare:detail", ("slug",)),
+    "catalog.tool": UrlSpec("catalog:detail", ("slug",)),
+}
+GLOSSARY_LABEL = "glossary.glossaryterm"
+
+
+@lru_cache(maxsize=512)
+def _route_template(url_name: str, language: str, with_slug: bool) -> str:
+    kwargs = {"slug": SLUG_PLACEHOLDER} if with_slug else None
+    with translation.override(language):
+        return reverse(url_name, kwargs=kwargs)
+
+
+@receiver(setting_changed)
+def _clear_route_templates(setting, **kwargs):
+    if setting in ("ROOT_URLCONF", "LANGUAGES", "LANGUAGE_CODE"):
+        _route_template.cache_clear()
+
+
+def route(url_name: str, language: str, slug: str | None = None) -> str:
+    """
+    reverse(url_name, kwargs={"slug": slug}) in `language`, without resolving the pattern again.
+    """
+    template = _route_template(url_name, language, slug is not None)
+    return template if slug is None else template.replace(SLUG_PLACEHOLDER, iri_to_uri(slug))
+
+
+def site_languages() -> list[str]:
+    return [code for code, _name in settings.LANGUAGES]
+
+
+def _translation_slugs(model, objs, fields) -> dict[int, dict[str, str]]:
+    """
+    {pk: {language: slug}}; read from prefetched translations when every object has them, else one query.
+    """
+    slugs: dict[int, dict[str, str]] = defaultdict(dict)
+    prefetched = [getattr(o, "_prefetched_objects_cache", {}).get("translations") for o in objs]
+    if all(p is not None for p in prefetched):
+        rows = ((t.master_id, t.language_code, *(getattr(t, f) for f in fields)) for p in prefetched for t in p)
+    else:
+        Translation = model._parler_meta.root_model
+        rows = Translation.objects.filter(master_id__in=[o.pk for o in objs]).values_list(
+            "master_id", "language_code", *fields
+        )
+    for master_id, language, *values in rows:
+        slug = next((v for v in values if v), None)
+        if slug:
+            slugs[master_id][language] = slug
+    return slugs
+
+
+def _pick(slugs: dict[str, str], language: str) -> str | None:
+    """
+    Same order as get_absolute_url: the language, its Parler fallbacks, then any translation.
+    """
+    for code in get_active_language_choices(language):
+        if slugs.get(code):
+            return slugs[code]
+    return next((slugs[code] for code in sorted(slugs)), None)
+
+
+def _translated_urls(model, objs, languages, spec: UrlSpec) -> None:
+    slugs = _translation_slugs(model, objs, spec.slug_fields)
+    for obj in objs:
+        urls = obj.__dict__.setdefault("_urls", {})
+        live = (getattr(obj, "live_i18n", None) or {}) if spec.live else {}
+        for language in languages:
+            snapshot = live.get(language) or {}
+            slug = snapshot.get("public_slug") or snapshot.get("slug") or _pick(slugs.get(obj.pk, {}), language)
+            if slug:
+                urls[language] = route(spec.url_name, language, slug)
+
+
+def _glossary_urls(model, objs, languages) -> None:
+    """
+    Glossary terms are one row per language, linked by translation_group.
+    """
+    groups = {o.translation_group for o in objs}
+    siblings = model.objects.filter(translation_group__in=groups, language__in=languages).values_list(
+        "translation_group", "language", "slug"
+    )
+    by_group: dict = defaultdict(dict)
+    for group, language, slug in siblings:
+        by_group[group][language] = slug
+    for obj in objs:
+        urls = obj.__dict__.setdefault("_urls", {})
+        for language, slug in by_group.get(obj.translation_group, {}).items():
+            urls[language] = route("glossary:detail", language, slug)
+
+
+def attach_urls(objects: Iterable, languages: Iterable[str] | None = None) -> None:
+    """
+    Computes the detail URL of every object in every language (default: all site languages) and stores
+    them on the instances (see cached_url); objects of unsupported models are skipped.
+    """
+    languages = list(languages or site_languages())
+    by_model = defaultdict(list)
+    for obj in objects:
+        if obj is not None and obj.pk is not None:
+            by_model[type(obj)].append(obj)
+
+    for model, objs in by_model.items():
+        label = model._meta.label_lower
+        pending = [o for o in objs if not set(languages) <= o.__dict__.get("_url_languages", set())]
+        if not pending:
+            continue
+        try:
+            if label == GLOSSARY_LABEL:
+                _glossary_urls(model, pending, languages)
+            elif label in URL_SPECS:
+                _translated_urls(model, pending, languages, URL_SPECS[label])
+            else:
+                continue
+        except NoReverseMatch:
+            continue
+        for obj in pending:
+            obj.__dict__.setdefault("_url_languages", set()).update(languages)
+
+
+def cached_url(obj, language: str) -> str | None:
+    return obj.__dict__.get("_urls", {}).get(language)
+
+
+def urls_for(obj, languages: Iterable[str] | None = None) -> dict[str, str]:
+    """
+    {language: path} for one object (e.g. the language switcher and hreflang links of a detail page).
+    """
+    languages = list(languages or site_languages())
+    attach_urls([obj], languages)
+    urls = obj.__dict__.get("_urls", {})
+    return {language: urls[language] for language in languages if language in urls}
+
+
+class UrlPaginator(Paginator):
+    """
+    Paginator whose pages come with URLs attached in `languages` (default: the active language).
+    """
+
+    def __init__(self, *args, languages: Iterable[str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.languages = list(languages) if languages else None
+
+    def _get_page(self, object_list, number, paginator):
+        object_list = list(object_list)
+        attach_urls(object_list, self.languages or [translation.get_language()])
+        return super()._get_page(object_list, number, paginator)
@@ -0,0 +1,108 @@
+# core/views_sitemaps.py
+"""
+Serves the prebuilt sitemap files (core.sitemaps); no content query per request.
+Files are sent gzipped as stored (decompressed only for clients without gzip support); files that are not
+built yet are queued for the background rebuild and answered with 503 + Retry-After meanwhile.
+ETag/Last-Modified come from the SitemapFile row, so revalidation ends with a 304 before the file is opened.
+"""
+import gzip
+
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_safe
+
+from core.models import SitemapFile
+from core.sitemaps import (
+    SITEMAPS,
+    refresh_delay,
+    schedule_missing_files,
+    site_languages,
+    sitemap_storage,
+)
+
+
+class SitemapPending(Exception):
+    pass
+
+
+def _entry(language: str, section: str, page: int):
+    """
+    The row of a built file; None for a page the section does not have. A file that was never built or is
+    missing from the storage is queued for the background rebuild (SitemapPending).
+    """
+    entry = SitemapFile.objects.filter(language=language, section=section, page=page).first()
+    if entry is not None and sitemap_storage().exists(entry.path):
+        return entry
+    if (
+        entry is None and section != SitemapFile.INDEX
+        and SitemapFile.objects.filter(language=language, section=section).exists()
+    ):
+        return None  # the section is built and has no such page
+    schedule_missing_files(language, section)
+    raise SitemapPending
+
+
+def _pending() -> HttpResponse:
+    response = HttpResponse("Sitemap is being built", status=503, content_type="text/plain")
+    response["Retry-After"] = str(refresh_delay())
+    return response
+
+
+def accepts_gzip(request) -> bool:
+    """
+    Accept-Encoding with quality values: "gzip;q=0" refuses gzip, "*" covers it unless gzip is listed.
+    """
+    qualities = {}
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        coding, *params = (piece.strip() for piece in part.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.lower()] = quality
+    return qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0))) > 0
+
+
+def _serve(request, entry: SitemapFile) -> HttpResponse:
+    etag = quote_etag(entry.etag)
+    last_modified = int(entry.last_modified.timestamp())
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        with sitemap_storage().open(entry.path, "rb") as fh:
+            content = fh.read()
+        if accepts_gzip(request):
+            response = HttpResponse(content, content_type="application/xml")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(gzip.decompress(content), content_type="application/xml")
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+@require_safe
+def sitemap_index(request):
+    try:
+        return _serve(request, _entry("", SitemapFile.INDEX, 1))
+    except SitemapPending:
+        return _pending()
+
+
+@require_safe
+def sitemap_section(request, language: str, section: str, page: int):
+    if language not in site_languages() or section not in SITEMAPS:
+        raise Http404("Unknown sitemap")
+    try:
+        entry = _entry(language, section, page)
+    except SitemapPending:
+        return _pending()
+    if entry is None:
+        raise Http404("Unknown sitemap page")
+    return _serve(request, entry)
@@ -0,0 +1,194 @@
+# core/workflow.py
+"""
+Bulk editorial transitions for the admin actions. bulk_transition() checks can_proceed (and an optional
+permission) for the whole selection first, runs the FSM transitions in memory and then writes the result
+set-based in one transaction: fields that ended up equal on every object with one UPDATE, the rest
+(live snapshots, per-object timestamps) and changed translations with bulk_update. All objects share one
+reversion revision. The work that normally hangs off post_save and content_changed (teasers, search,
+related graph, cache tags, sitemaps) runs afterwards as a single Celery task.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import reversion
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from django_fsm import TransitionNotAllowed, can_proceed
+from reversion.models import Version
+
+from core.events import content_changed, public_slugs, take_events
+from core.models.editorial import publishing, store_live_snapshots
+from core.related import refresh_related_for
+from core.search import sync_search_documents
+from core.services import sync_teaser_entries
+
+
+@dataclass
+class BulkTransitionResult:
+    done: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)  # [(pk, reason)]
+
+
+def _values(obj, fields) -> dict:
+    return {f.attname: getattr(obj, f.attname) for f in fields}
+
+
+def _run(obj, name: str, by, note: str) -> None:
+    method = getattr(obj, name)
+    try:
+        method(by=by, note=note)
+    except TypeError:
+        method(by=by)
+
+
+def _write(model, objs, changed: set) -> None:
+    """
+    One UPDATE for the fields that have the same value on every object, one bulk_update for the rest.
+    """
+    uniform, varying = {}, []
+    for f in model._meta.concrete_fields:
+        if f.attname not in changed:
+            continue
+        values = [getattr(obj, f.attname) for obj in objs]
+        if all(value == values[0] for value in values):
+            uniform[f.attname] = values[0]
+        else:
+            varying.append(f.name)
+    if uniform:
+        model._default_manager.filter(pk__in=[obj.pk for obj in objs]).update(**uniform)
+    if varying:
+        model._default_manager.bulk_update(objs, varying, batch_size=200)
+
+
+def _write_translations(changed_rows: dict) -> None:
+    by_model: dict = {}
+    for row, fields in changed_rows.values():
+        rows, names = by_model.setdefault(type(row), ([], set()))
+        rows.append(row)
+        names.update(fields)
+    for model, (rows, names) in by_model.items():
+        model._default_manager.bulk_update(rows, sorted(names), batch_size=200)
+
+
+def _store_published_revisions(model, objs) -> None:
+    if not any(f.name == "last_published_revision_id" for f in model._meta.fields):
+        return
+    latest = {}
+    versions = (
+        Version.objects.get_for_model(model)
+        .filter(object_id__in=[str(obj.pk) for obj in objs])
+        .order_by("object_id", "-pk")
+        .values_list("object_id", "pk")
+    )
+    for object_id, version_id in versions:
+        latest.setdefault(object_id, version_id)
+    for obj in objs:
+        obj.last_published_revision_id = latest.get(str(obj.pk), obj.last_published_revision_id)
+    model._default_manager.bulk_update(objs, ["last_published_revision_id"], batch_size=200)
+
+
+def bulk_transition(queryset, name: str, *, by, note: str = "", permission: str | None = None,
+                    values: dict | None = None) -> BulkTransitionResult:
+    """
+    Runs transition `name` on every object of queryset that can take it; the others are reported in
+    result.skipped. `values` are extra field values set on every transitioned object (e.g. is_published).
+    """
+    model = queryset.model
+    result = BulkTransitionResult()
+    fields = [f for f in model._meta.concrete_fields if not f.primary_key]
+    now = timezone.now()
+
+    with transaction.atomic():
+        objs = list(queryset.select_for_update().prefetch_related("translations"))
+        eligible = []
+        for obj in objs:
+            method = getattr(obj, name, None)
+            if method is None or not can_proceed(method):
+                result.skipped.append((obj.pk, f"Transition '{name}' not possible"))
+            elif permission and not by.has_perm(permission, obj):
+                result.skipped.append((obj.pk, "You are not authorized to perform this action."))
+            else:
+                eligible.append(obj)
+        if not eligible:
+            return result
+
+        changed: set = set()
+        changed_translations: dict = {}
+        with publishing():
+            for obj in eligible:
+                before = _values(obj, fields)
+                translations = list(obj.translations.all())
+                translations_before = [_values(row, row._meta.concrete_fields) for row in translations]
+                try:
+                    _run(obj, name, by, note)
+                except (TransitionNotAllowed, ValidationError) as exc:
+                    result.skipped.append((obj.pk, str(exc)))
+                    continue
+                for attname, value in {**(values or {}), "updated_at": now}.items():
+                    if hasattr(obj, attname):
+                        setattr(obj, attname, value)
+                changed.update(k for k, v in _values(obj, fields).items() if v != before[k])
+                for row, old in zip(translations, translations_before):
+                    diff = [f.name for f in row._meta.concrete_fields if getattr(row, f.attname) != old[f.attname]]
+                    if diff:
+                        changed_translations[row.pk] = (row, diff)
+                result.done.append(obj)
+        if not result.done:
+            return result
+
+        with reversion.create_revision():
+            reversion.set_user(by)
+            reversion.set_comment(f"Admin-Action: {name}")
+            _write(model, result.done, changed)
+            _write_translations(changed_translations)
+            store_live_snapshots(result.done)
+            for obj in result.done:
+                reversion.add_to_revision(obj)
+        if name == "publish":
+            _store_published_revisions(model, result.done)
+
+        events = [(obj.pk, *take_events(obj)) for obj in result.done]
+        enqueue_side_effects(model._meta.label, events)
+    return result
+
+
+def run_side_effects(label: str, events) -> None:
+    """
+    What post_save and content_changed would have done per object, for a whole batch:
+    teaser and search rows, one related-graph refresh, then the content_changed events
+    (cache tags, sitemaps; sitemap rebuilds of the batch are merged by the surrounding transaction).
+    """
+    model = apps.get_model(label)
+    objs = {obj.pk: obj for obj in model._default_manager.filter(pk__in=[e[0] for e in events])
+            .prefetch_related("translations")}
+    with transaction.atomic():
+        for obj in objs.values():
+            sync_teaser_entries(obj)
+            sync_search_documents(obj)
+        refresh_related_for(*objs.values())
+        for pk, actions, old_slugs in events:
+            obj = objs.get(pk)
+            if obj is None:
+                continue
+            payload = {
+                "instance": obj,
+                "languages": list(obj.get_available_languages()),
+                "old_slugs": old_slugs,
+                "new_slugs": public_slugs(obj),
+            }
+            for action in actions:
+                content_changed.send(sender=model, action=action, **payload)
+
+
+def enqueue_side_effects(label: str, events) -> None:
+    """
+    Queues run_side_effects as a Celery task once the transaction commits (inline where tasks run eagerly).
+    """
+    if not events:
+        return
+    from core.tasks import run_side_effects_task
+
+    transaction.on_commit(lambda: run_side_effects_task.delay(label, events))
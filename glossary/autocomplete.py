@@ -0,0 +1,186 @@
+# glossary/autocomplete.py
+"""
+Autocomplete engine for glossary terms; one in-memory prefix trie per language, built with a single query
+and rebuilt lazily after a term is saved or deleted (a version stamp in the shared cache reaches all workers).
+Typo-tolerant trigram matching (pg_trgm) on the term and the short definition is only used when the trie
+has no prefix hit.
+"""
+from __future__ import annotations
+
+import heapq
+import re
+import threading
+import time
+import unicodedata
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from itertools import islice
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection
+from django.db.models import Case, Q, Value, When
+
+from core.cache import hot_cache
+
+from .models import GlossaryTerm
+
+MAX_ENTRIES_PER_NODE = 50
+TRIE_VERSION_KEY = "glossary:autocomplete:{language}"
+WORD_START_RE = re.compile(r"\b\w")
+
+
+def normalize(text: str) -> str:
+    """
+    Case- and accent-insensitive key ("Ähnlichkeit" -> "ahnlichkeit").
+    """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+@dataclass(frozen=True)
+class TermEntry:
+    id: int
+    term: str
+    slug: str
+    short_definition: str
+    category: str
+    language: str
+    updated_at: datetime | None
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["updated_at"] = self.updated_at.isoformat() if self.updated_at else None
+        return data
+
+
+class PrefixTrie:
+    """
+    Character trie. Every node keeps, per initial of the term, the first MAX_ENTRIES_PER_NODE entries
+    below it in term order, once for keys that start the term and once for keys that start a later word.
+    The letter filter and the term-start ranking are applied through these buckets, so neither is cut
+    short by the cap, and a lookup still costs O(len(prefix)) plus the entries it returns.
+    """
+    TERM_START, WORD_START = 0, 1
+
+    def __init__(self):
+        self.root: list = [{}, ({}, {})]
+
+    def insert(self, key: str, entry: TermEntry, *, rank: int, initial: str, kind: int) -> None:
+        """
+        Entries must be inserted in rank order (all keys of one term before the next term).
+        """
+        node = self.root
+        for char in key:
+            node = node[0].setdefault(char, [{}, ({}, {})])
+            bucket = node[1][kind].setdefault(initial, [])
+            # several keys of one term share prefixes; keep each term once per bucket
+            if len(bucket) < MAX_ENTRIES_PER_NODE and (not bucket or bucket[-1][1] is not entry):
+                bucket.append((rank, entry))
+
+    def search(self, prefix: str, letter: str = "") -> Iterator[TermEntry]:
+        """
+        Entries below prefix: terms starting with it first, then terms with a word starting with it,
+        each in term order. letter (normalized) restricts the result to terms starting with it.
+        """
+        node = self.root
+        for char in prefix:
+            node = node[0].get(char)
+            if node is None:
+                return
+        seen = set()
+        for buckets in node[1]:
+            lists = [buckets.get(letter[0], ())] if letter else buckets.values()
+            for _, entry in heapq.merge(*lists):
+                if entry.id in seen or (len(letter) > 1 and not normalize(entry.term).startswith(letter)):
+                    continue
+                seen.add(entry.id)
+                yield entry
+
+
+def _entry(term: GlossaryTerm) -> TermEntry:
+    return TermEntry(
+        id=term.pk,
+        term=term.term,
+        slug=term.slug,
+        short_definition=term.short_definition,
+        category=term.category,
+        language=term.language,
+        updated_at=term.updated_at,
+    )
+
+
+def build_trie(language: str) -> PrefixTrie:
+    """
+    Indexes the whole term and every word start ("Large Language Model" is found by "lang" and "mod").
+    """
+    trie = PrefixTrie()
+    terms = GlossaryTerm.objects.filter(language=language).only(
+        "term", "slug", "short_definition", "category", "language", "updated_at"
+    )
+    keyed = sorted((normalize(term.term), term.pk, term) for term in terms.iterator(chunk_size=1000))
+    for rank, (key, _, term) in enumerate(keyed):
+        if not key:
+            continue
+        entry = _entry(term)
+        for match in WORD_START_RE.finditer(key):
+            kind = PrefixTrie.TERM_START if match.start() == 0 else PrefixTrie.WORD_START
+            trie.insert(key[match.start():], entry, rank=rank, initial=key[0], kind=kind)
+    return trie
+
+
+_tries: dict[str, tuple[int, PrefixTrie]] = {}
+_lock = threading.Lock()
+
+
+def _version(language: str) -> int:
+    return hot_cache.get(TRIE_VERSION_KEY.format(language=language)) or 0
+
+
+def get_trie(language: str) -> PrefixTrie:
+    version = _version(language)
+    cached = _tries.get(language)
+    if cached and cached[0] == version:
+        return cached[1]
+    with _lock:
+        cached = _tries.get(language)
+        if cached and cached[0] == version:
+            return cached[1]
+        trie = build_trie(language)
+        _tries[language] = (version, trie)
+        return trie
+
+
+def invalidate_trie(language: str) -> None:
+    hot_cache.set(TRIE_VERSION_KEY.format(language=language), time.time_ns(), None)
+    _tries.pop(language, None)
+
+
+def _fuzzy(q: str, language: str, limit: int, letter: str) -> list[TermEntry]:
+    """
+    Matches in the term or the short definition (both have a trigram index); term matches rank first.
+    """
+    qs = GlossaryTerm.objects.filter(language=language)
+    if letter:
+        qs = qs.filter(term__istartswith=letter)
+    if connection.vendor == "postgresql":
+        qs = qs.annotate(
+            term_similarity=TrigramWordSimilarity(q, "term"),
+            definition_similarity=TrigramWordSimilarity(q, "short_definition"),
+        ).filter(Q(term__trigram_word_similar=q) | Q(short_definition__trigram_word_similar=q))
+        return [_entry(t) for t in qs.order_by("-term_similarity", "-definition_similarity", "term")[:limit]]
+    qs = qs.filter(Q(term__icontains=q) | Q(short_definition__icontains=q))
+    in_term = Case(When(term__icontains=q, then=Value(0)), default=Value(1))
+    return [_entry(t) for t in qs.order_by(in_term, "term")[:limit]]
+
+
+def complete(q: str, language: str, limit: int = 20, letter: str = "") -> list[TermEntry]:
+    """
+    Terms matching q as a prefix of the term or of one of its words; terms that start with q come first.
+    Without a prefix hit, terms whose term or short definition is similar to q.
+    """
+    prefix = normalize(q).strip()
+    if not prefix:
+        return []
+    initial = normalize(letter).strip()
+    return list(islice(get_trie(language).search(prefix, initial), limit)) or _fuzzy(q, language, limit, letter)
@@ -0,0 +1,36 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+TRIGRAM_INDEXES = {
+    "glossary_term_trgm": "term",
+    "glossary_short_definition_trgm": "short_definition",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON glossary_glossaryterm USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('glossary', '0001_initial'),
+    ]
+
+    operations = [
+        # pg_trgm GIN indexes for the autocomplete fallback; skipped on SQLite test runs
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,69 @@
+from django.test import TestCase
+
+from glossary import autocomplete
+from glossary.autocomplete import complete, normalize
+from glossary.models import GlossaryTerm
+
+
+def make_term(term, slug, lang="en"):
+    return GlossaryTerm.objects.create(term=term, slug=slug, short_definition=f"About {term}", language=lang)
+
+
+class GlossaryAutocompleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        make_term("Large Language Model", "llm")
+        make_term("Language Detection", "language-detection")
+        make_term("Token", "token")
+        make_term("Ähnlichkeit", "aehnlichkeit", lang="de")
+
+    def test_prefix_matches_word_starts_and_ranks_term_starts_first(self):
+        self.assertEqual(
+            [e.slug for e in complete("lang", "en")],
+            ["language-detection", "llm"],
+        )
+        self.assertEqual([e.slug for e in complete("mod", "en")], ["llm"])
+        self.assertEqual(complete("lang", "de"), [])
+
+    def test_matching_is_case_and_accent_insensitive(self):
+        self.assertEqual(normalize("Ähnlichkeit"), "ahnlichkeit")
+        self.assertEqual([e.slug for e in complete("ÄHN", "de")], ["aehnlichkeit"])
+
+    def test_trie_is_rebuilt_after_a_term_is_saved(self):
+        complete("tok", "en")
+        with self.captureOnCommitCallbacks(execute=True):
+            make_term("Tokenizer", "tokenizer")
+        self.assertEqual([e.slug for e in complete("tok", "en")], ["token", "tokenizer"])
+
+    def test_letter_and_term_start_ranking_apply_beyond_the_node_cap(self):
+        # 60 terms with "grid" as a later word fill the word-start bucket before the term-start hits
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(autocomplete.MAX_ENTRIES_PER_NODE + 10):
+                make_term(f"A{i:02d} Grid", f"a{i:02d}-grid")
+            make_term("Grid Search", "grid-search")
+            make_term("Zeta Grid", "zeta-grid")
+        self.assertEqual(complete("grid", "en", limit=1)[0].slug, "grid-search")
+        self.assertEqual([e.slug for e in complete("grid", "en", letter="z")], ["zeta-grid"])
+
+    def test_falls_back_to_short_definitions(self):
+        self.assertEqual([e.slug for e in complete("about tok", "en")], ["token"])
+
+    def test_language_change_rebuilds_both_tries(self):
+        token = GlossaryTerm.objects.get(slug="token")
+        self.assertEqual(len(complete("tok", "en")), 1)
+        self.assertEqual(complete("tok", "de"), [])
+        token.language = "de"
+        with self.captureOnCommitCallbacks(execute=True):
+            token.save()
+        self.assertEqual([e.slug for e in complete("tok", "de")], ["token"])
+        self.assertEqual(complete("tok", "en"), [])
+
+    def test_json_fast_path_skips_templates(self):
+        resp = self.client.get("/en/glossary/autocomplete/", {"q": "tok", "format": "json"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["results"][0]["slug"], "token")
+        self.assertEqual(list(resp.templates), [])
+
+    def test_html_fragment(self):
+        resp = self.client.get("/en/glossary/autocomplete/", {"q": "tok"})
+        self.assertContains(resp, "/en/glossary/token/")
@@ -1,15 +1,28 @@
-from django.db.models import Q
-from django.http import JsonResponse, HttpResponse
+from asgiref.sync import sync_to_async
+from django.http import Http404, JsonResponse, HttpResponse
 from django.template.loader import render_to_string
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _, get_language
 from django.views.generic import ListView, DetailView, View
 
-from core.seo.utils import absolute_url, localized_alternates
+from core.cache import cache_public_page
+from core.conditional import (
+    AsyncConditionalListMixin,
+    aobject_validators,
+    aqueryset_validators,
+    not_modified,
+    set_validators,
+)
+from core.pagination import InvalidCursor, KeysetPaginator
+from core.search import matching_ids
+from core.seo.utils import absolute_url, localized_alternates, object_alternates
 from core.views import SeoMixin
+from .autocomplete import complete
 from .models import GlossaryTerm
 
 
-class GlossaryListView(ListView, SeoMixin):
+@method_decorator(cache_public_page(tags=[GlossaryTerm]), name="get")
+class GlossaryListView(AsyncConditionalListMixin, ListView, SeoMixin):
     model = GlossaryTerm
     template_name = "glossary/glossary_list.html"
     context_object_name = "terms"
@@ -24,12 +37,7 @@ class GlossaryListView(ListView, SeoMixin):
             qs = qs.filter(term__istartswith=letter)
 
         if q:
-            qs = qs.filter(
-                Q(term__icontains=q)
-                | Q(short_definition__icontains=q)
-                | Q(long_definition__icontains=q)
-                | Q(category__icontains=q)
-            )
+            qs = qs.filter(pk__in=matching_ids("glossary", q, lang))
 
         return qs.order_by("term", "pk")
 
@@ -57,6 +65,7 @@ class GlossaryListView(ListView, SeoMixin):
         return ctx
 
 
+@method_decorator(cache_public_page(), name="get")
 class GlossaryDetailView(DetailView, SeoMixin):
     model = GlossaryTerm
     template_name = "glossary/glossary_detail.html"
@@ -68,6 +77,18 @@ class GlossaryDetailView(DetailView, SeoMixin):
         lang = get_language() or "en"
         return GlossaryTerm.objects.filter(language=lang)
 
+    async def get(self, request, *args, **kwargs):
+        try:
+            self.object = await self.get_queryset().aget(slug=kwargs.get(self.slug_url_kwarg))
+        except GlossaryTerm.DoesNotExist:
+            raise Http404(_("No glossary term found matching the query"))
+        etag, last_modified = await aobject_validators(request, self.object)
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            context = await sync_to_async(self.get_context_data)(object=self.object)
+            response = self.render_to_response(context)
+        return set_validators(response, etag, last_modified)
+
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         obj: GlossaryTerm = ctx["term"]
@@ -75,7 +96,7 @@ class GlossaryDetailView(DetailView, SeoMixin):
         desc = (obj.short_definition or obj.long_definition or obj.term)[:155]
         canonical = absolute_url(self.request.path)
         og_img = getattr(obj, "hero_image_url", None)
-        alts = localized_alternates(self.request, "glossary:detail", {"slug": obj.slug})
+        alts = object_alternates(self.request, obj)
         json_ld = {
             "@context": "https://schema.org",
             "@type": "Article",
@@ -110,68 +131,65 @@ class GlossaryAutocompleteView(View):
     """
     HTMX-Endpoint: liefert nur das Result-Fragment (HTML),
     damit das Suchergebnis live unter dem Input erscheint.
+    Treffer kommen aus dem In-Memory-Prefix-Trie (glossary.autocomplete);
+    format=json antwortet ohne Template-Rendering.
     """
     template_name = "glossary/glossary_results.html"
     context_object_name = "terms"
     MIN_QUERY_LENGTH = 2
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         lang = get_language() or "en"
         q = (request.GET.get("q") or "").strip()
         letter = (request.GET.get("letter") or "").strip()
         if len(q) < self.MIN_QUERY_LENGTH:
             return HttpResponse("")
-        qs = GlossaryTerm.objects.filter(language=lang)
-        if letter:
-            qs = qs.filter(term__istartswith=letter)
-        if q:
-            qs = qs.filter(Q(term__icontains=q) | Q(short_definition__icontains=q)).order_by("term")
 
-        html = render_to_string(self.template_name, {"terms": qs[:20], "compact": True}, request=request)
+        # the trie is in memory; only a rebuild or the fuzzy fallback touches the database
         if (request.GET.get("format") or "").lower() == "json":
-            data = [
-                {
-                    "id": t.id,
-                    "term": t.term,
-                    "slug": t.slug,
-                    "short_definition": t.short_definition,
-                    "category": t.category,
-                    "language": t.language,
-                    "updated_at": t.updated_at.isoformat() if hasattr(t, "updated_at") and t.updated_at else None,
-                }
-                for t in qs[:50]
-            ]
-            return JsonResponse({"results": data})
+            entries = await sync_to_async(complete)(q, lang, limit=50, letter=letter)
+            return JsonResponse({"results": [e.as_dict() for e in entries]})
+
+        entries = await sync_to_async(complete)(q, lang, limit=20, letter=letter)
+        html = render_to_string(self.template_name, {"terms": entries, "compact": True}, request=request)
         return HttpResponse(html)
 
 
 class GlossaryApiView(View):
+    """
+    JSON-Liste der Glossarbegriffe mit Keyset-Pagination über (term, pk):
+    ?cursor= aus "next"/"previous", ?count=approx|exact|none (Standard approx, Planner-Schätzung auf PostgreSQL).
+    """
 
-    def get(self, request):
+    async def get(self, request):
         lang = get_language() or "en"
         q = (request.GET.get("q") or "").strip()
         letter = (request.GET.get("letter") or "").strip()
+        count_mode = (request.GET.get("count") or "approx").lower()
         try:
             limit = min(max(int(request.GET.get("limit", 50)), 1), 200)
         except ValueError:
             limit = 50
-        try:
-            offset = max(int(request.GET.get("offset", 0)), 0)
-        except ValueError:
-            offset = 0
 
-        qs = GlossaryTerm.objects.filter(language=lang)
+        qs = GlossaryTerm.objects.filter(language=lang).only(
+            "term", "slug", "short_definition", "category", "language", "updated_at"
+        )
         if letter:
             qs = qs.filter(term__istartswith=letter)
         if q:
-            qs = qs.filter(
-                Q(term__icontains=q)
-                | Q(short_definition__icontains=q)
-                | Q(long_definition__icontains=q)
-                | Q(category__icontains=q)
-            )
-        total = qs.count()
-        rows = qs.order_by("term")[offset: offset + limit]
+            qs = qs.filter(pk__in=await sync_to_async(matching_ids)("glossary", q, lang))
+
+        etag, last_modified = await aqueryset_validators(request, qs)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return set_validators(response, etag, last_modified)
+
+        paginator = KeysetPaginator(qs, ("term", "pk"), limit, approximate=count_mode != "exact")
+        try:
+            page = await paginator.apage(request.GET.get("cursor"))
+        except InvalidCursor:
+            return JsonResponse({"error": "invalid cursor"}, status=400)
+        count = None if count_mode == "none" else await sync_to_async(lambda: paginator.count)()
 
         data = [
             {
@@ -182,14 +200,16 @@ class GlossaryApiView(View):
                 "language": r.language,
                 "updated_at": r.updated_at.isoformat(),
             }
-            for r in rows
+            for r in page.object_list
         ]
 
-        return JsonResponse(
+        response = JsonResponse(
             {
-                "count": total,
+                "count": count,
                 "limit": limit,
-                "offset": offset,
+                "next": page.next_cursor,
+                "previous": page.previous_cursor,
                 "results": data,
             }
         )
+        return set_validators(response, etag, last_modified)
@@ -1,7 +1,6 @@
 import reversion
 from django.conf import settings
 from django.contrib import admin, messages
-from django.db import transaction
 from django.template.response import TemplateResponse
 from django.urls import path
 from django.utils.formats import date_format
@@ -13,6 +12,7 @@ from reversion.admin import VersionAdmin
 
 from core.admin import TranslatableTinyMCEMixin, TranslatableTinyMCEInlineMixin, set_last_published_revision
 from core.services import get_live_display_instance, build_field_diffs, build_section_diffs
+from core.workflow import bulk_transition
 from .models import GuideItem, GuideSection, Guide
 
 
@@ -207,20 +207,12 @@ class GuideAdmin(TranslatableTinyMCEMixin, VersionAdmin):
     # ------- Actions -------
     @admin.action(description=_("Send to review"))
     def action_submit_for_review(self, request, queryset):
-        ok = 0
-        with reversion.create_revision():
-            for obj in queryset:
-                try:
-                    if not request.user.has_perm("content.submit_for_review", obj):
-                        raise PermissionError(_("You are not authorized to perform this action."))
-                    obj.submit_for_review(by=request.user)
-                    obj.save(update_fields=["status", "submitted_for_review_at", "updated_at"])
-                    ok += 1
-                except Exception as e:
-                    self.message_user(request, f"{obj}: {e}", messages.ERROR)
-            reversion.set_user(request.user)
-            reversion.set_comment("submit_for_review")
-        self.message_user(request, _("%(n)d Article(s) → Review.") % {"n": ok}, messages.SUCCESS)
+        result = bulk_transition(
+            queryset, "submit_for_review", by=request.user, permission="content.submit_for_review"
+        )
+        for pk, reason in result.skipped:
+            self.message_user(request, f"#{pk}: {reason}", messages.ERROR)
+        self.message_user(request, _("%(n)d Article(s) → Review.") % {"n": len(result.done)}, messages.SUCCESS)
 
     @admin.action(description=_("Request changes (→ Rework)"))
     def action_request_rework(self, request, queryset):
@@ -242,30 +234,10 @@ class GuideAdmin(TranslatableTinyMCEMixin, VersionAdmin):
 
     @admin.action(description=_("Publish selected Guide(s)"))
     def action_publish(self, request, queryset):
-        published, skipped = 0, []
-        with transaction.atomic():
-            with reversion.create_revision():
-                reversion.set_user(request.user)
-                reversion.set_comment("Admin-Action: publish")
-
-                for obj in queryset.select_for_update():
-
-                    if getattr(obj, "status", None) == getattr(obj, "STATUS_PUBLISHED", "published"):
-                        continue
-
-                    if hasattr(obj, "publish") and can_proceed(obj.publish):
-                        try:
-                            obj.publish(by=request.user, note="Admin-Action publish")
-
-                            obj.save()
-                            set_last_published_revision(obj)
-                            obj.save(update_fields=["last_published_revision_id"])
-                            published += 1
-                        except Exception as e:
-                            skipped.append((obj.pk, str(e)))
-                    else:
-                        skipped.append((obj.pk, "Transition 'publish' not executable"))
-
+        result = bulk_transition(
+            queryset.exclude(status=Guide.STATUS_PUBLISHED), "publish", by=request.user, note="Admin-Action publish"
+        )
+        published, skipped = len(result.done), result.skipped
         if published:
             self.message_user(request, _(f"{published} Item(s) published."), level=messages.SUCCESS)
         if skipped:
@@ -278,24 +250,13 @@ class GuideAdmin(TranslatableTinyMCEMixin, VersionAdmin):
 
     @admin.action(description=_("Archiving (Soft Delete)"))
     def action_archive(self, request, queryset):
-        ok = 0
-        note = request.POST.get("review_note", "")
-        with reversion.create_revision():
-            for obj in queryset:
-                if not request.user.has_perm("content.archive", obj):
-                    self.message_user(request, f"{obj}: You are not authorized to perform this action.",
-                                      level=messages.ERROR)
-                    continue
-                try:
-                    obj.archive(by=request.user, note=note)
-                    obj.is_published = False
-                    obj.save(update_fields=["status", "review_note", "is_published", "updated_at"])
-                    ok += 1
-                except Exception as e:
-                    self.message_user(request, f"{obj}: {e}", level=messages.ERROR)
-            reversion.set_user(request.user)
-            reversion.set_comment("archive")
-        self.message_user(request, _("%(n)d Article(s) archived.") % {"n": ok}, level=messages.SUCCESS)
+        result = bulk_transition(
+            queryset, "archive", by=request.user, note=request.POST.get("review_note", ""),
+            permission="content.archive", values={"is_published": False},
+        )
+        for pk, reason in result.skipped:
+            self.message_user(request, f"#{pk}: {reason}", level=messages.ERROR)
+        self.message_user(request, _("%(n)d Article(s) archived.") % {"n": len(result.done)}, level=messages.SUCCESS)
 
     @admin.action(description=_("Restore (→ Draft)"))
     def action_restore_draft(self, request, queryset):
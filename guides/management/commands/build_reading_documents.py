@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from guides.models import Guide
+from guides.reading import build_reading_documents
+
+
+class Command(BaseCommand):
+    help = "Builds the reading documents (sections, items, table of contents) of every published guide."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--guide", type=int, action="append", dest="guides", help="Only this guide id (repeatable).")
+
+    def handle(self, *args, guides=None, **options):
+        qs = Guide.objects.filter(status=Guide.STATUS_PUBLISHED).prefetch_related("translations").order_by("pk")
+        if guides:
+            qs = qs.filter(pk__in=guides)
+        total = 0
+        for guide in qs:
+            total += len(build_reading_documents(guide))
+        self.stdout.write(self.style.SUCCESS(f"{total} reading document(s) built."))
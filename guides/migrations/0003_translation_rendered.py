@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('guides', '0002_remove_guide_reviewer_alter_guide_author_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guidesectiontranslation',
+            name='rendered',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Rendered richtext'),
+        ),
+        migrations.AddField(
+            model_name='guidetranslation',
+            name='rendered',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Rendered richtext'),
+        ),
+    ]
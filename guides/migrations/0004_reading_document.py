@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-17 18:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('guides', '0003_translation_rendered'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GuideReadingDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=15)),
+                ('html', models.TextField(blank=True)),
+                ('data', models.JSONField(blank=True, default=dict)),
+                ('built_at', models.DateTimeField(auto_now=True)),
+                ('guide', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reading_documents', to='guides.guide')),
+            ],
+            options={
+                'verbose_name': 'Guide reading document',
+                'verbose_name_plural': 'Guide reading documents',
+                'constraints': [models.UniqueConstraint(fields=('guide', 'language'), name='guidereadingdocument_unique_language')],
+            },
+        ),
+    ]
@@ -8,18 +8,21 @@ from parler.models import TranslatableModel, TranslatedFields
 from parler.utils.context import switch_language
 
 from catalog.models import Category, Tool
+from content.rendering import reading_time, rendered
 from core.models.editorial import EditorialMixin, EditorialWorkflowMixin
+from core.urlbuilder import cached_url
 
 
 class Guide(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
     live_i18n = models.JSONField(default=dict, blank=True)
-    LIVE_SNAPSHOT_FIELDS = ("slug", "public_slug", "title", "intro", "body")
+    LIVE_SNAPSHOT_FIELDS = ("slug", "public_slug", "title", "intro", "body", "rendered")
     translations = TranslatedFields(
         title=models.CharField(_("Title"), max_length=200),
         intro=models.TextField(_("Intro"), blank=True),
         body=models.TextField(_("Body"), blank=True),
         slug=models.SlugField(_("Slug"), max_length=220, unique=True),
         public_slug=models.SlugField(_("Public slug"), max_length=220, unique=True, null=True, blank=True),
+        rendered=models.JSONField(_("Rendered richtext"), default=dict, blank=True, editable=False),
     )
     categories = models.ManyToManyField(Category, blank=True)
     tools = models.ManyToManyField(Tool, blank=True)
@@ -40,6 +43,7 @@ class Guide(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
                 "title": self.safe_translation_getter("title"),
                 "intro": self.safe_translation_getter("intro"),
                 "body": self.safe_translation_getter("body"),
+                "rendered": self.safe_translation_getter("rendered"),
             }
 
     def get_live_value(self, field: str, language: str | None = None) -> str | None:
@@ -52,6 +56,9 @@ class Guide(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
         So bleibt die Liste stabil während Review.
         """
         lang = language or get_language()
+        cached = self.cached_display_values(lang)
+        if cached is not None:
+            return cached.get(field)
         live = self.get_live_value(field, lang)
         if live:
             return live
@@ -59,6 +66,9 @@ class Guide(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
 
     def get_absolute_url(self, language: str | None = None):
         lang = language or get_language()
+        cached = cached_url(self, lang)
+        if cached:
+            return cached
         live_slug = self.get_live_value("public_slug", lang) or self.get_live_value("slug", lang)
         if live_slug:
             return reverse("guides:detail", kwargs={"slug": live_slug})
@@ -80,25 +90,16 @@ class Guide(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
             with switch_language(self, lang):
                 if self.slug and self.public_slug != self.slug:
                     self.public_slug = self.slug
-        try:
-            sections = self.sections.all()
-        except Exception:
-            sections = []
 
+    def live_snapshot_dependents(self):
+        sections = list(self.sections.prefetch_related("translations"))
         for section in sections:
-            if not hasattr(section, "get_available_languages"):
-                continue
-
             live = {}
             for lang in section.get_available_languages():
                 curr = section._current_values_for(lang)
-                live[lang] = {fname: curr.get(fname) for fname in getattr(section, "SECTION_LIVE_FIELDS", ())}
-
+                live[lang] = {fname: curr.get(fname) for fname in section.SECTION_LIVE_FIELDS}
             section.live_i18n = live
-            try:
-                section.save(update_fields=["live_i18n"])
-            except Exception:
-                pass
+        return sections
 
     @property
     def display_title(self):
@@ -112,16 +113,30 @@ class Guide(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
     def display_body(self):
         return self.get_display_value("body")
 
+    @property
+    def rendered_intro(self) -> dict:
+        return rendered(self, "intro")
+
+    @property
+    def rendered_body(self) -> dict:
+        return rendered(self, "body")
+
+    @property
+    def reading_time(self) -> int:
+        """Minutes, from the word counts stored on save."""
+        return reading_time(self.rendered_intro, self.rendered_body)
+
 
 class GuideSection(TranslatableModel):
     guide = models.ForeignKey(Guide, on_delete=models.CASCADE, related_name="sections")
     order = models.PositiveIntegerField(default=0)
     live_i18n = models.JSONField(default=dict, blank=True)
-    SECTION_LIVE_FIELDS = ("title", "body")
+    SECTION_LIVE_FIELDS = ("title", "body", "rendered")
 
     translations = TranslatedFields(
         title=models.CharField(_("Title"), max_length=200),
         body=models.TextField(_("Body"), blank=True),
+        rendered=models.JSONField(_("Rendered richtext"), default=dict, blank=True, editable=False),
     )
 
     class Meta:
@@ -141,6 +156,7 @@ class GuideSection(TranslatableModel):
             return {
                 "title": self.safe_translation_getter("title"),
                 "body": self.safe_translation_getter("body"),
+                "rendered": self.safe_translation_getter("rendered"),
             }
 
     def get_live_value(self, field: str, language: str | None = None):
@@ -162,6 +178,10 @@ class GuideSection(TranslatableModel):
     def display_body(self):
         return self.get_display_value("body")
 
+    @property
+    def rendered_body(self) -> dict:
+        return rendered(self, "body")
+
 
 CONTENT_KIND_CHOICES = (
     ("guide", "Guide"),
@@ -209,7 +229,21 @@ class GuideItem(TranslatableModel):
     def __str__(self):
         return f"{self.kind} item #{self.pk}"
 
+    @property
+    def content_tag(self) -> str:
+        """Cache tag of the linked content (see core.cache.tag_for), without loading it."""
+        if not (self.content_type_id and self.object_id):
+            return ""
+        ct = ContentType.objects.get_for_id(self.content_type_id)
+        return f"{ct.app_label}.{ct.model}:{self.object_id}"
+
+    def _card_value(self, key: str):
+        """Value precomputed by core.services.attach_item_content, if that ran for this item."""
+        return self.__dict__.get("_card", {}).get(key)
+
     def get_title(self):
+        if self._card_value("title") is not None:
+            return self._card_value("title")
         if getattr(self, "title", None):
             return self.title
         obj = self.content_object
@@ -220,6 +254,8 @@ class GuideItem(TranslatableModel):
         )
 
     def get_teaser(self):
+        if self._card_value("teaser") is not None:
+            return self._card_value("teaser")
         if getattr(self, "teaser", None):
             return self.teaser
         obj = self.content_object
@@ -230,6 +266,8 @@ class GuideItem(TranslatableModel):
         )
 
     def get_url(self):
+        if self._card_value("url") is not None:
+            return self._card_value("url")
         if self.url:
             return self.url
         obj = self.content_object
@@ -241,3 +279,30 @@ class GuideItem(TranslatableModel):
         from django.core.exceptions import ValidationError
         if not (self.content_type and self.object_id) and not self.url:
             raise ValidationError(_("Either content_object (content_type + object_id) OR a URL."))
+
+
+class GuideReadingDocument(models.Model):
+    """
+    The reading part of a published guide in one language (guides.reading): sections with their sanitized
+    bodies and resolved item cards as one HTML blob, plus a JSON outline (table of contents, sections, items).
+    Built when the guide is published or one of its items changes; the detail page reads it in one row fetch.
+    """
+    guide = models.ForeignKey(Guide, on_delete=models.CASCADE, related_name="reading_documents")
+    language = models.CharField(max_length=15)
+    html = models.TextField(blank=True)
+    data = models.JSONField(default=dict, blank=True)  # {"toc": [...], "sections": [...], "reading_time"}
+    built_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Guide reading document")
+        verbose_name_plural = _("Guide reading documents")
+        constraints = [
+            models.UniqueConstraint(fields=["guide", "language"], name="guidereadingdocument_unique_language")
+        ]
+
+    def __str__(self):
+        return f"{self.guide_id} · {self.language}"
+
+    @property
+    def toc(self) -> list:
+        return self.data.get("toc", [])
@@ -0,0 +1,122 @@
+# guides/reading.py
+"""
+Publish-time reading documents: for every live language of a published guide the sections (sanitized
+bodies from the live snapshot) and their resolved item cards are rendered once into a GuideReadingDocument,
+together with a JSON outline and table of contents. The detail page of a published guide reads that one row;
+guides in draft or review keep rendering from the ORM so editors see their preview.
+Documents are rebuilt by a Celery task (guides.tasks) after the guide is published and when its items or their
+targets change or are deleted (guides.signals), or by `manage.py build_reading_documents`.
+"""
+from __future__ import annotations
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Prefetch, prefetch_related_objects
+from django.template.loader import render_to_string
+from django.utils import translation
+
+from core.batching import collect_on_commit
+from core.cache import invalidate_tags
+from core.services import attach_item_content
+from core.urlbuilder import site_languages
+
+from .models import Guide, GuideItem, GuideReadingDocument, GuideSection
+
+
+def sections_prefetch() -> Prefetch:
+    """
+    Sections with their published items, translations included (item targets: core.services.attach_item_content).
+    """
+    items = GuideItem.objects.filter(is_published=True).prefetch_related("translations")
+    return Prefetch(
+        "sections",
+        queryset=GuideSection.objects.prefetch_related("translations", Prefetch("items", queryset=items)),
+    )
+
+
+def section_anchor(section) -> str:
+    return f"section-{section.pk}"
+
+
+def table_of_contents(sections) -> list[dict]:
+    return [{"anchor": section_anchor(s), "title": s.display_title} for s in sections if s.display_title]
+
+
+def _outline(guide, sections) -> dict:
+    return {
+        "toc": table_of_contents(sections),
+        "sections": [
+            {
+                "anchor": section_anchor(section),
+                "title": section.display_title,
+                "body": section.rendered_body["html"],
+                "items": [
+                    {"kind": item.kind, "title": item.get_title(), "url": item.get_url()}
+                    for item in section.items.all()
+                ],
+            }
+            for section in sections
+        ],
+        "reading_time": guide.reading_time,
+    }
+
+
+def build_reading_documents(guide: Guide) -> list[GuideReadingDocument]:
+    """
+    (Re)builds the documents of one guide, one per language of its live snapshot; documents of languages
+    the guide no longer has, or of a guide that is not published, are removed.
+    """
+    languages = [lang for lang in site_languages() if lang in (guide.live_i18n or {})]
+    if guide.status != Guide.STATUS_PUBLISHED:
+        languages = []
+    GuideReadingDocument.objects.filter(guide=guide).exclude(language__in=languages).delete()
+    if not languages:
+        return []
+
+    prefetch_related_objects([guide], sections_prefetch())
+    sections = list(guide.sections.all())
+    items = [item for section in sections for item in section.items.all()]
+    documents = []
+    for language in languages:
+        attach_item_content(items, language)
+        with translation.override(language):
+            for section in sections:
+                section.set_current_language(language)
+            html = render_to_string("guides/_guide_sections.html", {"sections": sections})
+            data = _outline(guide, sections)
+        document, _created = GuideReadingDocument.objects.update_or_create(
+            guide=guide, language=language, defaults={"html": html, "data": data}
+        )
+        documents.append(document)
+    return documents
+
+
+def guides_linking_to(model, pks) -> list[int]:
+    """
+    Published guides with an item that points at one of the given objects.
+    """
+    ct = ContentType.objects.get_for_model(model)
+    return list(
+        GuideItem.objects.filter(content_type=ct, object_id__in=list(pks), section__guide__status=Guide.STATUS_PUBLISHED)
+        .values_list("section__guide_id", flat=True)
+        .distinct()
+    )
+
+
+def rebuild_reading_documents(guide_ids) -> None:
+    for guide in Guide.objects.filter(pk__in=guide_ids).prefetch_related("translations"):
+        build_reading_documents(guide)
+        invalidate_tags(guide)
+
+
+def _enqueue(guide_ids: set) -> None:
+    from .tasks import rebuild_reading_documents_task
+
+    rebuild_reading_documents_task.delay(sorted(guide_ids))
+
+
+def schedule_reading_documents(*guide_ids: int) -> None:
+    """
+    Rebuilds the documents of the given guides in the background after the current transaction commits;
+    rebuilds queued by several saves in one transaction (e.g. every item of a section) are merged.
+    """
+    collect_on_commit(_enqueue, [pk for pk in guide_ids if pk])
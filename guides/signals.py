@@ -1,14 +1,30 @@
 # guides/signals.py
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from django_fsm import can_proceed
 
-from .models import Guide, GuideSection
+from catalog.models import Tool
+from compare.models import Comparison
+from core.events import content_changed
+from core.models.editorial import is_publishing
+from prompts.models import Prompt
+from usecases.models import UseCase
+
+from .models import Guide, GuideItem, GuideSection
+from .reading import guides_linking_to, schedule_reading_documents
+
+GuideItemTranslation = GuideItem._parler_meta.root_model
+# what guide items can point at (GuideItem.content_type)
+GuideTranslation = Guide._parler_meta.root_model
+PromptTranslation = Prompt._parler_meta.root_model
+UseCaseTranslation = UseCase._parler_meta.root_model
+ToolTranslation = Tool._parler_meta.root_model
+ComparisonTranslation = Comparison._parler_meta.root_model
 
 
 def _move_parent_to_review(guide, note):
-    if not guide:
+    if not guide or is_publishing():
         return
     if getattr(guide, "status", None) != getattr(Guide, "STATUS_PUBLISHED", "published"):
         return
@@ -25,3 +41,46 @@ def section_saved(sender, instance, **kwargs):
 @receiver(post_delete, sender=GuideSection)
 def section_deleted(sender, instance, **kwargs):
     _move_parent_to_review(getattr(instance, "guide", None), _("Auto: Change to GuideSection (delete)"))
+
+
+# Reading documents (guides.reading): rebuilt after publish and whenever an item or an item target changes
+# or is deleted; edits without a transition count too, since the cards read the target's current fields.
+
+
+@receiver(content_changed)
+def reading_content_changed(sender, instance, **kwargs):
+    """
+    A guide's own transitions rebuild (or, once it is no longer published, remove) its documents;
+    any transition of content that guides link to rebuilds those guides.
+    """
+    guide_ids = guides_linking_to(sender, [instance.pk])
+    if sender is Guide:
+        guide_ids.append(instance.pk)
+    schedule_reading_documents(*guide_ids)
+
+
+@receiver([post_save, post_delete], sender=Guide)
+@receiver([post_save, post_delete], sender=Prompt)
+@receiver([post_save, post_delete], sender=UseCase)
+@receiver([post_save, post_delete], sender=Tool)
+@receiver([post_save, post_delete], sender=Comparison)
+def reading_target_changed(sender, instance, **kwargs):
+    schedule_reading_documents(*guides_linking_to(sender, [instance.pk]))
+
+
+@receiver([post_save, post_delete], sender=GuideTranslation)
+@receiver([post_save, post_delete], sender=PromptTranslation)
+@receiver([post_save, post_delete], sender=UseCaseTranslation)
+@receiver([post_save, post_delete], sender=ToolTranslation)
+@receiver([post_save, post_delete], sender=ComparisonTranslation)
+def reading_target_translation_changed(sender, instance, **kwargs):
+    schedule_reading_documents(*guides_linking_to(sender._meta.get_field("master").related_model, [instance.master_id]))
+
+
+@receiver(post_save, sender=GuideItem)
+@receiver(post_save, sender=GuideItemTranslation)
+@receiver(post_delete, sender=GuideItem)
+def reading_item_changed(sender, instance, **kwargs):
+    item = instance.master if sender is GuideItemTranslation else instance
+    guide_id = GuideSection.objects.filter(pk=item.section_id).values_list("guide_id", flat=True).first()
+    schedule_reading_documents(guide_id)
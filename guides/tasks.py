@@ -0,0 +1,9 @@
+# guides/tasks.py
+from celery import shared_task
+
+from .reading import rebuild_reading_documents
+
+
+@shared_task(ignore_result=True)
+def rebuild_reading_documents_task(guide_ids: list[int]) -> None:
+    rebuild_reading_documents(guide_ids)
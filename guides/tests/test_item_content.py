@@ -0,0 +1,49 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+
+from catalog.models import Tool
+from core.services import attach_item_content
+from core.tests.factories import make_guide
+from guides.models import GuideItem, GuideSection
+from prompts.models import Prompt
+
+
+def add_items(guide, count):
+    section = GuideSection.objects.create(guide=guide, order=guide.sections.count())
+    section.create_translation("en", title="Section", body="")
+    prompt_ct, tool_ct = ContentType.objects.get_for_model(Prompt), ContentType.objects.get_for_model(Tool)
+    for i in range(count):
+        prompt = Prompt.objects.create(status="published")
+        prompt.create_translation("en", slug=f"p-{guide.pk}-{i}", title=f"Prompt {i}", intro="", body="<p>Prompt body</p>")
+        tool = Tool.objects.create()
+        tool.create_translation("en", name=f"Tool {i}", slug=f"t-{guide.pk}-{i}")
+        GuideItem.objects.create(section=section, kind="prompt", content_type=prompt_ct, object_id=prompt.pk, order=2 * i)
+        GuideItem.objects.create(section=section, kind="tool", content_type=tool_ct, object_id=tool.pk, order=2 * i + 1)
+    return section
+
+
+class GuideItemContentTests(TestCase):
+    def test_resolver_precomputes_title_teaser_and_url(self):
+        guide = make_guide("items")
+        section = add_items(guide, 1)
+        items = list(section.items.prefetch_related("translations"))
+        with translation.override("en"):
+            attach_item_content(items)
+            with self.assertNumQueries(0):
+                cards = [(i.get_title(), i.get_teaser(), i.get_url()) for i in items]
+        self.assertEqual(cards[0], ("Prompt 0", "<p>Prompt body</p>", f"/en/prompts/p-{guide.pk}-0/"))
+        self.assertEqual(cards[1][0], "Tool 0")
+
+    def test_detail_page_query_count_is_constant(self):
+        def page_queries(slug, count):
+            guide = make_guide(slug)
+            add_items(guide, count)
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(f"/en/guides/{slug}-en/")
+            self.assertContains(response, "Prompt 0")
+            return len(ctx.captured_queries)
+
+        self.assertEqual(page_queries("few", 2), page_queries("many", 10))
@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import SlugRoute
+from core.models.editorial import EditorialWorkflowMixin, publish_content, publishing
+from core.tests.factories import make_guide
+from core.workflow import bulk_transition
+from guides.models import Guide, GuideSection
+
+User = get_user_model()
+
+
+def add_sections(guide, count):
+    for i in range(count):
+        section = GuideSection.objects.create(guide=guide, order=i)
+        section.create_translation("en", title=f"Step {i}", body=f"<p>Step {i} body</p>")
+        section.create_translation("de", title=f"Schritt {i}", body=f"<p>Schritt {i}</p>")
+
+
+class PublishPipelineTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+
+    def publish_queries(self, sections):
+        guide = make_guide(f"pub-{sections}", status=EditorialWorkflowMixin.STATUS_REVIEW)
+        add_sections(guide, sections)
+        guide = Guide.objects.get(pk=guide.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            publish_content(guide, by=self.editor)
+        return guide, len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_sections(self):
+        _small, few = self.publish_queries(2)
+        _large, many = self.publish_queries(40)
+        self.assertLessEqual(many, few)  # the first publish also warms the ContentType cache
+
+    def test_sections_and_routes_are_written_with_the_guide(self):
+        guide, _queries = self.publish_queries(3)
+        guide = Guide.objects.get(pk=guide.pk)
+        self.assertEqual(guide.status, EditorialWorkflowMixin.STATUS_PUBLISHED)
+        self.assertEqual(guide.live_i18n["de"]["title"], "pub-3 DE")
+        section = guide.sections.get(order=1)
+        self.assertEqual(section.live_i18n["en"]["title"], "Step 1")
+        self.assertIn("Step 1 body", section.live_i18n["en"]["rendered"]["body"]["html"])
+        self.assertTrue(SlugRoute.objects.filter(object_id=guide.pk, slug="pub-3-en", is_live=True).exists())
+
+    def test_section_saves_during_publish_keep_the_guide_published(self):
+        guide = make_guide("quiet")
+        with publishing():
+            add_sections(guide, 1)
+        self.assertEqual(Guide.objects.get(pk=guide.pk).status, EditorialWorkflowMixin.STATUS_PUBLISHED)
+
+        guide.sections.get().save()
+        self.assertEqual(Guide.objects.get(pk=guide.pk).status, EditorialWorkflowMixin.STATUS_REVIEW)
+
+    def test_bulk_publish_writes_sections_of_every_guide(self):
+        guides = [make_guide(f"bulk-{i}", status=EditorialWorkflowMixin.STATUS_REVIEW) for i in range(2)]
+        for guide in guides:
+            add_sections(guide, 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            result = bulk_transition(Guide.objects.filter(pk__in=[g.pk for g in guides]), "publish", by=self.editor)
+        self.assertEqual(len(result.done), 2)
+        self.assertEqual(GuideSection.objects.filter(guide__in=guides).exclude(live_i18n={}).count(), 4)
@@ -0,0 +1,92 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from catalog.models import Tool
+from core.models.editorial import EditorialWorkflowMixin, publish_content
+from core.tests.factories import make_guide
+from guides.models import Guide, GuideReadingDocument, GuideSection
+from guides.tests.test_item_content import add_items
+from prompts.models import Prompt
+
+User = get_user_model()
+
+
+class ReadingDocumentTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username="ed", password="pw", email="ed@example.com")
+
+    def publish(self, slug, items=2):
+        guide = make_guide(slug, status=EditorialWorkflowMixin.STATUS_REVIEW)
+        section = add_items(guide, items)
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_content(Guide.objects.get(pk=guide.pk), by=self.editor)
+        return guide, section
+
+    def page_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        return response, len(ctx.captured_queries)
+
+    def test_publish_builds_one_document_per_live_language(self):
+        guide, section = self.publish("doc")
+        document = GuideReadingDocument.objects.get(guide=guide, language="en")
+        self.assertIn("Prompt 1", document.html)
+        self.assertIn(f'id="section-{section.pk}"', document.html)
+        self.assertEqual(document.toc, [{"anchor": f"section-{section.pk}", "title": "Section"}])
+        self.assertEqual([i["title"] for i in document.data["sections"][0]["items"]][:2], ["Prompt 0", "Tool 0"])
+        self.assertTrue(GuideReadingDocument.objects.filter(guide=guide, language="de").exists())
+
+    def test_detail_page_renders_from_the_document(self):
+        self.publish("fast", items=10)
+        response, queries = self.page_queries("/en/guides/fast-en/")
+        self.assertContains(response, "Prompt 9")
+        self.assertContains(response, 'href="#section-')
+
+        GuideReadingDocument.objects.all().delete()
+        response, live_queries = self.page_queries("/en/guides/fast-en/")
+        self.assertContains(response, "Prompt 9")
+        self.assertLess(queries, live_queries)
+
+    def test_item_changes_rebuild_the_document(self):
+        guide, section = self.publish("items")
+        with self.captureOnCommitCallbacks(execute=True):
+            item = section.items.first()
+            item.create_translation("en", title="Renamed card")
+        self.assertIn("Renamed card", GuideReadingDocument.objects.get(guide=guide, language="en").html)
+
+    def test_deleted_and_edited_targets_rebuild_the_document(self):
+        guide, section = self.publish("targets")
+        tool = Tool.objects.get(pk=section.items.get(kind="tool", order=1).object_id)
+        with self.captureOnCommitCallbacks(execute=True):
+            tool.delete()
+        self.assertNotIn("Tool 0", GuideReadingDocument.objects.get(guide=guide, language="en").html)
+
+        prompt = Prompt.objects.get(pk=section.items.get(kind="prompt", order=0).object_id)
+        with self.captureOnCommitCallbacks(execute=True):
+            prompt.set_current_language("en")
+            prompt.title = "Edited without a transition"
+            prompt.save()
+        self.assertIn("Edited without a transition", GuideReadingDocument.objects.get(guide=guide, language="en").html)
+
+    def test_rebuilds_are_batched_per_transaction(self):
+        guide, section = self.publish("batched", items=3)
+        with (
+            mock.patch("guides.tasks.rebuild_reading_documents_task.delay") as delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            for item in section.items.all():
+                item.create_translation("en", title=f"Card {item.pk}")
+        delay.assert_called_once_with([guide.pk])
+
+    def test_guide_in_review_renders_live_from_the_orm(self):
+        guide, section = self.publish("preview")
+        with self.captureOnCommitCallbacks(execute=True):
+            GuideSection.objects.get(pk=section.pk).save()
+        self.assertEqual(Guide.objects.get(pk=guide.pk).status, EditorialWorkflowMixin.STATUS_REVIEW)
+        self.assertFalse(GuideReadingDocument.objects.filter(guide=guide).exists())
+        self.assertContains(self.client.get("/en/guides/preview-en/"), "Prompt 0")
@@ -1,18 +1,26 @@
-from django.db.models import Prefetch, Q
+from django.db.models import prefetch_related_objects
 from django.http import Http404
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _, get_language
 from django.views.generic import ListView, DetailView
 
-from core.seo.utils import absolute_url, localized_alternates
-from core.services import related_guides, to_teaser_item
+from core.cache import add_cache_tags, cache_public_page
+from core.conditional import AsyncConditionalDetailMixin, ConditionalListMixin
+from core.pagination import KeysetPaginationMixin
+from core.routing import aresolve_by_slug
+from core.seo.utils import absolute_url, localized_alternates, object_alternates
+from core.services import attach_item_content, related_guides, to_teaser_item
 from core.views import SeoMixin
-from .models import Guide, GuideSection, GuideItem
+from .models import Guide, GuideReadingDocument
+from .reading import sections_prefetch, table_of_contents
 
 
-class GuideListView(ListView, SeoMixin):
+@method_decorator(cache_public_page(tags=[Guide]), name="dispatch")
+class GuideListView(ConditionalListMixin, KeysetPaginationMixin, ListView, SeoMixin):
     paginate_by = 20
     template_name = "guides/guide_list.html"
+    query_budget = 10
     context_object_name = "object_list"
 
     def get_queryset(self):
@@ -24,6 +32,7 @@ class GuideListView(ListView, SeoMixin):
             .exclude(translations__slug__startswith="start-guide")
             .select_related("author", "reviewed_by")
             .prefetch_related("categories__translations", "tools__translations")
+            .with_display_values(lang)
             .distinct()
             .order_by("-published_at", "-updated_at")
         )
@@ -50,39 +59,39 @@ class GuideListView(ListView, SeoMixin):
         return ctx
 
 
-class GuideDetailView(DetailView, SeoMixin):
+@method_decorator(cache_public_page(), name="get")
+class GuideDetailView(AsyncConditionalDetailMixin, DetailView, SeoMixin):
     model = Guide
     template_name = "guides/guide_detail.html"
+    query_budget = 20
     context_object_name = "object"
     slug_field = "slug"
     slug_url_kwarg = "slug"
 
-    def get_object(self, queryset=None):
-        slug = self.kwargs["slug"]
-        obj = (
-            Guide.objects
-            .filter(Q(translations__public_slug=slug) | Q(translations__slug=slug))
-            .distinct()
-            .first()
-        )
-        if obj:
-            return obj
+    async def aget_object(self):
+        obj = await aresolve_by_slug(Guide.objects.all(), self.kwargs["slug"])
+        if not obj:
+            raise Http404
+        return obj
 
-        for g in Guide.objects.all():
-            live = g.live_i18n or {}
-            for data in live.values():
-                if data.get("public_slug") == slug or data.get("slug") == slug:
-                    return g
-        raise Http404
+    def _load_sections(self, obj: Guide) -> None:
+        # published guides render from their reading document; drafts and guides in review from the ORM (preview)
+        self.reading_document = None
+        if obj.status == Guide.STATUS_PUBLISHED:
+            self.reading_document = GuideReadingDocument.objects.filter(guide=obj, language=get_language()).first()
+        if self.reading_document is None:
+            prefetch_related_objects([obj], sections_prefetch())
+            attach_item_content(item for section in obj.sections.all() for item in section.items.all())
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         obj: Guide = ctx["object"]
+        self._load_sections(obj)
         title = f"{obj.title} · MentoroAI"
         desc = (obj.intro or obj.body or obj.title)[:155]
         canonical = absolute_url(self.request.path)
         og_img = getattr(obj, "hero_image_url", None)
-        alts = localized_alternates(self.request, "guides:detail", {"slug": obj.slug})
+        alts = object_alternates(self.request, obj)
         json_ld = {
             "@context": "https://schema.org",
             "@type": "Article",
@@ -107,8 +116,14 @@ class GuideDetailView(DetailView, SeoMixin):
         ctx["display_title"] = obj.display_title
         ctx["display_intro"] = obj.display_intro
         ctx["display_body"] = obj.display_body
+        ctx["reading_document"] = self.reading_document
+        if self.reading_document:
+            ctx["toc"] = self.reading_document.toc
+        else:
+            ctx["toc"] = table_of_contents(obj.sections.all())
         rel_qs = related_guides(obj, limit=3)
         ctx["related_guides"] = [to_teaser_item(g, "guide") for g in rel_qs]
+        add_cache_tags(self.request, *rel_qs)
         ctx["crumbs"] = [
             (_("Guides"), reverse("guides:list")),
             (obj.display_title, self.request.path),
@@ -124,27 +139,7 @@ class GuideDetailView(DetailView, SeoMixin):
             .prefetch_related(
                 "categories__translations",
                 "tools__translations",
-                Prefetch(
-                    "sections",
-                    queryset=(
-                        GuideSection.objects
-                        .active_translations(lang)
-                        .order_by("order")
-                        .prefetch_related(
-                            Prefetch(
-                                "items",
-                                queryset=(
-                                    GuideItem.objects
-                                    .active_translations(lang)
-                                    .filter(is_published=True)
-                                    .order_by("order")
-                                    .distinct()
-                                )
-                            )
-                        )
-                        .distinct()
-                    )
-                )
+                sections_prefetch(),
             )
             .distinct()
         )
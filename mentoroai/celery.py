@@ -0,0 +1,10 @@
+# mentoroai/celery.py
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "mentoroai.settings")
+
+app = Celery("mentoroai")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
@@ -6,6 +6,9 @@ import json
 import logging
 from typing import Any, Dict
 
+# attributes every LogRecord has; anything else was passed via ``extra=`` and is emitted as a field
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
 
 class JsonFormatter(logging.Formatter):
     """Render log records as JSON strings.
@@ -13,7 +16,8 @@ class JsonFormatter(logging.Formatter):
     Django's default logging uses plaintext formatters which are hard to parse
     in structured log collectors. The production settings switch the console
     handler to this formatter to ensure logs contain timestamp, level and
-    message fields. Optional exception information is added when present.
+    message fields. Optional exception information is added when present, as are
+    structured fields passed via ``extra=`` (e.g. the per-request metrics).
     """
 
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401 - see class docstring
@@ -27,8 +31,11 @@ class JsonFormatter(logging.Formatter):
             "level": record.levelname,
             "message": record.getMessage(),
         }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
         if record.stack_info:
             payload["stack"] = self.formatStack(record.stack_info)
-        return json.dumps(payload, ensure_ascii=False)
+        return json.dumps(payload, ensure_ascii=False, default=str)
@@ -117,8 +117,12 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # first, so it measures the whole stack (see core.instrumentation)
+    "core.instrumentation.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # in front of sessions/CSRF/auth: serves cached anonymous pages when PAGE_CACHE_ANONYMOUS is on
+    "core.cache.AnonymousPageCacheMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -248,6 +252,9 @@ STORAGES = {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
     },
 }
+# prebuilt sitemap files (core.sitemaps) live in the shared default storage unless STORAGES has "sitemaps";
+# sections are rebuilt this many seconds after their first change, later changes ride along
+SITEMAP_REFRESH_DELAY = int(os.getenv("SITEMAP_REFRESH_DELAY", "60"))
 
 # TinyMCE Config
 
@@ -345,11 +352,25 @@ TINYMCE_DEFAULT_CONFIG = {
 # Celery (einfaches Beispiel)
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
+# periodic tasks; django_celery_beat's DatabaseScheduler copies them into its tables on start
+CELERY_BEAT_SCHEDULE = {
+    "index-due-tools": {"task": "core.tasks.index_due_tools_task", "schedule": 300.0},
+}
 
 # DRF Basis
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
+    "DEFAULT_THROTTLE_CLASSES": [
+        "rest_framework.throttling.AnonRateThrottle",
+        "rest_framework.throttling.UserRateThrottle",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": os.getenv("API_THROTTLE_ANON", "60/min"),
+        "user": os.getenv("API_THROTTLE_USER", "600/min"),
+    },
 }
+# rows per query of the NDJSON export (api.export)
+API_EXPORT_CHUNK_SIZE = int(os.getenv("API_EXPORT_CHUNK_SIZE", "500"))
 
 # --- SEO / Site Info ---
 SITE_NAME = "MentoroAI"
@@ -417,17 +438,52 @@ LOGGING = {
         "django": {
             "handlers": ["console"],
             "level": DJANGO_LOG_LEVEL,
-        }
+        },
+        "mentoroai.requests": {
+            "handlers": ["console"],
+            "level": os.getenv("DJANGO_REQUEST_LOG_LEVEL", "WARNING"),
+            "propagate": False,
+        },
     },
 }
 
+# Per-request metrics (core.instrumentation)
+SERVER_TIMING = env_bool("DJANGO_SERVER_TIMING", True)
+QUERY_BUDGET_STRICT = env_bool("DJANGO_QUERY_BUDGET_STRICT", False)
+
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
-        "LOCATION": "mentoroai_cache_table",
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("DJANGO_CACHE_URL", "redis://localhost:6379/2"),
+        "KEY_PREFIX": "mentoroai",
+        "TIMEOUT": 300,
     }
 }
 
+# Per-process LRU in front of the shared cache (core.cache.hot_cache)
+CACHE_LOCAL_MAXSIZE = int(os.getenv("DJANGO_CACHE_LOCAL_MAXSIZE", "512"))
+CACHE_LOCAL_TTL = int(os.getenv("DJANGO_CACHE_LOCAL_TTL", "5"))
+# Public list/detail pages (core.cache.cache_public_page)
+PAGE_CACHE_TIMEOUT = int(os.getenv("DJANGO_PAGE_CACHE_TIMEOUT", "300"))
+# Anonymous full-page cache mode (core.cache.AnonymousPageCacheMiddleware): cached pages skip the whole
+# middleware stack and are marked shareable (Cache-Control public/s-maxage, Surrogate-Key = cache tags)
+PAGE_CACHE_ANONYMOUS = env_bool("DJANGO_PAGE_CACHE_ANONYMOUS", False)
+PAGE_CACHE_CDN_MAX_AGE = int(os.getenv("DJANGO_PAGE_CACHE_CDN_MAX_AGE", "600"))
+PAGE_CACHE_BROWSER_MAX_AGE = int(os.getenv("DJANGO_PAGE_CACHE_BROWSER_MAX_AGE", "0"))
+# CDN purge target for surrogate keys (core.cdn); e.g. core.cdn.FastlyPurgeBackend
+SURROGATE_PURGE_BACKEND = os.getenv("DJANGO_SURROGATE_PURGE_BACKEND", "core.cdn.NullPurgeBackend")
+SURROGATE_PURGE_SERVICE_ID = os.getenv("DJANGO_SURROGATE_PURGE_SERVICE_ID", "")
+SURROGATE_PURGE_TOKEN = os.getenv("DJANGO_SURROGATE_PURGE_TOKEN", "")
+# Template fragments ({% cachefragment %}, core.templatetags.fragment_cache); purged by cache tag
+FRAGMENT_CACHE_TIMEOUT = int(os.getenv("DJANGO_FRAGMENT_CACHE_TIMEOUT", "3600"))
+# Memoized richtext sanitizer (content.sanitizer); sanitize-on-save warms it when content is saved
+RICHTEXT_CACHE_TIMEOUT = int(os.getenv("DJANGO_RICHTEXT_CACHE_TIMEOUT", str(60 * 60 * 24 * 7)))
+RICHTEXT_SANITIZE_ON_SAVE = env_bool("DJANGO_RICHTEXT_SANITIZE_ON_SAVE", False)
+# SEO checker (core.seo.checker): worker threads per run; 0 runs checks inline in the request (tests)
+SEO_CHECK_WORKERS = int(os.getenv("DJANGO_SEO_CHECK_WORKERS", "4"))
+# runs without progress for this long are marked failed (lost Celery task, recycled worker)
+SEO_CHECK_STALE_MINUTES = int(os.getenv("DJANGO_SEO_CHECK_STALE_MINUTES", "15"))
+
 # GOOGLE
 
 ENABLE_GA = False
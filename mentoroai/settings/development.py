@@ -1,5 +1,7 @@
+import os
+
 from .base import *  # noqa: F403,F401
-from .base import INSTALLED_APPS, DATABASES  # noqa: F403,F401
+from .base import INSTALLED_APPS, DATABASES, STORAGES, env_bool  # noqa: F403,F401
 
 DEBUG = True
 
@@ -17,11 +19,30 @@ INSTALLED_APPS += [
 # Rosetta
 ROSETTA_MESSAGES_PER_PAGE = 20
 
+# Local stand-in for the Redis alias; tests that exercise the cache tier
+# switch to LocMemCache via override_settings.
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
     }
 }
+CACHE_LOCAL_TTL = 0
+
+# Prebuilt sitemaps stay in memory locally; a missing file is rebuilt on request
+STORAGES = {
+    **STORAGES,
+    "sitemaps": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+}
+
+# Views exceeding their declared query budget fail test runs (DJANGO_ENV=ci/test/testing); local
+# development only logs the warning unless DJANGO_QUERY_BUDGET_STRICT is set
+QUERY_BUDGET_STRICT = env_bool(
+    "DJANGO_QUERY_BUDGET_STRICT", os.getenv("DJANGO_ENV", "").lower() in {"ci", "test", "testing"}
+)
+
+# Celery tasks run inline (no worker/broker locally and in tests); exceptions surface at the call
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
 
 # mentoroai/settings/development.py  (nur für TESTS)
 DATABASES["default"]["TEST"] = {"NAME": "test_mentoroai"}
@@ -84,6 +84,11 @@ LOGGING = {
             "level": "ERROR",
             "propagate": False,
         },
+        "mentoroai.requests": {
+            "handlers": ["console"],
+            "level": os.getenv("DJANGO_REQUEST_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
     },
     "root": {
         "handlers": ["console"],
@@ -2,37 +2,16 @@ from django.conf import settings
 from django.conf.urls.i18n import i18n_patterns
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.http import HttpResponse
 from django.urls import include, path, re_path
-from django.views.generic import TemplateView
+from django.views.generic import RedirectView, TemplateView
 from django.views.i18n import JavaScriptCatalog
 
 from accounts.views import AccountDashboardView
-from content.views.seo_check import seo_check_view
+from content.views.seo_check import seo_check_results, seo_check_view
 from content.views.uploads import tinymce_image_list, tinymce_upload
-from core.sitemaps import (
-    GuideSitemap,
-    PromptSitemap,
-    UseCaseSitemap,
-    ComparisonSitemap,
-    ToolSitemap,
-    GlossaryIndexSitemap,
-    GlossaryTermSitemap,
-    LegalSitemap,
-)
 from core.views_i18n import set_language_smart
-
-sitemaps = {
-    "guides": GuideSitemap,
-    "prompts": PromptSitemap,
-    "usecases": UseCaseSitemap,
-    "comparisons": ComparisonSitemap,
-    "tools": ToolSitemap,
-    "glossary-index": GlossaryIndexSitemap,
-    "glossary-terms": GlossaryTermSitemap,
-    "legal": LegalSitemap,
-}
+from core.views_sitemaps import sitemap_index, sitemap_section
 
 urlpatterns = [
     path("i18n/setlang/", set_language_smart, name="set_language"),
@@ -44,7 +23,11 @@ urlpatterns = [
     path("admin/tinymce/image-list/", tinymce_image_list, name="tinymce_image_list"),
     path("admin/", admin.site.urls),
     path("ops/seo-check/", seo_check_view, name="ops_seo_check"),
+    path("ops/seo-check/<int:run_id>/results/", seo_check_results, name="ops_seo_check_results"),
+    path("api/", include("api.urls")),
     path("health/", lambda request: HttpResponse("OK"), name="healthcheck"),
+    path("sitemap.xml", sitemap_index, name="sitemap"),
+    path("sitemaps/<str:language>/<slug:section>-<int:page>.xml", sitemap_section, name="sitemap_section"),
     path("robots.txt", TemplateView.as_view(template_name="robots.txt", content_type="text/plain", ),
          name="robots", ),
 ]
@@ -61,9 +44,9 @@ urlpatterns += i18n_patterns(
     path("newsletter/", include("newsletter.urls")),
     path("account/dashboard/", AccountDashboardView.as_view(), name="account_dashboard"),
 
-    # path("api/", include("api.urls")),
     path("legal/", include("content.urls_legal")),
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="sitemap", ),
+    # the sitemap used to be served per language
+    path("sitemap.xml", RedirectView.as_view(pattern_name="sitemap", permanent=True), name="sitemap_legacy"),
 )
 
 if "rosetta" in settings.INSTALLED_APPS:
@@ -12,6 +12,7 @@ from parler.utils.context import switch_language
 
 from core.admin import TranslatableTinyMCEMixin, set_last_published_revision
 from core.services import get_live_display_instance, build_field_diffs
+from core.workflow import bulk_transition
 from .models import Prompt
 
 
@@ -133,21 +134,8 @@ class PromptAdmin(TranslatableTinyMCEMixin):
 
     @admin.action(description=_("Submit for Review"))
     def action_submit_for_review(self, request, queryset):
-        moved, skipped = 0, []
-        with transaction.atomic():
-            with reversion.create_revision():
-                reversion.set_user(request.user)
-                reversion.set_comment("Admin-Action: submit_for_review")
-                for obj in queryset.select_for_update():
-                    if hasattr(obj, "move_to_review") and can_proceed(obj.move_to_review):
-                        try:
-                            obj.move_to_review(by=request.user, note="Admin-Action: submit_for_review")
-                        except TypeError:
-                            obj.move_to_review()
-                        obj.save()
-                        moved += 1
-                    else:
-                        skipped.append((obj.pk, "Transition 'move_to_review' not possible"))
+        result = bulk_transition(queryset, "move_to_review", by=request.user, note="Admin-Action: submit_for_review")
+        moved, skipped = len(result.done), result.skipped
         if moved:
             self.message_user(request, _("%d Article(s) set for review.") % moved, level=messages.SUCCESS)
         if skipped:
@@ -179,25 +167,10 @@ class PromptAdmin(TranslatableTinyMCEMixin):
 
     @admin.action(description=_("Publish"))
     def action_publish(self, request, queryset):
-        published, skipped = 0, []
-        with transaction.atomic():
-            with reversion.create_revision():
-                reversion.set_user(request.user)
-                reversion.set_comment("Admin-Action: publish")
-                for obj in queryset.select_for_update():
-                    if getattr(obj, "status", None) == getattr(obj, "STATUS_PUBLISHED", "published"):
-                        continue
-                    if hasattr(obj, "publish") and can_proceed(obj.publish):
-                        try:
-                            obj.publish(by=request.user, note="Admin-Action publish")
-                            obj.save()
-                            set_last_published_revision(obj)
-                            obj.save(update_fields=["last_published_revision_id"])
-                            published += 1
-                        except Exception as e:
-                            skipped.append((obj.pk, str(e)))
-                    else:
-                        skipped.append((obj.pk, "Transition 'publish' not possible"))
+        result = bulk_transition(
+            queryset.exclude(status=Prompt.STATUS_PUBLISHED), "publish", by=request.user, note="Admin-Action publish"
+        )
+        published, skipped = len(result.done), result.skipped
         if published:
             self.message_user(request, _(f"{published} Item(s) published."), level=messages.SUCCESS)
         if skipped:
@@ -206,18 +179,8 @@ class PromptAdmin(TranslatableTinyMCEMixin):
 
     @admin.action(description=_("Archive (Soft-Delete)"))
     def action_archive(self, request, queryset):
-        ok, skipped = 0, []
-        with reversion.create_revision():
-            for obj in queryset:
-                if hasattr(obj, "archive") and can_proceed(obj.archive):
-                    try:
-                        obj.archive(by=request.user, note="Admin-Action: archive")
-                    except TypeError:
-                        obj.archive(by=request.user)
-                    obj.save()
-                    ok += 1
-                else:
-                    skipped.append(obj.pk)
+        result = bulk_transition(queryset, "archive", by=request.user, note="Admin-Action: archive")
+        ok, skipped = len(result.done), [pk for pk, _reason in result.skipped]
         if ok:
             self.message_user(request, _("%d Article(s) archived.") % ok, level=messages.SUCCESS)
         if skipped:
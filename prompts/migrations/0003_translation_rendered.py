@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('prompts', '0002_remove_prompt_reviewer_alter_prompt_author_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='prompttranslation',
+            name='rendered',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Rendered richtext'),
+        ),
+    ]
@@ -7,14 +7,16 @@ from parler.utils.context import switch_language
 from taggit.managers import TaggableManager
 
 from catalog.models import Tool
+from content.rendering import rendered
 from core.models.editorial import (
     EditorialMixin,
     EditorialWorkflowMixin,
 )
+from core.urlbuilder import cached_url
 
 
 class Prompt(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
-    LIVE_SNAPSHOT_FIELDS = ("slug", "public_slug", "title", "intro", "body", "outro")
+    LIVE_SNAPSHOT_FIELDS = ("slug", "public_slug", "title", "intro", "body", "outro", "rendered")
     live_i18n = models.JSONField(default=dict, blank=True)
     translations = TranslatedFields(
         title=models.CharField(_("Title"), max_length=200),
@@ -23,6 +25,7 @@ class Prompt(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
         outro=models.TextField(_("Outro"), blank=True),
         slug=models.SlugField(_("Slug"), max_length=220, unique=True),
         public_slug=models.SlugField(_("Public slug"), max_length=220, unique=True, null=True, blank=True),
+        rendered=models.JSONField(_("Rendered richtext"), default=dict, blank=True, editable=False),
     )
     tools = models.ManyToManyField(Tool, related_name="prompts", blank=True)
     tags = TaggableManager(blank=True)
@@ -44,6 +47,7 @@ class Prompt(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
                 "intro": get("intro"),
                 "body": get("body"),
                 "outro": get("outro"),
+                "rendered": get("rendered"),
             }
 
     def get_live_value(self, field: str, language: str | None = None):
@@ -51,10 +55,13 @@ class Prompt(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
         return (self.live_i18n or {}).get(lang, {}).get(field)
 
     def get_display_value(self, field: str, language: str | None = None):
-        val = self.get_live_value(field, language)
+        lang = language or get_language()
+        cached = self.cached_display_values(lang)
+        if cached is not None:
+            return cached.get(field)
+        val = self.get_live_value(field, lang)
         if val:
             return val
-        lang = language or get_language()
         return self._current_values_for(lang).get(field)
 
     @property
@@ -73,8 +80,23 @@ class Prompt(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
     def display_outro(self):
         return self.get_display_value("outro")
 
+    @property
+    def rendered_intro(self) -> dict:
+        return rendered(self, "intro")
+
+    @property
+    def rendered_body(self) -> dict:
+        return rendered(self, "body")
+
+    @property
+    def rendered_outro(self) -> dict:
+        return rendered(self, "outro")
+
     def get_absolute_url(self, language: str | None = None):
         lang = language or get_language()
+        cached = cached_url(self, lang)
+        if cached:
+            return cached
         live_slug = self.get_live_value("public_slug", lang) or self.get_live_value("slug", lang)
         if live_slug:
             return reverse("prompts:detail", kwargs={"slug": live_slug})
@@ -1,46 +1,37 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, Http404
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _, get_language
 from django.views.generic import DetailView, ListView
 
-from core.seo.utils import absolute_url, localized_alternates
+from catalog.models import Tool
+from core.cache import add_cache_tags, cache_public_page
+from core.conditional import AsyncConditionalDetailMixin, ConditionalListMixin
+from core.pagination import KeysetPaginationMixin
+from core.routing import aresolve_by_slug
+from core.seo.utils import absolute_url, localized_alternates, object_alternates
 from core.services import to_teaser_item, related_prompts
 from core.views import SeoMixin
 from .models import Prompt
 
 
-def _resolve_by_slug(qs: QuerySet[Prompt], slug: str) -> Optional[Prompt]:
-    obj = (
-        qs.filter(Q(translations__public_slug=slug) | Q(translations__slug=slug))
-        .distinct()
-        .first()
-    )
-    if obj:
-        return obj
-
-    live_keysets = (p for p in qs)
-    for p in live_keysets:
-        live = getattr(p, "live_i18n", None) or {}
-        for data in live.values():
-            if data.get("public_slug") == slug or data.get("slug") == slug:
-                return p
-    return None
-
-
-class PromptListView(ListView, SeoMixin):
+@method_decorator(cache_public_page(tags=[Prompt]), name="dispatch")
+class PromptListView(ConditionalListMixin, KeysetPaginationMixin, ListView, SeoMixin):
     model = Prompt
     template_name = "prompts/prompt_list.html"
     context_object_name = "object_list"
     paginate_by = 20
+    query_budget = 10
 
     def get_queryset(self) -> QuerySet[Prompt]:
         qs = (
             Prompt.objects
             .visible_on_site()
             .select_related("author", "reviewed_by")
+            .with_display_values(get_language())
         )
         if not qs.ordered:
             qs = qs.order_by("-published_at", "-updated_at")
@@ -70,20 +61,22 @@ class PromptListView(ListView, SeoMixin):
         return ctx
 
 
-class PromptDetailView(DetailView, SeoMixin):
+@method_decorator(cache_public_page(), name="get")
+class PromptDetailView(AsyncConditionalDetailMixin, DetailView, SeoMixin):
     model = Prompt
     template_name = "prompts/prompt_detail.html"
+    query_budget = 20
     context_object_name = "object"
+    related_models = (Tool,)
 
     def get_queryset(self) -> QuerySet[Prompt]:
         return Prompt.objects.all().select_related("author", "reviewed_by")
 
-    def get_object(self, queryset: Optional[QuerySet[Prompt]] = None) -> Prompt:
+    async def aget_object(self) -> Prompt:
         slug = self.kwargs.get("slug")
         if not slug:
             raise Http404("Missing slug.")
-        qs = queryset or self.get_queryset()
-        obj = _resolve_by_slug(qs, slug)
+        obj = await aresolve_by_slug(self.get_queryset(), slug)
         if not obj:
             raise Http404("Prompt not found.")
         return obj
@@ -95,7 +88,7 @@ class PromptDetailView(DetailView, SeoMixin):
         desc = (obj.intro or obj.body or obj.title)[:155]
         canonical = absolute_url(self.request.path)
         og_img = getattr(obj, "hero_image_url", None)
-        alts = localized_alternates(self.request, "prompts:detail", {"slug": obj.slug})
+        alts = object_alternates(self.request, obj)
         json_ld = {
             "@context": "https://schema.org",
             "@type": "Article",
@@ -124,6 +117,7 @@ class PromptDetailView(DetailView, SeoMixin):
 
         rel_qs = related_prompts(obj, limit=3)
         ctx["more"] = [to_teaser_item(p, "prompt") for p in rel_qs]
+        add_cache_tags(self.request, *rel_qs)
 
         ctx["crumbs"] = [
             (_("Prompts"), reverse("prompts:list")),
@@ -136,5 +130,5 @@ def prompt_list(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse
     return PromptListView.as_view()(request, *args, **kwargs)
 
 
-def prompt_detail(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-    return PromptDetailView.as_view()(request, *args, **kwargs)
+async def prompt_detail(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+    return await PromptDetailView.as_view()(request, *args, **kwargs)
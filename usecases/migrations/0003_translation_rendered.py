@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('usecases', '0002_remove_usecase_reviewer_alter_usecase_author_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usecasetranslation',
+            name='rendered',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Rendered richtext'),
+        ),
+    ]
@@ -6,15 +6,17 @@ from parler.models import TranslatableModel, TranslatedFields
 from parler.utils.context import switch_language
 
 from catalog.models import Tool
+from content.rendering import rendered
 from core.models.editorial import (
     EditorialMixin,
     EditorialManager,
     PublishedOnlyManager, EditorialWorkflowMixin,
 )
+from core.urlbuilder import cached_url
 
 
 class UseCase(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
-    LIVE_SNAPSHOT_FIELDS = ("slug", "public_slug", "title", "intro", "body", "outro")
+    LIVE_SNAPSHOT_FIELDS = ("slug", "public_slug", "title", "intro", "body", "outro", "rendered")
     live_i18n = models.JSONField(default=dict, blank=True)
     translations = TranslatedFields(
         title=models.CharField(_("Title"), max_length=200),
@@ -24,6 +26,7 @@ class UseCase(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
         slug=models.SlugField(_("Slug"), max_length=220, unique=True),
         public_slug=models.SlugField(_("Public slug"), max_length=220, unique=True, null=True, blank=True),
         persona=models.CharField(_("Persona"), max_length=100),
+        rendered=models.JSONField(_("Rendered richtext"), default=dict, blank=True, editable=False),
     )
 
     tools = models.ManyToManyField(Tool, related_name="usecases", blank=True)
@@ -53,11 +56,15 @@ class UseCase(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
                 "intro": get("intro"),
                 "body": get("body"),
                 "outro": get("outro"),
+                "rendered": get("rendered"),
                 "persona": get("persona"),
             }
 
     def get_display_value(self, field: str, language: str | None = None):
         lang = language or get_language()
+        cached = self.cached_display_values(lang)
+        if cached is not None:
+            return cached.get(field)
         val = self.get_live_value(field, lang)
         if val:
             return val
@@ -83,6 +90,18 @@ class UseCase(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
     def display_persona(self):
         return self.get_display_value("persona")
 
+    @property
+    def rendered_intro(self) -> dict:
+        return rendered(self, "intro")
+
+    @property
+    def rendered_body(self) -> dict:
+        return rendered(self, "body")
+
+    @property
+    def rendered_outro(self) -> dict:
+        return rendered(self, "outro")
+
     def on_after_publish(self):
         self.is_published = True
         if not self.published_at:
@@ -104,6 +123,9 @@ class UseCase(EditorialMixin, TranslatableModel, EditorialWorkflowMixin):
 
     def get_absolute_url(self, language: str | None = None):
         lang = language or get_language()
+        cached = cached_url(self, lang)
+        if cached:
+            return cached
         live = (self.live_i18n or {}).get(lang or "", {})
         slug = live.get("public_slug") or live.get("slug")
         if not slug:
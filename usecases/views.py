@@ -1,38 +1,29 @@
 # usecases/views.py
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 from django.http import Http404
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _, get_language
 from django.views.generic import ListView, DetailView
 
-from core.seo.utils import absolute_url, localized_alternates
+from catalog.models import Tool
+from core.cache import add_cache_tags, cache_public_page
+from core.conditional import AsyncConditionalDetailMixin, ConditionalListMixin
+from core.pagination import KeysetPaginationMixin
+from core.routing import aresolve_by_slug
+from core.seo.utils import absolute_url, localized_alternates, object_alternates
 from core.services import related_usecases, to_teaser_item
 from core.views import SeoMixin
 from .models import UseCase
 
 
-def _resolve_by_slug(qs: QuerySet[UseCase], slug: str) -> Optional[UseCase]:
-    obj = (
-        qs.filter(Q(translations__public_slug=slug) | Q(translations__slug=slug))
-        .distinct()
-        .first()
-    )
-    if obj:
-        return obj
-
-    for u in qs:
-        live = (u.live_i18n or {})
-        for data in live.values():
-            if data.get("public_slug") == slug or data.get("slug") == slug:
-                return u
-    return None
-
-
-class UseCaseListView(ListView, SeoMixin):
+@method_decorator(cache_public_page(tags=[UseCase]), name="dispatch")
+class UseCaseListView(ConditionalListMixin, KeysetPaginationMixin, ListView, SeoMixin):
     paginate_by = 12
     template_name = "usecases/list.html"
+    query_budget = 10
     context_object_name = "object_list"
 
     def get_queryset(self) -> QuerySet[UseCase]:
@@ -42,6 +33,7 @@ class UseCaseListView(ListView, SeoMixin):
             .active_translations(lang)
             .select_related("author", "reviewed_by")
             .prefetch_related("tools")
+            .with_display_values(lang)
             .distinct()
             .order_by("-published_at", "-updated_at")
         )
@@ -68,20 +60,22 @@ class UseCaseListView(ListView, SeoMixin):
         return ctx
 
 
-class UseCaseDetailView(DetailView, SeoMixin):
+@method_decorator(cache_public_page(), name="get")
+class UseCaseDetailView(AsyncConditionalDetailMixin, DetailView, SeoMixin):
     model = UseCase
     template_name = "usecases/detail.html"
+    query_budget = 20
     context_object_name = "object"
+    related_models = (Tool,)
 
     def get_queryset(self) -> QuerySet[UseCase]:
         return UseCase.objects.all().select_related("author", "reviewed_by").prefetch_related("tools")
 
-    def get_object(self, queryset: Optional[QuerySet[UseCase]] = None) -> UseCase:
+    async def aget_object(self) -> UseCase:
         slug = self.kwargs.get("slug")
         if not slug:
             raise Http404("Missing slug.")
-        qs = queryset or self.get_queryset()
-        obj = _resolve_by_slug(qs, slug)
+        obj = await aresolve_by_slug(self.get_queryset(), slug)
         if not obj:
             raise Http404("UseCase not found.")
         return obj
@@ -93,7 +87,7 @@ class UseCaseDetailView(DetailView, SeoMixin):
         desc = (obj.intro or obj.body or obj.title)[:155]
         canonical = absolute_url(self.request.path)
         og_img = getattr(obj, "hero_image_url", None)
-        alts = localized_alternates(self.request, "usecases:detail", {"slug": obj.slug})
+        alts = object_alternates(self.request, obj)
         json_ld = {
             "@context": "https://schema.org",
             "@type": "Article",
@@ -122,6 +116,7 @@ class UseCaseDetailView(DetailView, SeoMixin):
         ctx.setdefault("display_persona", obj.display_persona)
         rel_qs = related_usecases(obj, limit=3)
         ctx["similar"] = [to_teaser_item(u, "usecase") for u in rel_qs]
+        add_cache_tags(self.request, *rel_qs)
         ctx["crumbs"] = [
             (_("Usecases"), reverse("usecases:list")),
             (obj.display_title or _("Usecase"), self.request.path),